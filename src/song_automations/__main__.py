@@ -0,0 +1,22 @@
+"""Console entry point for song-automations."""
+
+import sys
+
+from song_automations import __version__
+
+VERSION_FLAGS = (["--version"], ["-v"])
+
+
+def main() -> None:
+    """Run the CLI, answering ``--version`` without importing typer."""
+    if sys.argv[1:] in VERSION_FLAGS:
+        print(f"song-automations version {__version__}")
+        return
+
+    from song_automations.cli import app
+
+    app(prog_name="song-automations")
+
+
+if __name__ == "__main__":
+    main()
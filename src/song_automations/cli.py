@@ -1,20 +1,24 @@
 """Command-line interface for song-automations."""
 
-from typing import Annotated
+import csv
+import sys
+from functools import cache
+from itertools import islice
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from song_automations import __version__
-from song_automations.clients.discogs import DiscogsClient
-from song_automations.clients.soundcloud import SoundCloudClient
-from song_automations.clients.spotify import SpotifyClient
-from song_automations.config import Settings, get_settings
-from song_automations.logging import setup_logging
-from song_automations.reports.missing import generate_missing_report
-from song_automations.state.tracker import StateTracker
-from song_automations.sync.engine import OperationType, SyncEngine, SyncResult
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from rich.console import Console
+
+    from song_automations.clients.discogs import DiscogsClient
+    from song_automations.config import Settings
+    from song_automations.state.tracker import StateTracker
+    from song_automations.sync.engine import OperationType, SyncEngine, SyncOperation, SyncResult
 
 app = typer.Typer(
     name="song-automations",
@@ -26,21 +30,96 @@ report_app = typer.Typer(help="Generate reports.")
 app.add_typer(sync_app, name="sync")
 app.add_typer(report_app, name="report")
 
-console = Console()
+MAX_OPERATION_ROWS = 50
+TRACK_LABEL_WIDTH = 50
+STATUS_REVIEW = "[yellow]Review[/yellow]"
+STATUS_OK = "[green]OK[/green]"
+ERR_DISCOGS_TOKEN = "[red]Error:[/red] DISCOGS_USER_TOKEN not set in environment."
+ERR_SPOTIFY_CREDENTIALS = "[red]Error:[/red] SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET not set."
+ERR_SOUNDCLOUD_CREDENTIALS = (
+    "[red]Error:[/red] SOUNDCLOUD_CLIENT_ID and SOUNDCLOUD_CLIENT_SECRET not set."
+)
+DRY_RUN_NOTICE = "[yellow]DRY RUN - No changes will be made[/yellow]\n"
+NO_SYNC_DATA = "[yellow]No sync data found. Run a sync first.[/yellow]"
+MISSING_ZERO = "[red]0[/red]"
+FLAGGED_ZERO = "[yellow]0[/yellow]"
+
+_console_instance: "Console | None" = None
+_stderr_console_instance: "Console | None" = None
+_initialized = False
+_logging_configured = False
+
+
+def _console() -> "Console":
+    """Get the shared rich console, importing rich on first use.
+
+    Returns:
+        The process-wide Console instance.
+    """
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+def _notice_console() -> "Console":
+    """Get the console for status lines of commands that print results.
+
+    On a terminal this is the shared console. When stdout is piped the
+    notices go to stderr instead, so stdout carries only the TSV result.
+
+    Returns:
+        Console to print progress and status messages on.
+    """
+    global _stderr_console_instance
+    if sys.stdout.isatty():
+        return _console()
+    if _stderr_console_instance is None:
+        from rich.console import Console
+
+        _stderr_console_instance = Console(stderr=True)
+    return _stderr_console_instance
 
 
-def _init_settings(min_confidence: float | None = None) -> Settings:
+def __getattr__(name: str):
+    """Resolve ``console`` lazily so importing this module stays rich-free."""
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _init_settings(
+    min_confidence: float | None = None,
+    setup_logs: bool = True,
+) -> "Settings":
     """Initialize settings with optional overrides.
 
+    Directory creation and logging setup run once per process; the
+    settings instance is cached, so overrides apply to it in place.
+
     Args:
         min_confidence: Optional confidence threshold override.
+        setup_logs: Whether to configure application logging. Commands that
+            never log skip opening the log file.
 
     Returns:
         Configured Settings instance.
     """
+    global _initialized, _logging_configured
+    from song_automations.config import get_settings
+
     settings = get_settings()
-    settings.ensure_directories()
-    setup_logging(level=settings.log_level, log_file=settings.log_path)
+    if not _initialized:
+        settings.ensure_directories()
+        _initialized = True
+
+    if setup_logs and not _logging_configured:
+        from song_automations.logging import setup_logging
+
+        setup_logging(level=settings.log_level, log_file=settings.log_path)
+        _logging_configured = True
 
     if min_confidence is not None:
         settings.min_confidence = min_confidence
@@ -48,15 +127,72 @@ def _init_settings(min_confidence: float | None = None) -> Settings:
     return settings
 
 
+def _parse_folders(folders: str | None) -> list[str] | None:
+    """Split a comma-separated --folders value into folder names.
+
+    Args:
+        folders: Raw option value.
+
+    Returns:
+        List of stripped folder names, or None if no filter was given.
+    """
+    return list(map(str.strip, folders.split(","))) if folders else None
+
+
+def _check_credentials(settings: "Settings", platform: str) -> None:
+    """Exit with an error if credentials for a sync are missing.
+
+    Args:
+        settings: Application settings.
+        platform: Target platform (spotify or soundcloud).
+
+    Raises:
+        typer.Exit: If the Discogs token or platform credentials are not set.
+    """
+    if not settings.discogs_user_token:
+        _notice_console().print(ERR_DISCOGS_TOKEN)
+        raise typer.Exit(1)
+
+    if platform == "spotify":
+        if not settings.spotify_client_id or not settings.spotify_client_secret:
+            _notice_console().print(ERR_SPOTIFY_CREDENTIALS)
+            raise typer.Exit(1)
+    elif not settings.soundcloud_client_id or not settings.soundcloud_client_secret:
+        _notice_console().print(ERR_SOUNDCLOUD_CREDENTIALS)
+        raise typer.Exit(1)
+
+
+def _build_context(
+    settings: "Settings",
+) -> tuple["DiscogsClient", "StateTracker", "SyncEngine"]:
+    """Create the Discogs client, state tracker and sync engine.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Tuple of (DiscogsClient, StateTracker, SyncEngine).
+    """
+    from song_automations.clients.discogs import DiscogsClient
+    from song_automations.state.tracker import StateTracker
+    from song_automations.sync.engine import SyncEngine
+
+    discogs_client = DiscogsClient(settings)
+    state_tracker = StateTracker(settings.db_path)
+    engine = SyncEngine(settings, discogs_client, state_tracker, _notice_console())
+    return discogs_client, state_tracker, engine
+
+
 def _run_sync(
-    settings: Settings,
+    settings: "Settings",
     platform: str,
     folder_names: list[str] | None,
     exclude_wantlist: bool,
     dry_run: bool,
     force_rematch: bool = False,
     force_rematch_all: bool = False,
-) -> SyncResult:
+    context: tuple["DiscogsClient", "StateTracker", "SyncEngine"] | None = None,
+) -> "SyncResult":
     """Execute sync for a platform.
 
     Args:
@@ -67,23 +203,23 @@ def _run_sync(
         dry_run: If True, don't make changes.
         force_rematch: If True, clear unreviewed match cache before syncing.
         force_rematch_all: If True, clear ALL matches including reviewed ones.
+        context: Optional shared context from _build_context.
 
     Returns:
         SyncResult with operation details.
     """
-    discogs_client = DiscogsClient(settings)
-    state_tracker = StateTracker(settings.db_path)
+    _, state_tracker, engine = context or _build_context(settings)
 
     if force_rematch_all:
         count = state_tracker.clear_matched_tracks(platform, preserve_reviewed=False)
-        console.print(f"[yellow]Cleared ALL {count} cached matches for {platform} (including reviewed)[/yellow]\n")
+        _notice_console().print(f"[yellow]Cleared ALL {count} cached matches for {platform} (including reviewed)[/yellow]\n")
     elif force_rematch:
         count = state_tracker.clear_matched_tracks(platform, preserve_reviewed=True)
-        console.print(f"[yellow]Cleared {count} unreviewed matches for {platform} (reviewed tracks preserved)[/yellow]\n")
-
-    engine = SyncEngine(settings, discogs_client, state_tracker, console)
+        _notice_console().print(f"[yellow]Cleared {count} unreviewed matches for {platform} (reviewed tracks preserved)[/yellow]\n")
 
     if platform == "spotify":
+        from song_automations.clients.spotify import SpotifyClient
+
         client = SpotifyClient(settings)
         return engine.sync_to_spotify(
             playlist_client=client,
@@ -92,6 +228,8 @@ def _run_sync(
             dry_run=dry_run,
         )
     else:
+        from song_automations.clients.soundcloud import SoundCloudClient
+
         client = SoundCloudClient(settings)
         return engine.sync_to_soundcloud(
             playlist_client=client,
@@ -104,7 +242,7 @@ def _run_sync(
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(f"song-automations version {__version__}")
+        print(f"song-automations version {__version__}")
         raise typer.Exit()
 
 
@@ -174,25 +312,16 @@ def sync_spotify(
 ) -> None:
     """Sync Discogs folders to Spotify playlists."""
     settings = _init_settings(min_confidence)
+    _check_credentials(settings, "spotify")
 
-    if not settings.discogs_user_token:
-        console.print("[red]Error:[/red] DISCOGS_USER_TOKEN not set in environment.")
-        raise typer.Exit(1)
-
-    if not settings.spotify_client_id or not settings.spotify_client_secret:
-        console.print(
-            "[red]Error:[/red] SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET not set."
-        )
-        raise typer.Exit(1)
+    folder_names = _parse_folders(folders)
 
-    folder_names = [f.strip() for f in folders.split(",")] if folders else None
-
-    console.print("[bold]Syncing to Spotify...[/bold]")
+    _notice_console().print("[bold]Syncing to Spotify...[/bold]")
     if dry_run:
-        console.print("[yellow]DRY RUN - No changes will be made[/yellow]\n")
+        _notice_console().print(DRY_RUN_NOTICE)
 
     result = _run_sync(settings, "spotify", folder_names, exclude_wantlist, dry_run, force_rematch, force_rematch_all)
-    _print_sync_result(result, dry_run)
+    _print_sync_result(result, dry_run, "spotify")
 
 
 @sync_app.command("soundcloud")
@@ -244,25 +373,16 @@ def sync_soundcloud(
 ) -> None:
     """Sync Discogs folders to SoundCloud playlists."""
     settings = _init_settings(min_confidence)
+    _check_credentials(settings, "soundcloud")
 
-    if not settings.discogs_user_token:
-        console.print("[red]Error:[/red] DISCOGS_USER_TOKEN not set in environment.")
-        raise typer.Exit(1)
+    folder_names = _parse_folders(folders)
 
-    if not settings.soundcloud_client_id or not settings.soundcloud_client_secret:
-        console.print(
-            "[red]Error:[/red] SOUNDCLOUD_CLIENT_ID and SOUNDCLOUD_CLIENT_SECRET not set."
-        )
-        raise typer.Exit(1)
-
-    folder_names = [f.strip() for f in folders.split(",")] if folders else None
-
-    console.print("[bold]Syncing to SoundCloud...[/bold]")
+    _notice_console().print("[bold]Syncing to SoundCloud...[/bold]")
     if dry_run:
-        console.print("[yellow]DRY RUN - No changes will be made[/yellow]\n")
+        _notice_console().print(DRY_RUN_NOTICE)
 
     result = _run_sync(settings, "soundcloud", folder_names, exclude_wantlist, dry_run, force_rematch, force_rematch_all)
-    _print_sync_result(result, dry_run)
+    _print_sync_result(result, dry_run, "soundcloud")
 
 
 @sync_app.command("all")
@@ -306,39 +426,79 @@ def sync_all(
     ] = False,
 ) -> None:
     """Sync Discogs folders to both Spotify and SoundCloud."""
-    console.print("[bold]Syncing to all platforms...[/bold]\n")
-
-    console.print("[bold cyan]--- Spotify ---[/bold cyan]")
-    sync_spotify(
-        folders=folders,
-        exclude_wantlist=exclude_wantlist,
-        dry_run=dry_run,
-        min_confidence=None,
-        force_rematch=force_rematch,
-        force_rematch_all=force_rematch_all,
-    )
-
-    console.print("\n[bold cyan]--- SoundCloud ---[/bold cyan]")
-    sync_soundcloud(
-        folders=folders,
-        exclude_wantlist=exclude_wantlist,
-        dry_run=dry_run,
-        min_confidence=None,
-        force_rematch=force_rematch,
-        force_rematch_all=force_rematch_all,
-    )
+    settings = _init_settings()
+    folder_names = _parse_folders(folders)
+    context = None
+    results: list[tuple[str, SyncResult]] = []
+
+    _notice_console().print("[bold]Syncing to all platforms...[/bold]\n")
+
+    platforms = (("spotify", "Spotify"), ("soundcloud", "SoundCloud"))
+    for platform, _ in platforms:
+        _check_credentials(settings, platform)
+
+    # Piped output is one table, printed even if a later platform fails so
+    # changes already made are still reported.
+    try:
+        for index, (platform, label) in enumerate(platforms):
+            separator = "\n" if index else ""
+            _notice_console().print(f"{separator}[bold cyan]--- {label} ---[/bold cyan]")
+            if context is None:
+                context = _build_context(settings)
+
+            _notice_console().print(f"[bold]Syncing to {label}...[/bold]")
+            if dry_run:
+                _notice_console().print(DRY_RUN_NOTICE)
+
+            result = _run_sync(
+                settings,
+                platform,
+                folder_names,
+                exclude_wantlist,
+                dry_run,
+                force_rematch,
+                force_rematch_all,
+                context=context,
+            )
+            results.append((platform, result))
+            if sys.stdout.isatty():
+                _print_sync_result(result, dry_run, platform)
+    finally:
+        if results and not sys.stdout.isatty():
+            _print_plain(results)
 
 
 @app.command("status")
 def status() -> None:
     """Show current folder-to-playlist mappings."""
+    from rich.table import Table
+
+    from song_automations.config import get_settings
+    from song_automations.state.tracker import StateTracker
+
     settings = get_settings()
 
     if not settings.db_path.exists():
-        console.print("[yellow]No sync data found. Run a sync first.[/yellow]")
+        _console().print(NO_SYNC_DATA)
         return
 
     state_tracker = StateTracker(settings.db_path)
+    mappings = state_tracker.get_all_folder_mappings_multi(["spotify", "soundcloud"])
+
+    if not sys.stdout.isatty():
+        _write_tsv(
+            ("folder", "platform", "playlist", "created"),
+            (
+                (
+                    m.discogs_folder_name,
+                    m.destination,
+                    m.playlist_name,
+                    m.created_at.isoformat(timespec="minutes"),
+                )
+                for m in mappings
+            ),
+        )
+        return
 
     table = Table(title="Folder Mappings")
     table.add_column("Folder", style="cyan")
@@ -346,20 +506,18 @@ def status() -> None:
     table.add_column("Playlist", style="green")
     table.add_column("Created", style="dim")
 
-    for dest in ["spotify", "soundcloud"]:
-        mappings = state_tracker.get_all_folder_mappings(dest)
-        for mapping in mappings:
-            table.add_row(
-                mapping.discogs_folder_name,
-                dest.capitalize(),
-                mapping.playlist_name,
-                mapping.created_at.strftime("%Y-%m-%d %H:%M"),
-            )
+    for mapping in mappings:
+        table.add_row(
+            mapping.discogs_folder_name,
+            mapping.destination.capitalize(),
+            mapping.playlist_name,
+            mapping.created_at.strftime("%Y-%m-%d %H:%M"),
+        )
 
     if table.row_count == 0:
-        console.print("[yellow]No folder mappings found. Run a sync first.[/yellow]")
+        _console().print("[yellow]No folder mappings found. Run a sync first.[/yellow]")
     else:
-        console.print(table)
+        _console().print(table)
 
 
 @report_app.command("missing")
@@ -369,7 +527,7 @@ def report_missing(
         typer.Option(
             "--format",
             "-f",
-            help="Output format: csv or json.",
+            help="Output format: csv, json, or both as csv,json.",
         ),
     ] = "csv",
     destination: Annotated[
@@ -390,39 +548,182 @@ def report_missing(
     ] = None,
 ) -> None:
     """Generate a report of tracks that couldn't be found."""
+    from song_automations.config import get_settings
+    from song_automations.reports.missing import generate_missing_reports
+    from song_automations.state.tracker import StateTracker
+
     settings = get_settings()
 
     if not settings.db_path.exists():
-        console.print("[yellow]No sync data found. Run a sync first.[/yellow]")
+        _console().print(NO_SYNC_DATA)
         return
 
     state_tracker = StateTracker(settings.db_path)
     dest = destination if destination in ("spotify", "soundcloud") else None
 
-    output_path = generate_missing_report(
-        state_tracker=state_tracker,
-        settings=settings,
-        format=format,
-        destination=dest,
-        output_path=output,
+    try:
+        report_paths = generate_missing_reports(
+            state_tracker=state_tracker,
+            settings=settings,
+            formats=[f.strip() for f in format.split(",") if f.strip()],
+            destinations=[dest],
+            output_path=output,
+        )
+    except ValueError as e:
+        _console().print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
+
+    for report_path in report_paths:
+        _console().print(f"[green]Report generated:[/green] {report_path}")
+    if not report_paths:
+        _console().print("[yellow]No missing tracks to report.[/yellow]")
+
+
+def _write_tsv(header: tuple[str, ...], rows: "Iterable[tuple]") -> None:
+    """Write rows as tab-separated values straight to stdout.
+
+    Used instead of rich tables when output is piped or redirected, so
+    scripts get parseable text without terminal measurement or markup.
+
+    Args:
+        header: Column names written as the first line.
+        rows: Row tuples to write.
+    """
+    writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+
+
+def _print_plain(results: "list[tuple[str, SyncResult]]") -> None:
+    """Print sync results as TSV for non-interactive output.
+
+    Writes one operations table covering every destination (no row
+    limit), then a blank line and a summary table with one row of counts
+    per destination.
+
+    Args:
+        results: (destination, SyncResult) pairs in the order they ran.
+    """
+    _write_tsv(
+        ("destination", "type", "folder", "playlist", "artist", "title", "confidence", "flagged"),
+        (
+            (
+                destination,
+                op.operation_type.value,
+                op.folder_name,
+                op.playlist_name,
+                op.track_artist,
+                op.track_title,
+                f"{op.confidence:.2f}",
+                int(op.flagged),
+            )
+            for destination, result in results
+            for op in result.operations
+        ),
+    )
+    sys.stdout.write("\n")
+    _write_tsv(
+        (
+            "destination",
+            "playlists_created",
+            "playlists_deleted",
+            "tracks_added",
+            "tracks_removed",
+            "tracks_missing",
+            "tracks_flagged",
+        ),
+        (
+            (
+                destination,
+                result.playlists_created,
+                result.playlists_deleted,
+                result.tracks_added,
+                result.tracks_removed,
+                result.tracks_missing,
+                result.tracks_flagged,
+            )
+            for destination, result in results
+        ),
     )
 
-    if output_path:
-        console.print(f"[green]Report generated:[/green] {output_path}")
-    else:
-        console.print("[yellow]No missing tracks to report.[/yellow]")
 
+def _track_label(artist: str, title: str) -> str:
+    """Build an "Artist - Title" label truncated to the table column width.
+
+    Each part is clipped before joining so long names never build a
+    full-length string only to discard most of it.
+
+    Args:
+        artist: Track artist.
+        title: Track title.
+
+    Returns:
+        Label of at most TRACK_LABEL_WIDTH characters.
+    """
+    width = TRACK_LABEL_WIDTH
+    return f"{artist[:width]} - {title[:width]}"[:width]
+
+
+OperationRow = tuple[str, str, str, str, str]
+
+
+def _create_row(op: "SyncOperation") -> OperationRow:
+    return ("Create", op.folder_name, op.playlist_name, "-", "")
+
+
+def _delete_row(op: "SyncOperation") -> OperationRow:
+    return ("Delete", op.folder_name, op.playlist_name, "-", "")
+
+
+def _add_row(op: "SyncOperation") -> OperationRow:
+    status = STATUS_REVIEW if op.flagged else STATUS_OK
+    label = _track_label(op.track_artist, op.track_title)
+    return ("Add", op.folder_name, label, f"{op.confidence:.0%}", status)
 
-def _print_sync_result(result, dry_run: bool) -> None:
+
+def _remove_row(op: "SyncOperation") -> OperationRow:
+    label = _track_label(op.track_artist, op.track_title)
+    return ("Remove", op.folder_name, label, "-", "")
+
+
+@cache
+def _operation_row_builders() -> dict["OperationType", "Callable[[SyncOperation], OperationRow]"]:
+    """Map each operation type to the function that renders its table row.
+
+    Built on first use so the sync engine is only imported when a result
+    is actually printed.
+
+    Returns:
+        Dictionary of OperationType to row builder.
+    """
+    from song_automations.sync.engine import OperationType
+
+    return {
+        OperationType.CREATE_PLAYLIST: _create_row,
+        OperationType.DELETE_PLAYLIST: _delete_row,
+        OperationType.ADD_TRACK: _add_row,
+        OperationType.REMOVE_TRACK: _remove_row,
+    }
+
+
+def _print_sync_result(result, dry_run: bool, destination: str) -> None:
     """Print sync result summary.
 
     Args:
         result: SyncResult object.
         dry_run: Whether this was a dry run.
+        destination: Platform the result is for, used in TSV output.
     """
-    console.print()
+    if not sys.stdout.isatty():
+        _print_plain([(destination, result)])
+        return
+
+    from rich.table import Table
+
+    _console().print()
 
-    if result.operations:
+    n_ops = len(result.operations)
+    if n_ops:
         table = Table(title="Operations" + (" (DRY RUN)" if dry_run else ""))
         table.add_column("Type", style="cyan")
         table.add_column("Folder", style="magenta")
@@ -430,33 +731,15 @@ def _print_sync_result(result, dry_run: bool) -> None:
         table.add_column("Confidence", justify="right")
         table.add_column("Status", style="dim")
 
-        for op in result.operations[:50]:
-            if op.operation_type == OperationType.CREATE_PLAYLIST:
-                table.add_row("Create", op.folder_name, op.playlist_name, "-", "")
-            elif op.operation_type == OperationType.DELETE_PLAYLIST:
-                table.add_row("Delete", op.folder_name, op.playlist_name, "-", "")
-            elif op.operation_type == OperationType.ADD_TRACK:
-                status = "[yellow]Review[/yellow]" if op.flagged else "[green]OK[/green]"
-                table.add_row(
-                    "Add",
-                    op.folder_name,
-                    f"{op.track_artist} - {op.track_title}"[:50],
-                    f"{op.confidence:.0%}",
-                    status,
-                )
-            elif op.operation_type == OperationType.REMOVE_TRACK:
-                table.add_row(
-                    "Remove",
-                    op.folder_name,
-                    f"{op.track_artist} - {op.track_title}"[:50],
-                    "-",
-                    "",
-                )
+        shown = min(MAX_OPERATION_ROWS, n_ops)
+        row_builders = _operation_row_builders()
+        for op in islice(result.operations, shown):
+            table.add_row(*row_builders[op.operation_type](op))
 
-        if len(result.operations) > 50:
-            table.add_row("...", f"({len(result.operations) - 50} more)", "", "", "")
+        if n_ops > shown:
+            table.add_row("...", f"({n_ops - shown} more)", "", "", "")
 
-        console.print(table)
+        _console().print(table)
 
     summary = Table.grid(padding=1)
     summary.add_column(justify="right")
@@ -467,13 +750,14 @@ def _print_sync_result(result, dry_run: bool) -> None:
     summary.add_row("Playlists deleted:", str(result.playlists_deleted))
     summary.add_row("Tracks added:", str(result.tracks_added))
     summary.add_row("Tracks removed:", str(result.tracks_removed))
-    summary.add_row("Tracks missing:", f"[red]{result.tracks_missing}[/red]")
-    summary.add_row("Tracks flagged:", f"[yellow]{result.tracks_flagged}[/yellow]")
+    missing, flagged = result.tracks_missing, result.tracks_flagged
+    summary.add_row("Tracks missing:", f"[red]{missing}[/red]" if missing else MISSING_ZERO)
+    summary.add_row("Tracks flagged:", f"[yellow]{flagged}[/yellow]" if flagged else FLAGGED_ZERO)
 
-    console.print(summary)
+    _console().print(summary)
 
     if result.tracks_missing > 0:
-        console.print(
+        _console().print(
             "\n[dim]Run 'song-automations report missing' to see unfound tracks.[/dim]"
         )
 
@@ -502,14 +786,14 @@ def review(
 
     from song_automations.web import create_app
 
-    settings = _init_settings()
+    settings = _init_settings(setup_logs=False)
 
     if not settings.db_path.exists():
-        console.print("[yellow]No sync data found. Run a sync first.[/yellow]")
+        _console().print(NO_SYNC_DATA)
         raise typer.Exit(1)
 
-    console.print(f"[bold green]Starting review server at http://{host}:{port}[/bold green]")
-    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
+    _console().print(f"[bold green]Starting review server at http://{host}:{port}[/bold green]")
+    _console().print("[dim]Press Ctrl+C to stop[/dim]\n")
 
     app_instance = create_app()
     uvicorn.run(app_instance, host=host, port=port, log_level="warning")
@@ -527,19 +811,22 @@ def cleanup_logs(
     ] = 90,
 ) -> None:
     """Remove old sync logs to save disk space."""
+    from song_automations.config import get_settings
+    from song_automations.state.tracker import StateTracker
+
     settings = get_settings()
 
     if not settings.db_path.exists():
-        console.print("[yellow]No sync data found. Nothing to clean up.[/yellow]")
+        _console().print("[yellow]No sync data found. Nothing to clean up.[/yellow]")
         return
 
     state_tracker = StateTracker(settings.db_path)
     deleted = state_tracker.cleanup_old_logs(days)
 
     if deleted > 0:
-        console.print(f"[green]Deleted {deleted} log entries older than {days} days.[/green]")
+        _console().print(f"[green]Deleted {deleted} log entries older than {days} days.[/green]")
     else:
-        console.print(f"[dim]No log entries older than {days} days found.[/dim]")
+        _console().print(f"[dim]No log entries older than {days} days found.[/dim]")
 
 
 if __name__ == "__main__":
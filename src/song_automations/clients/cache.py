@@ -0,0 +1,208 @@
+"""Caches for API responses: persistent SQLite and short-lived in-memory."""
+
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response.
+
+    Args:
+        body: Decoded JSON body.
+        etag: ETag header the response was served with, if any.
+        stored_at: Unix timestamp when the entry was written.
+    """
+
+    body: Any
+    etag: str | None
+    stored_at: float
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Check whether the entry is younger than max_age seconds."""
+        return time.time() - self.stored_at < max_age
+
+
+class ResponseCache:
+    """Persistent key-value cache for JSON API responses.
+
+    The database file is created on first use, so constructing a cache
+    never touches the filesystem.
+
+    Args:
+        db_path: Path to the SQLite cache file.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._ready = False
+
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a database connection, creating the schema if needed."""
+        if not self._ready:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path)
+        try:
+            if not self._ready:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS responses (
+                        key TEXT PRIMARY KEY,
+                        body TEXT NOT NULL,
+                        etag TEXT,
+                        stored_at REAL NOT NULL
+                    )
+                    """
+                )
+                self._ready = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get a cached response.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            CacheEntry if present, None otherwise.
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT body, etag, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+        return CacheEntry(body=orjson.loads(row[0]), etag=row[1], stored_at=row[2])
+
+    def get_many(self, keys: list[str]) -> dict[str, CacheEntry]:
+        """Get several cached responses in one query.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Dictionary of key to CacheEntry for the keys that are present.
+        """
+        if not keys:
+            return {}
+
+        placeholders = ", ".join("?" for _ in keys)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT key, body, etag, stored_at FROM responses WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+
+        return {
+            row[0]: CacheEntry(body=orjson.loads(row[1]), etag=row[2], stored_at=row[3])
+            for row in rows
+        }
+
+    def set(
+        self,
+        key: str,
+        body: Any,
+        etag: str | None = None,
+        supersedes: str | None = None,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key.
+            body: JSON-serializable response body.
+            etag: Optional ETag for later revalidation.
+            supersedes: Optional key prefix whose existing entries are older
+                versions of this response; they are deleted in the same
+                transaction.
+        """
+        self.set_many([(key, body, etag)], supersedes)
+
+    def set_many(
+        self,
+        entries: list[tuple[str, Any, str | None]],
+        supersedes: str | None = None,
+    ) -> None:
+        """Store several responses in one transaction.
+
+        Args:
+            entries: (key, body, etag) tuples.
+            supersedes: Optional key prefix whose existing entries are
+                deleted before the new ones are written.
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        with self._get_connection() as conn:
+            if supersedes:
+                conn.execute(
+                    "DELETE FROM responses WHERE substr(key, 1, ?) = ?",
+                    (len(supersedes), supersedes),
+                )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO responses (key, body, etag, stored_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(key, orjson.dumps(body).decode(), etag, now) for key, body, etag in entries],
+            )
+
+
+class TTLCache:
+    """Bounded in-memory cache whose entries expire after a fixed age.
+
+    When full, the least recently used entry is evicted.
+
+    Args:
+        maxsize: Maximum number of entries kept.
+        ttl: Seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The value if present and unexpired, None otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+        """
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -1,15 +1,39 @@
 """Discogs API client for fetching collection and wantlist data."""
 
-from collections.abc import Iterator
+import asyncio
+import re
+import threading
+from collections.abc import Coroutine, Iterator
 from dataclasses import dataclass
+from typing import Any
 
 import discogs_client
-from discogs_client.exceptions import HTTPError
-
+import httpx
+import orjson
+
+from song_automations.clients.cache import ResponseCache
+from song_automations.clients.http import (
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    RateLimitError,
+    TokenBucket,
+    handle_rate_limit,
+    wait_for_rate_limit,
+    wait_for_rate_limit_async,
+)
 from song_automations.config import Settings
 
+DISCOGS_API_URL = "https://api.discogs.com"
+USER_AGENT = "SongAutomations/0.1.0"
+PAGE_SIZE = 100
+RELEASE_CACHE_TTL = 30 * 24 * 60 * 60
+REQUESTS_PER_MINUTE = 60
+RATE_LIMIT_ATTEMPTS = 4
+
+_DISCOGS_SUFFIX_RE = re.compile(r" \(\d+\)$")
 
-@dataclass
+
+@dataclass(slots=True)
 class Track:
     """Represents a single track from a Discogs release.
 
@@ -35,7 +59,7 @@ class Track:
         return f"{self.artist} - {self.title}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Folder:
     """Represents a Discogs collection folder.
 
@@ -50,7 +74,7 @@ class Folder:
     count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Release:
     """Represents a Discogs release.
 
@@ -88,10 +112,36 @@ class DiscogsClient:
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._client = discogs_client.Client(
-            "SongAutomations/0.1.0",
+            USER_AGENT,
             user_token=settings.discogs_user_token,
         )
         self._user: discogs_client.User | None = None
+        self._http_client: httpx.Client | None = None
+        self._cache = ResponseCache(settings.cache_dir / "discogs.db")
+        self._limiter = TokenBucket(rate=REQUESTS_PER_MINUTE / 60, capacity=5)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine to completion on the client's own event loop.
+
+        The loop runs on a background thread, so the blocking API works the
+        same from plain code and from inside a running event loop, such as
+        the review web app, where asyncio.run would raise.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine's result.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="discogs-async", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     @property
     def user(self) -> discogs_client.User:
@@ -106,92 +156,203 @@ class DiscogsClient:
         Returns:
             List of Folder objects representing collection folders.
         """
-        folders = []
-        for folder in self.user.collection_folders:
-            if folder.id == 0:
-                continue
-            folders.append(
-                Folder(
-                    id=folder.id,
-                    name=folder.name,
-                    count=folder.count,
-                )
+        return [
+            Folder(id=folder.id, name=folder.name, count=folder.count)
+            for folder in self.user.collection_folders
+            if folder.id != 0
+        ]
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Build headers for direct Discogs REST API requests.
+
+        Returns:
+            Headers carrying the user token and user agent.
+        """
+        return {
+            "Authorization": f"Discogs token={self._settings.discogs_user_token}",
+            "User-Agent": USER_AGENT,
+        }
+
+    @property
+    def _http(self) -> httpx.Client:
+        """Get the HTTP client for direct API requests, creating if necessary."""
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                http2=True,
+                base_url=DISCOGS_API_URL,
+                headers=self._auth_headers(),
+                timeout=DEFAULT_TIMEOUT,
+                limits=DEFAULT_LIMITS,
             )
-        return folders
+        return self._http_client
+
+    def _get_json(
+        self,
+        path: str,
+        params: dict | None = None,
+        revalidate: bool = False,
+    ) -> dict[str, Any] | None:
+        """GET a Discogs API resource as JSON.
+
+        Rate-limited responses are retried after the advertised delay, up
+        to RATE_LIMIT_ATTEMPTS requests in total.
+
+        Args:
+            path: API path relative to the Discogs base URL.
+            params: Optional query parameters.
+            revalidate: Whether to cache the response by ETag and send
+                ``If-None-Match`` on later requests, reusing the cached body
+                when the server answers 304.
+
+        Returns:
+            Parsed JSON body, or None if the resource does not exist.
+
+        Raises:
+            RateLimitError: If every attempt was rate limited.
+            httpx.HTTPStatusError: For non-404 HTTP errors.
+        """
+        cache_key = None
+        cached = None
+        headers = {}
+        if revalidate:
+            cache_key = str(httpx.URL(path, params=params))
+            cached = self._cache.get(cache_key)
+            if cached and cached.etag:
+                headers["If-None-Match"] = cached.etag
+
+        for attempt in range(1, RATE_LIMIT_ATTEMPTS + 1):
+            wait_for_rate_limit()
+            with self._limiter:
+                response = self._http.get(path, params=params, headers=headers)
+            try:
+                handle_rate_limit(response)
+            except RateLimitError:
+                if attempt == RATE_LIMIT_ATTEMPTS:
+                    raise
+                continue
+            if response.status_code == 304 and cached:
+                return cached.body
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if cache_key and etag:
+                self._cache.set(cache_key, data, etag)
+            return data
+
+    def _paginate(self, path: str, key: str) -> Iterator[dict[str, Any]]:
+        """Iterate over every item of a paginated Discogs list endpoint.
+
+        The first page reports the page count; the remaining pages are
+        then fetched concurrently.
+
+        Args:
+            path: API path of the list endpoint.
+            key: Name of the list field in each page.
+
+        Yields:
+            Raw item dicts, page by page.
+        """
+        first = self._get_json(path, params=self._page_params(1), revalidate=True)
+        if first is None:
+            return
+        yield from first.get(key, [])
+
+        total = first.get("pagination", {}).get("pages", 1)
+        if total > 1:
+            for data in self._run(self._fetch_pages(path, range(2, total + 1))):
+                if data:
+                    yield from data.get(key, [])
 
-    def _get_folder_by_id(self, folder_id: int):
-        """Get a collection folder by its ID.
+    @staticmethod
+    def _page_params(page: int) -> dict[str, int]:
+        """Query parameters for one page of a list endpoint."""
+        return {"page": page, "per_page": PAGE_SIZE}
+
+    def _fetch_release_dict(self, release_id: int) -> dict[str, Any] | None:
+        """Fetch the raw JSON for a single release in one request.
+
+        Release metadata rarely changes, so responses are kept in the
+        on-disk cache for RELEASE_CACHE_TTL seconds.
 
         Args:
-            folder_id: The folder ID to find.
+            release_id: The Discogs release ID.
 
         Returns:
-            The folder object or None if not found.
+            Parsed release JSON, or None if the release does not exist.
         """
-        for folder in self.user.collection_folders:
-            if folder.id == folder_id:
-                return folder
-        return None
+        key = f"release:{release_id}"
+        cached = self._cache.get(key)
+        if cached and cached.is_fresh(RELEASE_CACHE_TTL):
+            return cached.body
+
+        data = self._get_json(f"/releases/{release_id}")
+        if data is not None:
+            self._cache.set(key, data)
+        return data
+
+    def _release_from_basic_information(
+        self,
+        info: dict[str, Any],
+        folder_id: int,
+        folder_name: str,
+    ) -> Release:
+        """Build a Release from a collection or wantlist item.
+
+        Args:
+            info: The item's ``basic_information`` dict.
+            folder_id: Folder ID the release belongs to.
+            folder_name: Folder name the release belongs to.
+
+        Returns:
+            Release object.
+        """
+        label, catalog_number = self._extract_label_info(info.get("labels") or [])
+        return Release(
+            id=info["id"],
+            title=info.get("title", ""),
+            artist=self._format_artist_names([a["name"] for a in info.get("artists", [])]),
+            year=info.get("year") or 0,
+            folder_id=folder_id,
+            folder_name=folder_name,
+            label=label,
+            catalog_number=catalog_number,
+        )
 
     def get_folder_releases(self, folder_id: int) -> Iterator[Release]:
         """Get all releases in a specific folder.
 
+        Release details come from each collection item's
+        ``basic_information``, so no per-release requests are made.
+
         Args:
             folder_id: The folder ID to fetch releases from.
 
         Yields:
             Release objects for each release in the folder.
-            Skips releases that have been deleted on Discogs.
         """
-        folder = self._get_folder_by_id(folder_id)
+        folder_path = f"/users/{self.user.username}/collection/folders/{folder_id}"
+        folder = self._get_json(folder_path)
         if folder is None:
             return
-        for item in folder.releases:
-            release = item.release
-            try:
-                artists = self._extract_artists(release.artists)
-                label, catalog_number = self._extract_label_info(release)
-                yield Release(
-                    id=release.id,
-                    title=release.title,
-                    artist=artists,
-                    year=release.year or 0,
-                    folder_id=folder_id,
-                    folder_name=folder.name,
-                    label=label,
-                    catalog_number=catalog_number,
-                )
-            except HTTPError as e:
-                if e.status_code == 404:
-                    continue
-                raise
+        for item in self._paginate(f"{folder_path}/releases", "releases"):
+            yield self._release_from_basic_information(
+                item["basic_information"], folder_id, folder["name"]
+            )
 
     def get_wantlist_releases(self) -> Iterator[Release]:
         """Get all releases in the user's wantlist.
 
         Yields:
             Release objects for each release in the wantlist.
-            Skips releases that have been deleted on Discogs.
         """
-        for item in self.user.wantlist:
-            release = item.release
-            try:
-                artists = self._extract_artists(release.artists)
-                label, catalog_number = self._extract_label_info(release)
-                yield Release(
-                    id=release.id,
-                    title=release.title,
-                    artist=artists,
-                    year=release.year or 0,
-                    folder_id=self.WANTLIST_FOLDER_ID,
-                    folder_name=self.WANTLIST_FOLDER_NAME,
-                    label=label,
-                    catalog_number=catalog_number,
-                )
-            except HTTPError as e:
-                if e.status_code == 404:
-                    continue
-                raise
+        for item in self._paginate(f"/users/{self.user.username}/wants", "wants"):
+            yield self._release_from_basic_information(
+                item["basic_information"],
+                self.WANTLIST_FOLDER_ID,
+                self.WANTLIST_FOLDER_NAME,
+            )
 
     def get_release_tracks(self, release_id: int) -> list[Track]:
         """Fetch the tracklist for a specific release.
@@ -204,137 +365,251 @@ class DiscogsClient:
             Returns empty list if release is deleted or not accessible.
 
         Raises:
-            HTTPError: For non-404 HTTP errors.
+            httpx.HTTPStatusError: For non-404 HTTP errors.
         """
-        try:
-            release = self._client.release(release_id)
-            tracks = []
-
-            release_artist = self._extract_artists(release.artists)
-
-            for track in release.tracklist:
-                if not track.position or track.position.lower() in ("video", "dvd"):
-                    continue
-
-                if hasattr(track, "artists") and track.artists:
-                    track_artist = self._extract_artists(track.artists)
-                else:
-                    track_artist = release_artist
-
-                tracks.append(
-                    Track(
-                        position=track.position,
-                        title=track.title,
-                        artist=track_artist,
-                        duration=track.duration or "",
-                        release_id=release_id,
-                        release_title=release.title,
-                    )
-                )
+        data = self._fetch_release_dict(release_id)
+        if data is None:
+            return []
+        return self._tracks_from_release_json(data)
 
-            return tracks
-        except HTTPError as e:
-            if e.status_code == 404:
-                return []
-            raise
+    def get_releases_tracks(self, release_ids: list[int]) -> dict[int, list[Track]]:
+        """Fetch tracklists for many releases concurrently.
 
-    def _extract_artists(self, artists: list) -> str:
-        """Extract a clean artist name from Discogs artist list.
+        Releases in the on-disk cache are served from it; the rest are
+        multiplexed over one async HTTP/2 session, with at most
+        ``settings.max_workers`` in flight and requests paced to
+        REQUESTS_PER_MINUTE.
 
         Args:
-            artists: List of artist objects from Discogs.
+            release_ids: Discogs release IDs to fetch.
 
         Returns:
-            Cleaned artist name string.
+            Dictionary mapping each distinct release ID to its tracks.
+            Deleted or inaccessible releases map to an empty list.
+
+        Raises:
+            httpx.HTTPStatusError: For non-404 HTTP errors.
         """
-        if not artists:
-            return "Unknown Artist"
+        if not release_ids:
+            return {}
+
+        unique_ids = list(dict.fromkeys(release_ids))
+        cached = self._cache.get_many([f"release:{rid}" for rid in unique_ids])
+        releases: dict[int, dict[str, Any] | None] = {}
+        missing = []
+        for rid in unique_ids:
+            entry = cached.get(f"release:{rid}")
+            if entry and entry.is_fresh(RELEASE_CACHE_TTL):
+                releases[rid] = entry.body
+            else:
+                missing.append(rid)
+
+        if missing:
+            fetched = self._run(self._fetch_releases(missing))
+            releases.update(fetched)
+            self._cache.set_many(
+                [(f"release:{rid}", data, None) for rid, data in fetched.items() if data]
+            )
 
-        names = []
-        for artist in artists:
-            name = artist.name
-            name = self._clean_artist_name(name)
-            names.append(name)
+        return {
+            rid: self._tracks_from_release_json(data) if (data := releases[rid]) else []
+            for rid in unique_ids
+        }
 
-        if len(names) == 1:
-            return names[0]
+    def _async_session(self) -> httpx.AsyncClient:
+        """Create an async HTTP/2 client for concurrent API requests.
 
-        if len(names) == 2:
-            return f"{names[0]} & {names[1]}"
+        Returns:
+            AsyncClient pointed at the Discogs API.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            base_url=DISCOGS_API_URL,
+            headers=self._auth_headers(),
+            timeout=DEFAULT_TIMEOUT,
+            limits=DEFAULT_LIMITS,
+        )
 
-        return ", ".join(names[:-1]) + f" & {names[-1]}"
+    async def _fetch_releases(
+        self,
+        release_ids: list[int],
+    ) -> dict[int, dict[str, Any] | None]:
+        """Fan out release requests bounded by a semaphore.
 
-    def _clean_artist_name(self, name: str) -> str:
-        """Clean up Discogs artist name quirks.
+        Args:
+            release_ids: Discogs release IDs to fetch.
+
+        Returns:
+            Dictionary mapping each release ID to its JSON, or None if missing.
+        """
+        semaphore = asyncio.Semaphore(self._settings.max_workers)
+        async with self._async_session() as session:
+            releases = await asyncio.gather(
+                *(
+                    self._get_json_async(session, semaphore, f"/releases/{rid}")
+                    for rid in release_ids
+                )
+            )
+
+        return dict(zip(release_ids, releases, strict=True))
+
+    async def _fetch_pages(self, path: str, pages: range) -> list[dict[str, Any] | None]:
+        """Fetch several pages of a list endpoint concurrently.
+
+        Each page is revalidated against the on-disk cache by ETag.
 
         Args:
-            name: Raw artist name from Discogs.
+            path: API path of the list endpoint.
+            pages: Page numbers to fetch.
 
         Returns:
-            Cleaned artist name.
+            Page JSON documents in page order, None for missing pages.
+        """
+        semaphore = asyncio.Semaphore(self._settings.max_workers)
+        async with self._async_session() as session:
+            return await asyncio.gather(
+                *(
+                    self._get_json_async(
+                        session,
+                        semaphore,
+                        path,
+                        params=self._page_params(page),
+                        revalidate=True,
+                    )
+                    for page in pages
+                )
+            )
+
+    async def _get_json_async(
+        self,
+        session: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        path: str,
+        params: dict | None = None,
+        revalidate: bool = False,
+    ) -> dict[str, Any] | None:
+        """GET a Discogs API resource as JSON from a coroutine.
+
+        Mirrors _get_json: requests wait out the shared rate-limit window,
+        rate-limited responses are retried once it has passed, up to
+        RATE_LIMIT_ATTEMPTS requests in total, and ``revalidate`` enables
+        ETag caching.
+
+        Args:
+            session: Async HTTP client pointed at the Discogs API.
+            semaphore: Semaphore bounding concurrent requests.
+            path: API path relative to the Discogs base URL.
+            params: Optional query parameters.
+            revalidate: Whether to revalidate a cached copy by ETag.
+
+        Returns:
+            Parsed JSON body, or None if the resource does not exist.
+
+        Raises:
+            RateLimitError: If every attempt was rate limited.
         """
-        if " (" in name and name.endswith(")"):
-            idx = name.rfind(" (")
-            suffix = name[idx + 2 : -1]
-            if suffix.isdigit():
-                name = name[:idx]
+        cache_key = None
+        cached = None
+        headers = {}
+        if revalidate:
+            cache_key = str(httpx.URL(path, params=params))
+            cached = self._cache.get(cache_key)
+            if cached and cached.etag:
+                headers["If-None-Match"] = cached.etag
+
+        for attempt in range(1, RATE_LIMIT_ATTEMPTS + 1):
+            async with semaphore:
+                await wait_for_rate_limit_async()
+                async with self._limiter:
+                    response = await session.get(path, params=params, headers=headers)
+            try:
+                handle_rate_limit(response)
+            except RateLimitError:
+                if attempt == RATE_LIMIT_ATTEMPTS:
+                    raise
+                continue
+            if response.status_code == 304 and cached:
+                return cached.body
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+            if cache_key and etag:
+                self._cache.set(cache_key, data, etag)
+            return data
+
+    def _tracks_from_release_json(self, data: dict[str, Any]) -> list[Track]:
+        """Build Track objects from a raw release JSON document.
 
-        return name.strip()
+        Args:
+            data: Release JSON as returned by ``GET /releases/{id}``.
 
-    def _extract_label_info(self, release) -> tuple[str, str]:
-        """Extract label name and catalog number from a release.
+        Returns:
+            List of Track objects, skipping headings and video entries.
+        """
+        release_id = data["id"]
+        release_title = data.get("title", "")
+        release_artist = self._format_artist_names(
+            [artist["name"] for artist in data.get("artists", [])]
+        )
+
+        return [
+            Track(
+                position=track["position"],
+                title=track.get("title", ""),
+                artist=(
+                    self._format_artist_names([a["name"] for a in track_artists])
+                    if (track_artists := track.get("artists"))
+                    else release_artist
+                ),
+                duration=track.get("duration") or "",
+                release_id=release_id,
+                release_title=release_title,
+            )
+            for track in data.get("tracklist", [])
+            if track.get("position") and track["position"].lower() not in ("video", "dvd")
+        ]
+
+    def _format_artist_names(self, raw_names: list[str]) -> str:
+        """Join raw Discogs artist names into a single display string.
 
         Args:
-            release: Discogs release object.
+            raw_names: Artist names as returned by Discogs.
 
         Returns:
-            Tuple of (label_name, catalog_number).
+            Cleaned artist name string.
         """
-        label = ""
-        catalog_number = ""
+        if not raw_names:
+            return "Unknown Artist"
 
-        if hasattr(release, "labels") and release.labels:
-            first_label = release.labels[0]
-            if hasattr(first_label, "name"):
-                label = first_label.name
-            if hasattr(first_label, "catno"):
-                catalog_number = first_label.catno
+        names = [self._clean_artist_name(name) for name in raw_names]
+        if len(names) <= 2:
+            return " & ".join(names)
+        return ", ".join(names[:-1]) + " & " + names[-1]
 
-        return label, catalog_number
+    def _clean_artist_name(self, name: str) -> str:
+        """Clean up Discogs artist name quirks.
 
-    def get_all_releases_with_tracks(
-        self,
-        include_wantlist: bool = True,
-        folder_names: list[str] | None = None,
-    ) -> dict[str, list[tuple[Release, list[Track]]]]:
-        """Get all releases with their tracks, organized by folder.
+        Args:
+            name: Raw artist name from Discogs.
+
+        Returns:
+            Cleaned artist name.
+        """
+        return _DISCOGS_SUFFIX_RE.sub("", name).strip()
+
+    def _extract_label_info(self, labels: list[dict[str, Any]]) -> tuple[str, str]:
+        """Extract label name and catalog number from release label data.
 
         Args:
-            include_wantlist: Whether to include wantlist releases.
-            folder_names: Optional list of folder names to filter by.
+            labels: Label dicts from a release's JSON.
 
         Returns:
-            Dictionary mapping folder names to lists of (Release, tracks) tuples.
+            Tuple of (label_name, catalog_number).
         """
-        result: dict[str, list[tuple[Release, list[Track]]]] = {}
-
-        folders = self.get_folders()
-        if folder_names:
-            folders = [f for f in folders if f.name in folder_names]
-
-        for folder in folders:
-            releases_with_tracks = []
-            for release in self.get_folder_releases(folder.id):
-                tracks = self.get_release_tracks(release.id)
-                releases_with_tracks.append((release, tracks))
-            result[folder.name] = releases_with_tracks
-
-        if include_wantlist:
-            wantlist_releases = []
-            for release in self.get_wantlist_releases():
-                tracks = self.get_release_tracks(release.id)
-                wantlist_releases.append((release, tracks))
-            if wantlist_releases:
-                result[self.WANTLIST_FOLDER_NAME] = wantlist_releases
-
-        return result
+        if not labels:
+            return "", ""
+
+        first_label = labels[0]
+        return first_label.get("name", ""), first_label.get("catno", "")
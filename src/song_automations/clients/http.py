@@ -1,5 +1,7 @@
 """HTTP utilities for API clients."""
 
+import asyncio
+import threading
 import time
 
 import httpx
@@ -10,7 +12,20 @@ from tenacity import (
     wait_exponential,
 )
 
-DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60,
+)
+
+LOW_REMAINING_THRESHOLD = 5
+
+_rate_limit_lock = threading.Lock()
+_rate_limit_event = threading.Event()
+_rate_limit_event.set()
+_rate_limit_until = 0.0
+_rate_limit_timer: threading.Timer | None = None
 
 RETRYABLE_EXCEPTIONS = (
     httpx.ConnectError,
@@ -40,6 +55,72 @@ def retry_on_transient_error(func):
     )(func)
 
 
+class TokenBucket:
+    """Thread-safe token bucket that paces outgoing requests.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    A caller that finds the bucket empty reserves the next token and
+    sleeps until it is due, so requests stay under the limit instead of
+    discovering it through 429 responses.
+
+    Use as a context manager around each request, or as an async
+    context manager from coroutines:
+        with bucket:
+            response = client.get(url)
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size. Defaults to rate.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self._rate = rate
+        self._capacity = capacity if capacity is not None else rate
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait until it is due."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take one token without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def __enter__(self) -> "TokenBucket":
+        """Acquire a token on entry."""
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Nothing to release; tokens refill over time."""
+
+    async def __aenter__(self) -> "TokenBucket":
+        """Acquire a token on async entry."""
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Nothing to release; tokens refill over time."""
+
+
 class RateLimitError(Exception):
     """Raised when API returns 429 Too Many Requests."""
 
@@ -48,9 +129,89 @@ class RateLimitError(Exception):
         super().__init__(f"Rate limited. Retry after {retry_after} seconds.")
 
 
+def _header_number(response: httpx.Response, name: str) -> float | None:
+    """Read a numeric header, ignoring missing or malformed values."""
+    value = response.headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(response: httpx.Response) -> tuple[int | None, float | None]:
+    """Read the remaining quota and reset time from a response.
+
+    Args:
+        response: The HTTP response to inspect.
+
+    Returns:
+        Tuple of (remaining requests, reset time as a Unix timestamp),
+        with None for headers the server did not send.
+    """
+    remaining = _header_number(response, "X-RateLimit-Remaining")
+    reset_at = _header_number(response, "X-RateLimit-Reset")
+    return (int(remaining) if remaining is not None else None), reset_at
+
+
+def throttle_delay(
+    remaining: int | None,
+    reset_at: float | None,
+    threshold: int = LOW_REMAINING_THRESHOLD,
+) -> float:
+    """Compute how long to wait before the next request.
+
+    When the remaining quota drops below the threshold, the time left in
+    the window is spread evenly over the requests still allowed.
+
+    Args:
+        remaining: Requests left in the current window.
+        reset_at: Unix timestamp when the window resets.
+        threshold: Remaining count below which to start slowing down.
+
+    Returns:
+        Seconds to sleep, 0 if no throttling is needed.
+    """
+    if remaining is None or reset_at is None or remaining >= threshold:
+        return 0.0
+    return max(0.0, reset_at - time.time()) / max(remaining, 1)
+
+
+def _defer_requests(seconds: float) -> None:
+    """Close the shared rate-limit gate for the given number of seconds.
+
+    Overlapping calls extend the window to the latest deadline; a single
+    timer reopens the gate when it passes.
+
+    Args:
+        seconds: How long requests should be held back.
+    """
+    global _rate_limit_until, _rate_limit_timer
+    if seconds <= 0:
+        return
+
+    with _rate_limit_lock:
+        until = time.monotonic() + seconds
+        if until <= _rate_limit_until:
+            return
+        _rate_limit_until = until
+        _rate_limit_event.clear()
+        if _rate_limit_timer is not None:
+            _rate_limit_timer.cancel()
+        _rate_limit_timer = threading.Timer(seconds, _rate_limit_event.set)
+        _rate_limit_timer.daemon = True
+        _rate_limit_timer.start()
+
+
 def handle_rate_limit(response: httpx.Response) -> None:
     """Check response for rate limiting and handle appropriately.
 
+    The wait comes from ``Retry-After`` when present, then from
+    ``X-RateLimit-Reset``, and falls back to 60 seconds. The wait is also
+    registered process-wide so wait_for_rate_limit holds back every worker
+    until it has passed.
+
     Args:
         response: The HTTP response to check.
 
@@ -58,14 +219,36 @@ def handle_rate_limit(response: httpx.Response) -> None:
         RateLimitError: If response indicates rate limiting (429).
     """
     if response.status_code == 429:
-        retry_after = int(response.headers.get("Retry-After", "60"))
+        retry_after = _header_number(response, "Retry-After")
+        if retry_after is None:
+            _, reset_at = parse_rate_limit_headers(response)
+            if reset_at is not None:
+                retry_after = max(0, int(reset_at) - int(time.time()))
+        retry_after = int(retry_after) if retry_after is not None else 60
+        _defer_requests(retry_after)
         raise RateLimitError(retry_after)
 
 
-def wait_for_rate_limit(retry_after: int) -> None:
-    """Wait for the specified rate limit period.
+def wait_for_rate_limit(retry_after: float = 0) -> None:
+    """Block until the shared rate-limit window has passed.
+
+    All waiting threads are released together when the window closes,
+    rather than each sleeping out its own full delay.
 
     Args:
-        retry_after: Seconds to wait before retrying.
+        retry_after: Optional seconds to hold back requests from now,
+            extending any window already in effect.
+    """
+    _defer_requests(retry_after)
+    _rate_limit_event.wait()
+
+
+async def wait_for_rate_limit_async() -> None:
+    """Wait out the shared rate-limit window without blocking the event loop.
+
+    The async counterpart of wait_for_rate_limit, so coroutines honour
+    the same window as threaded requests.
     """
-    time.sleep(retry_after)
+    event = _rate_limit_event
+    if not event.is_set():
+        await asyncio.to_thread(event.wait)
@@ -1,23 +1,55 @@
 """SoundCloud API client for playlist management and track search."""
 
+import asyncio
 import base64
+import contextlib
 import hashlib
 import json
 import secrets
+import selectors
+import socket
+import time
 import webbrowser
-from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from threading import Thread
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
+import orjson
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from song_automations.clients.http import DEFAULT_TIMEOUT, RETRYABLE_EXCEPTIONS, handle_rate_limit
+from song_automations.clients.cache import ResponseCache, TTLCache
+from song_automations.clients.http import (
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    RETRYABLE_EXCEPTIONS,
+    TokenBucket,
+    handle_rate_limit,
+    parse_rate_limit_headers,
+    throttle_delay,
+    wait_for_rate_limit,
+    wait_for_rate_limit_async,
+)
 from song_automations.config import Settings
 
-
-@dataclass
+PAGE_SIZE = 200
+REQUESTS_PER_SECOND = 5
+PROBE_WORKERS = 8
+OAUTH_CALLBACK_TIMEOUT = 120
+OAUTH_SUCCESS_PAGE = (
+    b"<html><body><h1>Authorization successful!</h1>"
+    b"<p>You can close this window.</p></body></html>"
+)
+TOKEN_EXPIRY_MARGIN = 60  # refresh this many seconds before expiry
+PLAYLIST_TRACKS_CACHE_TTL = 10 * 60
+SEARCH_CACHE_SIZE = 2048
+SEARCH_CACHE_TTL = 300  # 5 minutes
+
+
+@dataclass(slots=True, frozen=True)
 class SoundCloudTrack:
     """Represents a SoundCloud track.
 
@@ -42,14 +74,18 @@ class SoundCloudTrack:
     duration_ms: int
     user_id: int
     is_streamable: bool
+    _full_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_full_title", f"{self.artist} - {self.title}")
 
     @property
     def full_title(self) -> str:
         """Full title for display."""
-        return f"{self.artist} - {self.title}"
+        return self._full_title
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SoundCloudPlaylist:
     """Represents a SoundCloud playlist.
 
@@ -70,7 +106,7 @@ class SoundCloudPlaylist:
     is_public: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Represents a search result with scoring metadata.
 
@@ -83,32 +119,77 @@ class SearchResult:
     is_verified: bool
 
 
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """HTTP handler for OAuth callback."""
+def _answer_redirect(conn: socket.socket, request: bytes) -> str | None:
+    """Reply to one redirect request and return its code, if it carries one."""
+    parts = request.split(b" ", 2)
+    target = parts[1].decode("latin-1") if len(parts) > 1 else ""
+    codes = parse_qs(urlparse(target).query).get("code")
+    if codes:
+        response = (
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+            b"Content-Length: %d\r\nConnection: close\r\n\r\n%s"
+            % (len(OAUTH_SUCCESS_PAGE), OAUTH_SUCCESS_PAGE)
+        )
+    else:
+        response = b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+    conn.settimeout(1)
+    with contextlib.suppress(OSError):
+        conn.sendall(response)
+    return codes[0] if codes else None
 
-    authorization_code: str | None = None
 
-    def do_GET(self) -> None:
-        """Handle GET request with authorization code."""
-        parsed = urlparse(self.path)
-        params = parse_qs(parsed.query)
+def wait_for_authorization_code(server: socket.socket, timeout: float) -> str | None:
+    """Answer redirects on a listening socket until one carries a code.
 
-        if "code" in params:
-            OAuthCallbackHandler.authorization_code = params["code"][0]
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(
-                b"<html><body><h1>Authorization successful!</h1>"
-                b"<p>You can close this window.</p></body></html>"
-            )
-        else:
-            self.send_response(400)
-            self.end_headers()
+    Accepted connections are read without blocking through the same
+    selector as the listening socket, and each is answered as soon as its
+    request headers are complete. A connection that never sends anything,
+    such as a browser preconnect, cannot hold up the real redirect, and
+    unrelated requests such as favicon fetches get a 400.
+
+    Args:
+        server: Bound, listening socket for the OAuth redirect URI.
+        timeout: Seconds to wait for the authorization code.
 
-    def log_message(self, format: str, *args) -> None:
-        """Suppress logging."""
-        pass
+    Returns:
+        The authorization code, or None if none arrived in time.
+    """
+    deadline = time.monotonic() + timeout
+    pending: dict[socket.socket, bytes] = {}
+    with selectors.DefaultSelector() as selector:
+        selector.register(server, selectors.EVENT_READ)
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                for key, _ in selector.select(timeout=remaining):
+                    if key.fileobj is server:
+                        conn, _ = server.accept()
+                        conn.setblocking(False)
+                        selector.register(conn, selectors.EVENT_READ)
+                        pending[conn] = b""
+                        continue
+
+                    conn = key.fileobj
+                    try:
+                        chunk = conn.recv(4096)
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        chunk = b""
+                    request = pending[conn] + chunk
+                    if chunk and b"\r\n\r\n" not in request:
+                        pending[conn] = request
+                        continue
+
+                    selector.unregister(conn)
+                    del pending[conn]
+                    with conn:
+                        code = _answer_redirect(conn, request)
+                    if code:
+                        return code
+        finally:
+            for conn in pending:
+                conn.close()
+    return None
 
 
 class SoundCloudClient:
@@ -133,11 +214,26 @@ class SoundCloudClient:
 
         self._access_token: str | None = None
         self._refresh_token: str | None = None
+        self._expires_at: float | None = None
+        self._refresh_lock = Lock()
+        self._refresh_inflight: Future[bool] | None = None
         self._user_id: int | None = None
-
+        self._headers: dict[str, str] = {}
+        self._headers_token: str | None = None
+        self._playlist_index: dict[str, SoundCloudPlaylist] | None = None
+        self._playlist_pages: Iterator[SoundCloudPlaylist] = iter(())
+        self._playlist_track_ids: dict[int, list[int]] = {}
+        self._tracks_cache = ResponseCache(settings.cache_dir / "soundcloud.db")
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+        self._limiter = TokenBucket(rate=REQUESTS_PER_SECOND)
+        self._async_http_client: httpx.AsyncClient | None = None
+        self._remaining: int | None = None
+        self._reset_at: float | None = None
         self._http_client = httpx.Client(
+            http2=True,
             timeout=DEFAULT_TIMEOUT,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=DEFAULT_LIMITS,
         )
 
         self._load_tokens()
@@ -150,10 +246,36 @@ class SoundCloudClient:
         """Exit context manager and close HTTP client."""
         self.close()
 
+    async def __aenter__(self) -> "SoundCloudClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager and close both HTTP clients."""
+        await self.aclose()
+        self.close()
+
     def close(self) -> None:
         """Close the HTTP client and release resources."""
         self._http_client.close()
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was opened."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+
+    @property
+    def _ahttp(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, creating it on first use."""
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                http2=True,
+                timeout=DEFAULT_TIMEOUT,
+                limits=DEFAULT_LIMITS,
+            )
+        return self._async_http_client
+
     def _load_tokens(self) -> None:
         """Load tokens from cache file."""
         if self._token_path.exists():
@@ -161,6 +283,7 @@ class SoundCloudClient:
                 data = json.loads(self._token_path.read_text())
                 self._access_token = data.get("access_token")
                 self._refresh_token = data.get("refresh_token")
+                self._expires_at = data.get("expires_at")
             except (json.JSONDecodeError, KeyError):
                 pass
 
@@ -169,11 +292,64 @@ class SoundCloudClient:
         data = {
             "access_token": self._access_token,
             "refresh_token": self._refresh_token,
+            "expires_at": self._expires_at,
         }
         self._token_path.write_text(json.dumps(data))
 
+    def _store_tokens(self, tokens: dict) -> None:
+        """Adopt a token endpoint response and persist it.
+
+        Args:
+            tokens: Decoded token response.
+        """
+        self._access_token = tokens["access_token"]
+        self._refresh_token = tokens.get("refresh_token", self._refresh_token)
+        expires_in = tokens.get("expires_in")
+        self._expires_at = (
+            time.time() + expires_in - TOKEN_EXPIRY_MARGIN if expires_in else None
+        )
+        self._save_tokens()
+
+    def _token_valid(self) -> bool:
+        """Check whether the access token is known to be unexpired.
+
+        Tokens saved without an expiry are assumed valid until the API
+        answers 401.
+        """
+        return self._expires_at is None or time.time() < self._expires_at
+
     def _refresh_access_token(self) -> bool:
-        """Refresh the access token using the refresh token.
+        """Refresh the access token, sharing one refresh between threads.
+
+        Refresh tokens are single-use, so callers that arrive while a
+        refresh is in flight wait for its outcome instead of posting
+        their own.
+
+        Returns:
+            True if refresh succeeded, False otherwise.
+        """
+        with self._refresh_lock:
+            inflight = self._refresh_inflight
+            owner = inflight is None
+            if owner:
+                inflight = self._refresh_inflight = Future()
+
+        if not owner:
+            return inflight.result()
+
+        try:
+            refreshed = self._post_refresh()
+            inflight.set_result(refreshed)
+            return refreshed
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_inflight = None
+
+    def _post_refresh(self) -> bool:
+        """Exchange the refresh token for a new access token.
 
         Returns:
             True if refresh succeeded, False otherwise.
@@ -191,10 +367,7 @@ class SoundCloudClient:
         try:
             response = self._http_client.post(self.TOKEN_URL, data=token_data)
             if response.status_code == 200:
-                tokens = response.json()
-                self._access_token = tokens["access_token"]
-                self._refresh_token = tokens.get("refresh_token", self._refresh_token)
-                self._save_tokens()
+                self._store_tokens(orjson.loads(response.content))
                 return True
         except httpx.HTTPError:
             pass
@@ -233,21 +406,18 @@ class SoundCloudClient:
 
         auth_url = f"{self.AUTH_URL}?{urlencode(params)}"
 
-        server = HTTPServer(("localhost", port), OAuthCallbackHandler)
-        server_thread = Thread(target=server.handle_request)
-        server_thread.start()
-
-        webbrowser.open(auth_url)
-        server_thread.join(timeout=120)
+        with socket.create_server(("localhost", port)) as server:
+            webbrowser.open(auth_url)
+            authorization_code = wait_for_authorization_code(server, OAUTH_CALLBACK_TIMEOUT)
 
-        if not OAuthCallbackHandler.authorization_code:
+        if not authorization_code:
             raise RuntimeError("Failed to receive authorization code")
 
         token_data = {
             "client_id": self._settings.soundcloud_client_id,
             "client_secret": self._settings.soundcloud_client_secret,
             "grant_type": "authorization_code",
-            "code": OAuthCallbackHandler.authorization_code,
+            "code": authorization_code,
             "redirect_uri": self._settings.soundcloud_redirect_uri,
             "code_verifier": code_verifier,
         }
@@ -255,22 +425,28 @@ class SoundCloudClient:
         response = self._http_client.post(self.TOKEN_URL, data=token_data)
         handle_rate_limit(response)
         response.raise_for_status()
-        tokens = response.json()
-
-        self._access_token = tokens["access_token"]
-        self._refresh_token = tokens.get("refresh_token")
-        self._save_tokens()
-
-        OAuthCallbackHandler.authorization_code = None
+        self._refresh_token = None
+        self._store_tokens(orjson.loads(response.content))
 
     def _get_headers(self) -> dict[str, str]:
-        """Get authorization headers for API requests."""
+        """Get authorization headers for API requests.
+
+        The dict is rebuilt only when the access token changes, so
+        requests share one instance instead of allocating their own. A
+        token past its recorded expiry is refreshed up front rather than
+        waiting for a 401.
+        """
         if not self._access_token:
             self.authenticate()
-        return {
-            "Authorization": f"OAuth {self._access_token}",
-            "Accept": "application/json",
-        }
+        elif not self._token_valid():
+            self._refresh_access_token()
+        if self._headers_token != self._access_token:
+            self._headers = {
+                "Authorization": f"OAuth {self._access_token}",
+                "Accept": "application/json",
+            }
+            self._headers_token = self._access_token
+        return self._headers
 
     @retry(
         retry=retry_if_exception_type(RETRYABLE_EXCEPTIONS),
@@ -278,7 +454,7 @@ class SoundCloudClient:
         wait=wait_exponential(multiplier=2, min=2, max=30),
         reraise=True,
     )
-    def _request(
+    def _send(
         self,
         method: str,
         url: str,
@@ -286,6 +462,9 @@ class SoundCloudClient:
     ) -> httpx.Response:
         """Make an HTTP request with retry logic for transient errors.
 
+        Waits out any shared rate-limit window and paces the request
+        through the token bucket before sending.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE).
             url: URL to request.
@@ -300,7 +479,113 @@ class SoundCloudClient:
         """
         if "headers" not in kwargs:
             kwargs["headers"] = self._get_headers()
-        return self._http_client.request(method, url, **kwargs)
+
+        wait_for_rate_limit()
+        delay = throttle_delay(self._remaining, self._reset_at)
+        if delay > 0:
+            time.sleep(delay)
+
+        with self._limiter:
+            response = self._http_client.request(method, url, **kwargs)
+
+        remaining, reset_at = parse_rate_limit_headers(response)
+        if remaining is not None:
+            self._remaining, self._reset_at = remaining, reset_at
+        return response
+
+    def _send_authorized(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying once after re-authenticating on 401.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            url: URL to request.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            The HTTP response.
+
+        Raises:
+            RateLimitError: If the response is a 429.
+        """
+        response = self._send(method, url, **kwargs)
+        if self._handle_auth_error(response):
+            response = self._send(method, url, **kwargs)
+        handle_rate_limit(response)
+        return response
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Call the SoundCloud API and decode the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API path such as ``/tracks``, or an absolute URL.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            Decoded JSON body, or None for an empty response.
+
+        Raises:
+            RateLimitError: If the response is a 429.
+            httpx.HTTPStatusError: For other error responses.
+        """
+        url = path if path.startswith("https://") else f"{self.API_BASE}{path}"
+        response = self._send_authorized(method, url, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content) if response.content else None
+
+    async def _asend(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Async counterpart of _send.
+
+        Honours the same shared rate-limit window, quota throttling and
+        token bucket. Getting the auth headers can refresh the token or
+        start the browser flow, so it runs in a worker thread rather than
+        on the event loop.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            url: URL to request.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            The HTTP response.
+        """
+        headers = await asyncio.to_thread(self._get_headers)
+
+        await wait_for_rate_limit_async()
+        delay = throttle_delay(self._remaining, self._reset_at)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        async with self._limiter:
+            response = await self._ahttp.request(method, url, headers=headers, **kwargs)
+
+        remaining, reset_at = parse_rate_limit_headers(response)
+        if remaining is not None:
+            self._remaining, self._reset_at = remaining, reset_at
+        return response
+
+    async def _arequest(self, method: str, path: str, **kwargs) -> Any:
+        """Async counterpart of _request for concurrent callers.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE).
+            path: API path such as ``/tracks``, or an absolute URL.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            Decoded JSON body, or None for an empty response.
+
+        Raises:
+            RateLimitError: If the response is a 429.
+            httpx.HTTPStatusError: For other error responses.
+        """
+        url = path if path.startswith("https://") else f"{self.API_BASE}{path}"
+        response = await self._asend(method, url, **kwargs)
+        if await asyncio.to_thread(self._handle_auth_error, response):
+            response = await self._asend(method, url, **kwargs)
+        handle_rate_limit(response)
+        response.raise_for_status()
+        return orjson.loads(response.content) if response.content else None
 
     def _handle_auth_error(self, response: httpx.Response) -> bool:
         """Handle 401 Unauthorized by attempting token refresh.
@@ -323,97 +608,160 @@ class SoundCloudClient:
     def user_id(self) -> int:
         """Get the authenticated user's ID."""
         if self._user_id is None:
-            response = self._request("GET", f"{self.API_BASE}/me")
-            handle_rate_limit(response)
-            response.raise_for_status()
-            self._user_id = response.json()["id"]
+            self._user_id = self._request("GET", "/me")["id"]
         return self._user_id
 
     def search_tracks(
         self,
         query: str,
         limit: int = 10,
+        fresh: bool = False,
     ) -> list[SearchResult]:
         """Search for tracks matching a query.
 
+        Results are remembered for SEARCH_CACHE_TTL seconds per query.
+
         Args:
             query: Search query string.
             limit: Maximum number of results.
+            fresh: Skip the cache and always query the API.
 
         Returns:
             List of SearchResult objects.
         """
-        response = self._request(
-            "GET",
-            f"{self.API_BASE}/tracks",
-            params={"q": query, "limit": limit},
-        )
-        if self._handle_auth_error(response):
-            response = self._request(
-                "GET",
-                f"{self.API_BASE}/tracks",
-                params={"q": query, "limit": limit},
-            )
-        handle_rate_limit(response)
-        response.raise_for_status()
-        items = response.json()
+        key = (query, limit)
+        if not fresh and (cached := self._search_cache.get(key)) is not None:
+            return list(cached)
+
+        items = self._request("GET", "/tracks", params={"q": query, "limit": limit})
+        results = self._search_results(items)
+        self._search_cache.set(key, tuple(results))
+        return results
 
-        results = []
-        for item in items:
-            track = self._parse_track(item)
-            is_verified = item.get("user", {}).get("verified", False)
-            results.append(SearchResult(track=track, is_verified=is_verified))
+    async def async_search_tracks(
+        self,
+        query: str,
+        limit: int = 10,
+        fresh: bool = False,
+    ) -> list[SearchResult]:
+        """Search for tracks without blocking, for use with asyncio.gather.
+
+        Results are remembered for SEARCH_CACHE_TTL seconds per query.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results.
+            fresh: Skip the cache and always query the API.
 
+        Returns:
+            List of SearchResult objects.
+        """
+        key = (query, limit)
+        if not fresh and (cached := self._search_cache.get(key)) is not None:
+            return list(cached)
+
+        items = await self._arequest("GET", "/tracks", params={"q": query, "limit": limit})
+        results = self._search_results(items)
+        self._search_cache.set(key, tuple(results))
         return results
 
-    def get_user_playlists(self, prefix: str | None = None) -> list[SoundCloudPlaylist]:
-        """Get all playlists owned by the current user.
+    def _search_results(self, items: list[dict]) -> list[SearchResult]:
+        """Wrap raw search hits in SearchResult objects.
 
         Args:
-            prefix: Optional prefix to filter playlists by title.
+            items: Track dicts from the search endpoint.
 
         Returns:
-            List of SoundCloudPlaylist objects.
+            List of SearchResult objects.
         """
-        playlists = []
+        return [
+            SearchResult(
+                track=self._parse_track(item),
+                is_verified=item.get("user", {}).get("verified", False),
+            )
+            for item in items
+        ]
 
-        response = self._request("GET", f"{self.API_BASE}/me/playlists")
-        if self._handle_auth_error(response):
-            response = self._request("GET", f"{self.API_BASE}/me/playlists")
-        handle_rate_limit(response)
-        response.raise_for_status()
-        items = response.json()
+    def _paginate(self, path: str, params: dict | None = None) -> Iterator[dict]:
+        """Iterate over every item of a paginated collection endpoint.
+
+        Requests pages with ``linked_partitioning`` and follows each page's
+        ``next_href`` cursor until the collection is exhausted.
+
+        Args:
+            path: Collection endpoint path.
+            params: Optional extra query parameters for the first page.
+
+        Yields:
+            Raw item dicts, page by page.
+        """
+        page_params: dict | None = {
+            **(params or {}),
+            "linked_partitioning": 1,
+            "limit": PAGE_SIZE,
+        }
+        next_url: str | None = path
+        while next_url:
+            data = self._request("GET", next_url, params=page_params)
+            yield from data.get("collection", [])
+            next_url = data.get("next_href")
+            page_params = None
+
+    def get_user_playlists(self, prefix: str | None = None) -> Iterator[SoundCloudPlaylist]:
+        """Get all playlists owned by the current user.
+
+        Pages are fetched lazily, so callers that stop early never request
+        the remaining pages.
 
-        for item in items:
+        Args:
+            prefix: Optional prefix to filter playlists by title.
+
+        Yields:
+            SoundCloudPlaylist objects.
+        """
+        for item in self._paginate("/me/playlists"):
             if prefix and not item["title"].startswith(prefix):
                 continue
 
-            playlists.append(
-                SoundCloudPlaylist(
-                    id=item["id"],
-                    permalink_url=item["permalink_url"],
-                    title=item["title"],
-                    user_id=item["user"]["id"],
-                    track_count=item["track_count"],
-                    is_public=item.get("sharing", "public") == "public",
-                )
+            yield SoundCloudPlaylist(
+                id=item["id"],
+                permalink_url=item["permalink_url"],
+                title=item["title"],
+                user_id=item["user"]["id"],
+                track_count=item["track_count"],
+                is_public=item.get("sharing", "public") == "public",
             )
 
-        return playlists
-
     def find_playlist_by_name(self, name: str) -> SoundCloudPlaylist | None:
         """Find a playlist by exact name match.
 
+        Playlists are indexed by title as pages are read, so repeated
+        lookups are answered from memory and only unseen pages are fetched.
+
         Args:
             name: Playlist name to search for.
 
         Returns:
             SoundCloudPlaylist if found, None otherwise.
         """
-        playlists = self.get_user_playlists()
-        for playlist in playlists:
-            if playlist.title == name:
-                return playlist
+        if self._playlist_index is None:
+            self._playlist_index = {}
+            self._playlist_pages = self.get_user_playlists()
+
+        playlist = self._playlist_index.get(name)
+        if playlist is not None:
+            return playlist
+
+        try:
+            for playlist in self._playlist_pages:
+                self._playlist_index.setdefault(playlist.title, playlist)
+                if playlist.title == name:
+                    return playlist
+        except Exception:
+            # The page generator is finished after an error, so drop the
+            # partial index and start over on the next lookup.
+            self._playlist_index = None
+            raise
         return None
 
     def create_playlist(
@@ -441,14 +789,9 @@ class SoundCloudClient:
             }
         }
 
-        response = self._request("POST", f"{self.API_BASE}/playlists", json=data)
-        if self._handle_auth_error(response):
-            response = self._request("POST", f"{self.API_BASE}/playlists", json=data)
-        handle_rate_limit(response)
-        response.raise_for_status()
-        result = response.json()
+        result = self._request("POST", "/playlists", json=data)
 
-        return SoundCloudPlaylist(
+        playlist = SoundCloudPlaylist(
             id=result["id"],
             permalink_url=result["permalink_url"],
             title=result["title"],
@@ -456,6 +799,9 @@ class SoundCloudClient:
             track_count=0,
             is_public=public,
         )
+        if self._playlist_index is not None:
+            self._playlist_index.setdefault(playlist.title, playlist)
+        return playlist
 
     def delete_playlist(self, playlist_id: int) -> None:
         """Delete a playlist.
@@ -463,11 +809,26 @@ class SoundCloudClient:
         Args:
             playlist_id: SoundCloud playlist ID.
         """
-        response = self._request("DELETE", f"{self.API_BASE}/playlists/{playlist_id}")
-        if self._handle_auth_error(response):
-            response = self._request("DELETE", f"{self.API_BASE}/playlists/{playlist_id}")
-        handle_rate_limit(response)
-        response.raise_for_status()
+        self._request("DELETE", f"/playlists/{playlist_id}")
+        self._playlist_track_ids.pop(playlist_id, None)
+        if self._playlist_index is not None:
+            self._playlist_index = {
+                title: playlist
+                for title, playlist in self._playlist_index.items()
+                if playlist.id != playlist_id
+            }
+
+    def iter_playlist_tracks(self, playlist_id: int) -> Iterator[SoundCloudTrack]:
+        """Stream the tracks in a playlist page by page.
+
+        Args:
+            playlist_id: SoundCloud playlist ID.
+
+        Yields:
+            SoundCloudTrack objects.
+        """
+        for item in self._paginate(f"/playlists/{playlist_id}/tracks"):
+            yield self._parse_track(item)
 
     def get_playlist_tracks(self, playlist_id: int) -> list[SoundCloudTrack]:
         """Get all tracks in a playlist.
@@ -478,20 +839,86 @@ class SoundCloudClient:
         Returns:
             List of SoundCloudTrack objects.
         """
-        response = self._request("GET", f"{self.API_BASE}/playlists/{playlist_id}")
-        if self._handle_auth_error(response):
-            response = self._request("GET", f"{self.API_BASE}/playlists/{playlist_id}")
-        handle_rate_limit(response)
-        response.raise_for_status()
-        data = response.json()
+        tracks = [self._parse_track(item) for item in self._playlist_track_items(playlist_id)]
+        self._playlist_track_ids[playlist_id] = [t.id for t in tracks]
+        return tracks
 
-        tracks = []
-        for item in data.get("tracks", []):
-            track = self._parse_track(item)
-            tracks.append(track)
+    def get_playlist_track_ids(self, playlist_id: int) -> list[int]:
+        """Get the IDs of all tracks in a playlist.
 
+        Cheaper than get_playlist_tracks for callers that only diff IDs,
+        since no SoundCloudTrack objects are built.
+
+        Args:
+            playlist_id: SoundCloud playlist ID.
+
+        Returns:
+            Track IDs in playlist order.
+        """
+        track_ids = [item["id"] for item in self._playlist_track_items(playlist_id)]
+        self._playlist_track_ids[playlist_id] = track_ids
+        return list(track_ids)
+
+    def _playlist_track_items(self, playlist_id: int) -> list[dict]:
+        """Get the raw track dicts of a playlist.
+
+        SoundCloud has no playlist version tag, so contents are cached on
+        disk keyed by the playlist's track count and last-modified time,
+        for PLAYLIST_TRACKS_CACHE_TTL seconds. Writing a new version drops
+        the older ones.
+
+        Args:
+            playlist_id: SoundCloud playlist ID.
+
+        Returns:
+            Raw track dicts in playlist order.
+        """
+        meta = self._request("GET", f"/playlists/{playlist_id}", params={"show_tracks": "false"})
+        prefix = f"playlist_tracks:{playlist_id}:"
+        key = f"{prefix}{meta.get('track_count')}:{meta.get('last_modified')}"
+
+        cached = self._tracks_cache.get(key)
+        if cached and cached.is_fresh(PLAYLIST_TRACKS_CACHE_TTL):
+            items = cached.body
+        else:
+            items = list(self._paginate(f"/playlists/{playlist_id}/tracks"))
+            self._tracks_cache.set(key, items, supersedes=prefix)
+        return items
+
+    async def async_get_playlist_tracks(self, playlist_id: int) -> list[SoundCloudTrack]:
+        """Get all tracks in a playlist without blocking.
+
+        Args:
+            playlist_id: SoundCloud playlist ID.
+
+        Returns:
+            List of SoundCloudTrack objects.
+        """
+        tracks = []
+        page_params: dict | None = {"linked_partitioning": 1, "limit": PAGE_SIZE}
+        next_url: str | None = f"/playlists/{playlist_id}/tracks"
+        while next_url:
+            data = await self._arequest("GET", next_url, params=page_params)
+            tracks.extend(self._parse_track(item) for item in data.get("collection", []))
+            next_url = data.get("next_href")
+            page_params = None
+
+        self._playlist_track_ids[playlist_id] = [t.id for t in tracks]
         return tracks
 
+    def _current_track_ids(self, playlist_id: int) -> list[int]:
+        """Get the playlist's track IDs, fetching only if not already known.
+
+        Args:
+            playlist_id: SoundCloud playlist ID.
+
+        Returns:
+            Track IDs in playlist order.
+        """
+        if playlist_id not in self._playlist_track_ids:
+            self.get_playlist_tracks(playlist_id)
+        return self._playlist_track_ids[playlist_id]
+
     def set_playlist_tracks(
         self,
         playlist_id: int,
@@ -499,63 +926,94 @@ class SoundCloudClient:
     ) -> None:
         """Set the tracks in a playlist (replaces all existing tracks).
 
+        If SoundCloud rejects the list (422), the accepted IDs are found by
+        bisection and written instead. Bisection probes overwrite the
+        playlist, so it always ends with a full write: the accepted IDs, or
+        the previous contents if probing failed or accepted none.
+
         Args:
             playlist_id: SoundCloud playlist ID.
             track_ids: List of track IDs to set.
 
         Raises:
-            httpx.HTTPStatusError: If the request fails.
+            httpx.HTTPStatusError: If the request, or the final write after
+                a rejection, fails.
+            RateLimitError: If rate limited while probing.
         """
-        data = {
-            "playlist": {
-                "tracks": [{"id": tid} for tid in track_ids],
-            }
-        }
-
-        response = self._request("PUT", f"{self.API_BASE}/playlists/{playlist_id}", json=data)
-        if self._handle_auth_error(response):
-            response = self._request("PUT", f"{self.API_BASE}/playlists/{playlist_id}", json=data)
-        handle_rate_limit(response)
-        if response.status_code == 422:
-            valid_ids = self._add_tracks_individually(playlist_id, track_ids)
-            if valid_ids:
-                data["playlist"]["tracks"] = [{"id": tid} for tid in valid_ids]
-                retry_response = self._request(
-                    "PUT",
-                    f"{self.API_BASE}/playlists/{playlist_id}",
-                    json=data,
-                )
-                handle_rate_limit(retry_response)
-        else:
+        url = f"{self.API_BASE}/playlists/{playlist_id}"
+        response = self._send_authorized("PUT", url, json=self._playlist_body(track_ids))
+        if response.status_code != 422:
             response.raise_for_status()
+            self._playlist_track_ids[playlist_id] = list(track_ids)
+            return
 
-    def _add_tracks_individually(
+        # The rejected PUT left the playlist as it was; keep its contents so
+        # a failed or empty bisection can put them back.
+        previous_ids = list(self._current_track_ids(playlist_id))
+        final_ids = previous_ids
+        self._playlist_track_ids.pop(playlist_id, None)
+        try:
+            final_ids = self._find_valid_ids(playlist_id, track_ids) or previous_ids
+        finally:
+            final = self._send_authorized("PUT", url, json=self._playlist_body(final_ids))
+            if final.status_code == 200:
+                self._playlist_track_ids[playlist_id] = final_ids
+        final.raise_for_status()
+
+    @staticmethod
+    def _playlist_body(track_ids: list[int]) -> dict:
+        """Build the PUT body that sets a playlist's tracks."""
+        return {"playlist": {"tracks": [{"id": tid} for tid in track_ids]}}
+
+    def _find_valid_ids(
         self,
         playlist_id: int,
         track_ids: list[int],
     ) -> list[int]:
-        """Try adding tracks one by one to find valid IDs.
+        """Isolate the track IDs SoundCloud accepts by bisection.
+
+        Called after a PUT of the full list was rejected. Each round PUTs
+        every still-ambiguous chunk concurrently, leaving the playlist with
+        an arbitrary chunk, so the caller must write the final list itself; accepted chunks are kept
+        and rejected ones are split in half for the next round, so a few
+        bad IDs cost O(log N) rounds instead of one request per track.
 
         Args:
             playlist_id: SoundCloud playlist ID.
-            track_ids: List of track IDs to try.
+            track_ids: Track IDs whose full set was rejected.
 
         Returns:
-            List of valid track IDs that were successfully added.
+            Valid track IDs in their original order.
+
+        Raises:
+            RateLimitError: If a probe is rate limited.
         """
-        valid_ids: list[int] = []
-        for tid in track_ids:
-            test_ids = valid_ids + [tid]
-            data = {"playlist": {"tracks": [{"id": t} for t in test_ids]}}
-            response = self._request(
-                "PUT",
-                f"{self.API_BASE}/playlists/{playlist_id}",
-                json=data,
-            )
-            handle_rate_limit(response)
-            if response.status_code == 200:
-                valid_ids.append(tid)
-        return valid_ids
+        url = f"{self.API_BASE}/playlists/{playlist_id}"
+
+        def is_accepted(chunk: list[int]) -> bool:
+            response = self._send_authorized("PUT", url, json=self._playlist_body(chunk))
+            return response.status_code == 200
+
+        def halves(start: int, chunk: list[int]) -> list[tuple[int, list[int]]]:
+            mid = len(chunk) // 2
+            return [(start, chunk[:mid]), (start + mid, chunk[mid:])]
+
+        valid: list[tuple[int, list[int]]] = []
+        pending = halves(0, track_ids) if len(track_ids) > 1 else []
+
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            while pending:
+                accepted = executor.map(is_accepted, [chunk for _, chunk in pending])
+                next_round = []
+                for (start, chunk), ok in zip(pending, accepted, strict=True):
+                    if ok:
+                        valid.append((start, chunk))
+                    elif len(chunk) > 1:
+                        next_round.extend(halves(start, chunk))
+                pending = next_round
+
+        valid.sort()
+        return [tid for _, chunk in valid for tid in chunk]
 
     def add_tracks_to_playlist(
         self,
@@ -564,13 +1022,16 @@ class SoundCloudClient:
     ) -> None:
         """Add tracks to a playlist.
 
+        Uses the track IDs last read or written for the playlist, so no
+        extra GET is needed after get_playlist_tracks or a previous edit.
+
         Args:
             playlist_id: SoundCloud playlist ID.
             track_ids: List of track IDs to add.
         """
-        current_tracks = self.get_playlist_tracks(playlist_id)
-        current_ids = [t.id for t in current_tracks]
-        all_ids = current_ids + [tid for tid in track_ids if tid not in current_ids]
+        current_ids = self._current_track_ids(playlist_id)
+        current_set = set(current_ids)
+        all_ids = current_ids + [tid for tid in track_ids if tid not in current_set]
         self.set_playlist_tracks(playlist_id, all_ids)
 
     def remove_tracks_from_playlist(
@@ -584,8 +1045,10 @@ class SoundCloudClient:
             playlist_id: SoundCloud playlist ID.
             track_ids: List of track IDs to remove.
         """
-        current_tracks = self.get_playlist_tracks(playlist_id)
-        remaining_ids = [t.id for t in current_tracks if t.id not in track_ids]
+        remove_set = set(track_ids)
+        remaining_ids = [
+            tid for tid in self._current_track_ids(playlist_id) if tid not in remove_set
+        ]
         self.set_playlist_tracks(playlist_id, remaining_ids)
 
     def _parse_track(self, item: dict) -> SoundCloudTrack:
@@ -597,21 +1060,22 @@ class SoundCloudClient:
         Returns:
             Parsed SoundCloudTrack object.
         """
-        user = item.get("user") or {}
-        publisher_metadata = item.get("publisher_metadata") or {}
+        get = item.get
+        user = get("user") or {}
+        user_get = user.get
         artist = (
-            publisher_metadata.get("artist")
-            or user.get("username")
+            (get("publisher_metadata") or {}).get("artist")
+            or user_get("username")
             or "Unknown Artist"
         )
         return SoundCloudTrack(
             id=item["id"],
-            permalink_url=item.get("permalink_url", ""),
-            title=item.get("title", ""),
+            permalink_url=get("permalink_url", ""),
+            title=get("title", ""),
             artist=artist,
-            playback_count=item.get("playback_count", 0) or 0,
-            likes_count=item.get("likes_count", 0) or 0,
-            duration_ms=item.get("duration", 0),
-            user_id=user.get("id", 0),
-            is_streamable=item.get("streamable", True),
+            playback_count=get("playback_count") or 0,
+            likes_count=get("likes_count") or 0,
+            duration_ms=get("duration", 0),
+            user_id=user_get("id", 0),
+            is_streamable=get("streamable", True),
         )
@@ -1,18 +1,40 @@
 """Spotify API client for playlist management and track search."""
 
+import asyncio
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-
-import spotipy
-from spotipy.exceptions import SpotifyException
-from spotipy.oauth2 import SpotifyOAuth
-
+from typing import Any
+
+import httpx
+import orjson
+
+from song_automations.clients.cache import ResponseCache, TTLCache
+from song_automations.clients.http import (
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    RateLimitError,
+    handle_rate_limit,
+    wait_for_rate_limit_async,
+)
 from song_automations.config import Settings
 
 PLAYLIST_CACHE_TTL = 300  # 5 minutes
-
-
-@dataclass
+SPOTIFY_API_URL = "https://api.spotify.com/v1"
+PLAYLIST_TRACK_FIELDS = (
+    "items(track(id,uri,name,artists,album,popularity,duration_ms,is_playable)),next,total"
+)
+PLAYLIST_PAGE_SIZE = 100
+PAGE_WORKERS = 4
+VERIFIED_FOLLOWER_THRESHOLD = 10000
+VERIFIED_CACHE_SIZE = 10000
+ARTISTS_BATCH_SIZE = 50
+SEARCH_CACHE_SIZE = 2048
+SEARCH_CACHE_TTL = 300  # 5 minutes
+
+
+@dataclass(slots=True, frozen=True)
 class CachedPlaylists:
     """Cache entry for user playlists.
 
@@ -29,7 +51,7 @@ class CachedPlaylists:
         return time.time() - self.timestamp < PLAYLIST_CACHE_TTL
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpotifyTrack:
     """Represents a Spotify track.
 
@@ -54,14 +76,18 @@ class SpotifyTrack:
     popularity: int
     duration_ms: int
     is_playable: bool
+    _full_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_full_title", f"{self.artist} - {self.name}")
 
     @property
     def full_title(self) -> str:
         """Full title for display."""
-        return f"{self.artist} - {self.name}"
+        return self._full_title
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpotifyPlaylist:
     """Represents a Spotify playlist.
 
@@ -82,7 +108,7 @@ class SpotifyPlaylist:
     public: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Represents a search result with scoring metadata.
 
@@ -111,11 +137,14 @@ class SpotifyClient:
     ]
 
     def __init__(self, settings: Settings) -> None:
+        import spotipy
+        from spotipy.oauth2 import SpotifyOAuth
+
         self._settings = settings
         cache_path = settings.data_dir / ".spotify_cache"
         settings.data_dir.mkdir(parents=True, exist_ok=True)
 
-        auth_manager = SpotifyOAuth(
+        self._auth_manager = SpotifyOAuth(
             client_id=settings.spotify_client_id,
             client_secret=settings.spotify_client_secret,
             redirect_uri=settings.spotify_redirect_uri,
@@ -123,9 +152,89 @@ class SpotifyClient:
             cache_path=str(cache_path),
             open_browser=True,
         )
-        self._client = spotipy.Spotify(auth_manager=auth_manager)
+        self._client = spotipy.Spotify(auth_manager=self._auth_manager)
         self._user_id: str | None = None
         self._playlist_cache = CachedPlaylists()
+        self._verified_cache: OrderedDict[str, bool] = OrderedDict()
+        self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        self._async_http_client: httpx.AsyncClient | None = None
+        self._tracks_cache = ResponseCache(settings.cache_dir / "spotify.db")
+
+    async def __aenter__(self) -> "SpotifyClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit async context manager and close the async HTTP client."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client if one was opened."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+
+    @property
+    def _ahttp(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, creating it on first use."""
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(
+                base_url=SPOTIFY_API_URL,
+                http2=True,
+                timeout=DEFAULT_TIMEOUT,
+                limits=DEFAULT_LIMITS,
+            )
+        return self._async_http_client
+
+    def _bearer_token(self, refresh: bool = False) -> str:
+        """Get an access token from the shared auth manager.
+
+        Blocking: this may refresh the token over the network or start the
+        browser OAuth flow, so async callers run it in a worker thread.
+
+        Args:
+            refresh: Refresh the cached token first, after it was rejected.
+
+        Returns:
+            The access token.
+        """
+        if refresh:
+            cached = self._auth_manager.get_cached_token()
+            if cached and cached.get("refresh_token"):
+                self._auth_manager.refresh_access_token(cached["refresh_token"])
+        return self._auth_manager.get_access_token(as_dict=False)
+
+    async def _arequest(self, method: str, path: str, **kwargs) -> Any:
+        """Make an async request to the Spotify Web API.
+
+        The access token comes from the same auth manager as the spotipy
+        client, so both share one token cache and refresh cycle. Requests
+        wait out the shared rate-limit window, and a 401 is retried once
+        with a refreshed token.
+
+        Args:
+            method: HTTP method.
+            path: API path relative to the v1 base URL, or an absolute URL.
+            **kwargs: Additional arguments passed to httpx.
+
+        Returns:
+            Decoded JSON body, or None for an empty response.
+
+        Raises:
+            RateLimitError: If the response is a 429.
+            httpx.HTTPStatusError: For other error responses.
+        """
+        for refresh in (False, True):
+            token = await asyncio.to_thread(self._bearer_token, refresh)
+            await wait_for_rate_limit_async()
+            response = await self._ahttp.request(
+                method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs
+            )
+            if response.status_code != 401:
+                break
+        handle_rate_limit(response)
+        response.raise_for_status()
+        return orjson.loads(response.content) if response.content else None
 
     @property
     def user_id(self) -> str:
@@ -138,41 +247,127 @@ class SpotifyClient:
         self,
         query: str,
         limit: int = 10,
+        fresh: bool = False,
     ) -> list[SearchResult]:
         """Search for tracks matching a query.
 
+        Results are remembered for SEARCH_CACHE_TTL seconds per query.
+
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            fresh: Skip the cache and always query the API.
 
         Returns:
             List of SearchResult objects.
         """
-        results = self._client.search(q=query, type="track", limit=limit)
-        items = results["tracks"]["items"]
+        from spotipy.exceptions import SpotifyException
 
-        artist_ids = list({
-            item["artists"][0]["id"]
-            for item in items
-            if item["artists"]
-        })
+        key = (query, limit)
+        if not fresh and (cached := self._search_cache.get(key)) is not None:
+            return list(cached)
 
-        verified_artists: set[str] = set()
-        if artist_ids:
+        response = self._client.search(q=query, type="track", limit=limit)
+        items = response["tracks"]["items"]
+
+        unknown = self._unverified_artist_ids(items)
+        for i in range(0, len(unknown), ARTISTS_BATCH_SIZE):
+            batch = unknown[i : i + ARTISTS_BATCH_SIZE]
             try:
-                artists_data = self._client.artists(artist_ids)
-                for artist in artists_data.get("artists", []):
-                    if artist and artist.get("followers", {}).get("total", 0) > 10000:
-                        verified_artists.add(artist["id"])
+                self._remember_verified(batch, self._client.artists(batch))
             except SpotifyException:
                 pass
 
+        results = self._search_results(items)
+        self._search_cache.set(key, tuple(results))
+        return results
+
+    async def async_search_tracks(
+        self,
+        query: str,
+        limit: int = 10,
+        fresh: bool = False,
+    ) -> list[SearchResult]:
+        """Search for tracks without blocking, for use with asyncio.gather.
+
+        Results are remembered for SEARCH_CACHE_TTL seconds per query.
+
+        Args:
+            query: Search query string.
+            limit: Maximum number of results to return.
+            fresh: Skip the cache and always query the API.
+
+        Returns:
+            List of SearchResult objects.
+        """
+        key = (query, limit)
+        if not fresh and (cached := self._search_cache.get(key)) is not None:
+            return list(cached)
+
+        response = await self._arequest(
+            "GET", "/search", params={"q": query, "type": "track", "limit": limit}
+        )
+        items = response["tracks"]["items"]
+
+        unknown = self._unverified_artist_ids(items)
+        for i in range(0, len(unknown), ARTISTS_BATCH_SIZE):
+            batch = unknown[i : i + ARTISTS_BATCH_SIZE]
+            try:
+                artists_data = await self._arequest(
+                    "GET", "/artists", params={"ids": ",".join(batch)}
+                )
+            except (httpx.HTTPStatusError, RateLimitError):
+                continue
+            self._remember_verified(batch, artists_data)
+
+        results = self._search_results(items)
+        self._search_cache.set(key, tuple(results))
+        return results
+
+    def _unverified_artist_ids(self, items: list[dict]) -> list[str]:
+        """Collect primary artist IDs of search hits not yet in the verified cache."""
+        return list({
+            item["artists"][0]["id"]
+            for item in items
+            if item["artists"] and item["artists"][0]["id"] not in self._verified_cache
+        })
+
+    def _remember_verified(self, artist_ids: list[str], artists_data: dict) -> None:
+        """Record which artists count as verified, evicting the least recently used.
+
+        Args:
+            artist_ids: IDs that were looked up.
+            artists_data: Response of the several-artists endpoint.
+        """
+        followed = {
+            artist["id"]
+            for artist in artists_data.get("artists", [])
+            if artist
+            and artist.get("followers", {}).get("total", 0) > VERIFIED_FOLLOWER_THRESHOLD
+        }
+        for artist_id in artist_ids:
+            self._verified_cache[artist_id] = artist_id in followed
+        while len(self._verified_cache) > VERIFIED_CACHE_SIZE:
+            self._verified_cache.popitem(last=False)
+
+    def _search_results(self, items: list[dict]) -> list[SearchResult]:
+        """Build search results, flagging tracks by well-followed artists.
+
+        Args:
+            items: Track dicts from the search endpoint.
+
+        Returns:
+            List of SearchResult objects.
+        """
         search_results = []
         for item in items:
             track = self._parse_track(item)
             is_verified = False
             if item["artists"]:
-                is_verified = item["artists"][0]["id"] in verified_artists
+                artist_id = item["artists"][0]["id"]
+                is_verified = self._verified_cache.get(artist_id, False)
+                if artist_id in self._verified_cache:
+                    self._verified_cache.move_to_end(artist_id)
             search_results.append(SearchResult(track=track, is_verified=is_verified))
 
         return search_results
@@ -294,29 +489,133 @@ class SpotifyClient:
         Returns:
             List of SpotifyTrack objects.
         """
-        tracks = []
-        offset = 0
-        limit = 100
+        return [self._parse_track(item) for item in self._playlist_track_items(playlist_id)]
 
-        while True:
-            results = self._client.playlist_tracks(
-                playlist_id,
-                limit=limit,
-                offset=offset,
-                fields="items(track(id,uri,name,artists,album,popularity,duration_ms,is_playable)),next",
-            )
+    def get_playlist_track_ids(self, playlist_id: str) -> list[str]:
+        """Get the IDs of all tracks in a playlist.
 
-            for item in results["items"]:
-                if item["track"] is None:
-                    continue
-                track = self._parse_track(item["track"])
-                tracks.append(track)
+        Cheaper than get_playlist_tracks for callers that only diff IDs,
+        since no SpotifyTrack objects are built.
 
-            if not results["next"]:
-                break
-            offset += limit
+        Args:
+            playlist_id: Spotify playlist ID.
+
+        Returns:
+            Track IDs in playlist order.
+        """
+        return [item["id"] for item in self._playlist_track_items(playlist_id)]
+
+    def _playlist_track_items(self, playlist_id: str) -> list[dict]:
+        """Get the raw track dicts of a playlist.
+
+        Contents are cached on disk by the playlist's snapshot ID, which
+        changes on every edit, so an unchanged playlist costs one request.
+        Only the latest snapshot of each playlist is kept.
+        Otherwise the first page reports the total size and the remaining
+        pages are fetched concurrently.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+
+        Returns:
+            Raw track dicts in playlist order.
+        """
+        snapshot_id = self._client.playlist(playlist_id, fields="snapshot_id")["snapshot_id"]
+        prefix = f"playlist_tracks:{playlist_id}:"
+        key = f"{prefix}{snapshot_id}"
+        cached = self._tracks_cache.get(key)
+        if cached:
+            return cached.body
+
+        first = self._fetch_playlist_page(playlist_id, 0)
+        offsets = range(PLAYLIST_PAGE_SIZE, first["total"], PLAYLIST_PAGE_SIZE)
+
+        pages = [first]
+        if offsets:
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+                pages.extend(
+                    executor.map(
+                        lambda offset: self._fetch_playlist_page(playlist_id, offset),
+                        offsets,
+                    )
+                )
 
-        return tracks
+        items = self._track_items(pages)
+        self._tracks_cache.set(key, items, supersedes=prefix)
+        return items
+
+    def _fetch_playlist_page(self, playlist_id: str, offset: int) -> dict:
+        """Fetch one page of playlist items.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+            offset: Index of the first item on the page.
+
+        Returns:
+            Raw page response.
+        """
+        return self._client.playlist_tracks(
+            playlist_id,
+            limit=PLAYLIST_PAGE_SIZE,
+            offset=offset,
+            fields=PLAYLIST_TRACK_FIELDS,
+        )
+
+    @staticmethod
+    def _track_items(pages: list[dict]) -> list[dict]:
+        """Collect raw track dicts from pages in order, skipping removed tracks.
+
+        Args:
+            pages: Page responses ordered by offset.
+
+        Returns:
+            Raw track dicts.
+        """
+        return [
+            item["track"]
+            for page in pages
+            for item in page["items"]
+            if item["track"] is not None
+        ]
+
+    async def async_get_playlist_tracks(self, playlist_id: str) -> list[SpotifyTrack]:
+        """Get all tracks in a playlist without blocking.
+
+        Args:
+            playlist_id: Spotify playlist ID.
+
+        Returns:
+            List of SpotifyTrack objects.
+        """
+        semaphore = asyncio.Semaphore(PAGE_WORKERS)
+
+        async def fetch(offset: int) -> dict:
+            async with semaphore:
+                return await self._arequest(
+                    "GET",
+                    f"/playlists/{playlist_id}/tracks",
+                    params={
+                        "limit": PLAYLIST_PAGE_SIZE,
+                        "offset": offset,
+                        "fields": PLAYLIST_TRACK_FIELDS,
+                    },
+                )
+
+        playlist = await self._arequest(
+            "GET", f"/playlists/{playlist_id}", params={"fields": "snapshot_id"}
+        )
+        prefix = f"playlist_tracks:{playlist_id}:"
+        key = f"{prefix}{playlist['snapshot_id']}"
+        cached = self._tracks_cache.get(key)
+        if cached:
+            return [self._parse_track(item) for item in cached.body]
+
+        first = await fetch(0)
+        offsets = range(PLAYLIST_PAGE_SIZE, first["total"], PLAYLIST_PAGE_SIZE)
+        rest = await asyncio.gather(*(fetch(offset) for offset in offsets))
+        items = self._track_items([first, *rest])
+        self._tracks_cache.set(key, items, supersedes=prefix)
+        return [self._parse_track(item) for item in items]
 
     def add_tracks_to_playlist(
         self,
@@ -357,6 +656,7 @@ class SpotifyClient:
         Returns:
             Parsed SpotifyTrack object.
         """
+        get = item.get
         artists = [a["name"] for a in item["artists"]]
         return SpotifyTrack(
             id=item["id"],
@@ -364,8 +664,8 @@ class SpotifyClient:
             name=item["name"],
             artist=artists[0] if artists else "Unknown Artist",
             artists=artists,
-            album=item["album"]["name"] if item.get("album") else "",
-            popularity=item.get("popularity", 0),
-            duration_ms=item.get("duration_ms", 0),
-            is_playable=item.get("is_playable", True),
+            album=(get("album") or {}).get("name", ""),
+            popularity=get("popularity", 0),
+            duration_ms=get("duration_ms", 0),
+            is_playable=get("is_playable", True),
         )
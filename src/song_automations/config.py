@@ -1,11 +1,15 @@
 """Configuration management using Pydantic settings."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Directories ensure_directories has already created in this process.
+_dirs_ready: set[Path] = set()
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -167,12 +171,22 @@ class Settings(BaseSettings):
         return self.data_dir / "song_automations.log"
 
     def ensure_directories(self) -> None:
-        """Create necessary directories if they don't exist."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        """Create necessary directories if they don't exist.
+
+        Directories already created by this process are skipped.
+        """
+        for directory in (self.data_dir, self.cache_dir, self.reports_dir):
+            if directory not in _dirs_ready:
+                directory.mkdir(parents=True, exist_ok=True)
+                _dirs_ready.add(directory)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the application settings singleton."""
     return Settings()
+
+
+def invalidate_settings() -> None:
+    """Drop the cached settings so the next get_settings() reloads them."""
+    get_settings.cache_clear()
@@ -1,12 +1,22 @@
 """Structured logging configuration for song-automations."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Literal
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 
+LOG_LEVELS: dict[LogLevel, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 
 def setup_logging(
     level: LogLevel = "INFO",
@@ -14,6 +24,10 @@ def setup_logging(
 ) -> logging.Logger:
     """Configure and return the application logger.
 
+    Records are handed to a queue and written to stderr and the log file
+    by a background listener thread, so worker threads never block on
+    handler I/O. The listener is flushed and stopped at interpreter exit.
+
     Args:
         level: Logging level.
         log_file: Optional path to log file.
@@ -22,7 +36,7 @@ def setup_logging(
         Configured logger instance.
     """
     logger = logging.getLogger("song_automations")
-    logger.setLevel(getattr(logging, level))
+    logger.setLevel(LOG_LEVELS[level])
 
     if logger.handlers:
         return logger
@@ -35,14 +49,20 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level))
+        file_handler.setLevel(LOG_LEVELS[level])
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -1,11 +1,13 @@
 """Fuzzy matching system optimized for electronic music track matching."""
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Protocol
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 
 class VersionType(Enum):
@@ -24,7 +26,7 @@ class VersionType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedTrack:
     """Parsed components of a track title.
 
@@ -57,7 +59,7 @@ class ParsedTrack:
         return f"{self.artist} {self.base_title}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchResult:
     """Result of matching a track.
 
@@ -86,6 +88,23 @@ class MatchResult:
     matched_artist: str
 
 
+@dataclass(frozen=True, slots=True)
+class Candidate:
+    """A search hit to be scored against a source track.
+
+    Args:
+        title: Candidate track title.
+        artist: Candidate artist name.
+        is_verified: Whether the candidate artist is verified.
+        popularity: Candidate track popularity.
+    """
+
+    title: str
+    artist: str
+    is_verified: bool
+    popularity: int
+
+
 class SearchableTrack(Protocol):
     """Protocol for tracks that can be matched against."""
 
@@ -139,7 +158,43 @@ FEATURING_PATTERNS = [
 
 AMPERSAND_PATTERN = r"\s+&\s+"
 
+# All version patterns as named alternatives of one regex, so a title is
+# scanned once per opening parenthesis instead of once per pattern. Every
+# pattern starts with "\(", which is sliced off and factored out so the scan can jump
+# straight to parentheses. Each alternative maps to its priority, version
+# type and remixer group, if any.
+_VERSION_REGEX = re.compile(
+    r"\((?:" + "|".join(f"(?P<v{i}>{p[2:]})" for i, (p, _) in enumerate(VERSION_PATTERNS)) + ")",
+    re.IGNORECASE,
+)
+_VERSION_ALTERNATIVES = {
+    f"v{i}": (
+        i,
+        vtype,
+        _VERSION_REGEX.groupindex[f"v{i}"] + 1 if re.compile(p).groups else None,
+    )
+    for i, (p, vtype) in enumerate(VERSION_PATTERNS)
+}
+_FEATURING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in FEATURING_PATTERNS]
+_AMPERSAND_PATTERN = re.compile(AMPERSAND_PATTERN)
+_PAREN_PATTERN = re.compile(r"\(([^)]+)\)")
+_DASH_PATTERN = re.compile(r"\s*-\s*")
+
+NORMALIZE_CACHE_SIZE = 4096
 
+# Title scorers other than plain ratio are discounted, so a cheaper score
+# that already beats their ceiling lets them be skipped or cut off early.
+TOKEN_SORT_WEIGHT = 0.95
+PARTIAL_WEIGHT = 0.9
+# Keeps cutoffs a point below the break-even score so float rounding at the
+# boundary never drops a score that would have won the max.
+CUTOFF_SLACK = 1.0
+
+# Words that mark a candidate title as some version rather than the original.
+VERSION_KEYWORDS = ("remix", "mix", "edit", "dub", "version", "rework", "bootleg", "vip")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_text(text: str) -> str:
     """Normalize text for comparison.
 
@@ -149,20 +204,19 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text.
     """
-    text = text.lower().strip()
+    text = " ".join(text.lower().split())
+    text = text.replace("`", "'").replace("„", '"')
 
-    text = re.sub(r"[''`]", "'", text)
-    text = re.sub(r"[""„]", '"', text)
+    if text.startswith("the "):
+        text = text[4:]
 
-    text = re.sub(r"\s+", " ", text)
-
-    text = re.sub(r"^the\s+", "", text)
-
-    text = re.sub(r"\s*-\s*", " ", text)
+    if "-" in text:
+        text = _DASH_PATTERN.sub(" ", text)
 
     return text
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_artist(artist: str) -> str:
     """Normalize artist name for comparison.
 
@@ -174,25 +228,24 @@ def normalize_artist(artist: str) -> str:
     """
     artist = normalize_text(artist)
 
-    for pattern in FEATURING_PATTERNS:
-        parts = re.split(pattern, artist, flags=re.IGNORECASE)
+    for pattern in _FEATURING_PATTERNS:
+        parts = pattern.split(artist)
         if len(parts) > 1:
             artist = parts[0].strip()
             break
 
-    parts = re.split(AMPERSAND_PATTERN, artist)
+    parts = _AMPERSAND_PATTERN.split(artist)
     if len(parts) > 1:
         artist = parts[0].strip()
 
-    if artist.endswith(")") and " (" in artist:
-        idx = artist.rfind(" (")
-        suffix = artist[idx + 2 : -1]
-        if suffix.isdigit():
-            artist = artist[:idx]
+    head, sep, tail = artist.rpartition(" (")
+    if sep and tail.endswith(")") and tail[:-1].isdigit():
+        artist = head
 
     return artist
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def parse_track_title(title: str, artist: str) -> ParsedTrack:
     """Parse a track title into its components.
 
@@ -209,23 +262,27 @@ def parse_track_title(title: str, artist: str) -> ParsedTrack:
     version_type = VersionType.ORIGINAL
     remixer = ""
 
-    for pattern, vtype in VERSION_PATTERNS:
-        match = re.search(pattern, title, flags=re.IGNORECASE)
-        if match:
-            version_type = vtype
-            start, end = match.span()
-            version = title[start:end].strip("()")
+    best_match = None
+    best_rank = len(VERSION_PATTERNS)
+    match = _VERSION_REGEX.search(title)
+    while match:
+        rank = _VERSION_ALTERNATIVES[match.lastgroup][0]
+        if rank < best_rank:
+            best_match, best_rank = match, rank
+        match = _VERSION_REGEX.search(title, match.start() + 1)
 
-            if match.lastindex and match.lastindex >= 1:
-                remixer_match = re.search(pattern, title, flags=re.IGNORECASE)
-                if remixer_match and remixer_match.lastindex:
-                    remixer = remixer_match.group(1).strip()
+    if best_match:
+        _, version_type, remixer_group = _VERSION_ALTERNATIVES[best_match.lastgroup]
+        start, end = best_match.span()
+        version = title[start:end].strip("()")
 
-            base_title = (title[:start] + title[end:]).strip()
-            break
+        if remixer_group:
+            remixer = best_match.group(remixer_group).strip()
+
+        base_title = (title[:start] + title[end:]).strip()
 
     if not version:
-        paren_match = re.search(r"\(([^)]+)\)", title)
+        paren_match = _PAREN_PATTERN.search(title)
         if paren_match:
             version = paren_match.group(1)
             version_type = VersionType.OTHER
@@ -254,11 +311,11 @@ def calculate_artist_score(source_artist: str, candidate_artist: str) -> float:
     source_norm = normalize_artist(source_artist)
     candidate_norm = normalize_artist(candidate_artist)
 
-    ratio = fuzz.ratio(source_norm, candidate_norm) / 100.0
+    ratio = fuzz.ratio(source_norm, candidate_norm)
 
-    token_ratio = fuzz.token_sort_ratio(source_norm, candidate_norm) / 100.0
+    token_ratio = fuzz.token_sort_ratio(source_norm, candidate_norm, score_cutoff=ratio)
 
-    return max(ratio, token_ratio)
+    return max(ratio, token_ratio) / 100.0
 
 
 def calculate_title_score(source_title: str, candidate_title: str) -> float:
@@ -276,11 +333,25 @@ def calculate_title_score(source_title: str, candidate_title: str) -> float:
 
     ratio = fuzz.ratio(source_norm, candidate_norm) / 100.0
 
-    token_ratio = fuzz.token_sort_ratio(source_norm, candidate_norm) / 100.0
+    token_ratio = (
+        fuzz.token_sort_ratio(
+            source_norm, candidate_norm, score_cutoff=ratio * 100 / TOKEN_SORT_WEIGHT - CUTOFF_SLACK
+        )
+        / 100.0
+    )
+    score = max(ratio, token_ratio * TOKEN_SORT_WEIGHT)
+
+    if score >= PARTIAL_WEIGHT:
+        return score
 
-    partial_ratio = fuzz.partial_ratio(source_norm, candidate_norm) / 100.0
+    partial_ratio = (
+        fuzz.partial_ratio(
+            source_norm, candidate_norm, score_cutoff=score * 100 / PARTIAL_WEIGHT - CUTOFF_SLACK
+        )
+        / 100.0
+    )
 
-    return max(ratio, token_ratio * 0.95, partial_ratio * 0.9)
+    return max(score, partial_ratio * PARTIAL_WEIGHT)
 
 
 def normalize_popularity(value: int, max_value: int = 100) -> float:
@@ -311,16 +382,54 @@ def calculate_version_bonus(parsed_track: ParsedTrack, candidate_title: str) ->
     if not parsed_track.version:
         return 0.0
 
-    candidate_lower = candidate_title.lower()
-    version_lower = parsed_track.version.lower()
+    if _version_matches(
+        parsed_track.version.lower(), parsed_track.remixer.lower(), candidate_title.lower()
+    ):
+        return 1.0
+    return 0.0
+
+
+def _version_matches(version_lower: str, remixer_lower: str, candidate_lower: str) -> bool:
+    """Check whether a lowercased candidate title carries the source version.
+
+    Args:
+        version_lower: Lowercased source version, must be non-empty.
+        remixer_lower: Lowercased source remixer, may be empty.
+        candidate_lower: Lowercased candidate title.
+
+    Returns:
+        True if the version or remixer appears in the candidate title.
+    """
+    return version_lower in candidate_lower or bool(
+        remixer_lower and remixer_lower in candidate_lower
+    )
+
+
+def _version_score(
+    version_type: VersionType,
+    version_lower: str,
+    remixer_lower: str,
+    candidate_lower: str,
+) -> float:
+    """Score a lowercased candidate title against a source version.
+
+    Args:
+        version_type: Source version type.
+        version_lower: Lowercased source version, must be non-empty.
+        remixer_lower: Lowercased source remixer, may be empty.
+        candidate_lower: Lowercased candidate title.
 
-    if version_lower in candidate_lower:
+    Returns:
+        1.0 if version matches, 0.0 if neutral, -1.0 if version mismatch.
+    """
+    if _version_matches(version_lower, remixer_lower, candidate_lower):
         return 1.0
 
-    if parsed_track.remixer:
-        remixer_lower = parsed_track.remixer.lower()
-        if remixer_lower in candidate_lower:
-            return 1.0
+    if any(kw in candidate_lower for kw in VERSION_KEYWORDS):
+        return 0.0
+
+    if version_type in (VersionType.REMIX, VersionType.DUB, VersionType.EDIT):
+        return -1.0
 
     return 0.0
 
@@ -343,27 +452,12 @@ def calculate_version_score(parsed_track: ParsedTrack, candidate_title: str) ->
     if not parsed_track.version:
         return 0.0
 
-    candidate_lower = candidate_title.lower()
-    version_lower = parsed_track.version.lower()
-
-    if version_lower in candidate_lower:
-        return 1.0
-
-    if parsed_track.remixer:
-        remixer_lower = parsed_track.remixer.lower()
-        if remixer_lower in candidate_lower:
-            return 1.0
-
-    version_keywords = ["remix", "mix", "edit", "dub", "version", "rework", "bootleg", "vip"]
-    candidate_has_version = any(kw in candidate_lower for kw in version_keywords)
-
-    if candidate_has_version:
-        return 0.0
-
-    if parsed_track.version_type in (VersionType.REMIX, VersionType.DUB, VersionType.EDIT):
-        return -1.0
-
-    return 0.0
+    return _version_score(
+        parsed_track.version_type,
+        parsed_track.version.lower(),
+        parsed_track.remixer.lower(),
+        candidate_title.lower(),
+    )
 
 
 def calculate_label_bonus(
@@ -415,6 +509,7 @@ def score_candidate(
     version_penalty_weight: float = 0.15,
     label: str = "",
     label_bonus_weight: float = 0.10,
+    min_confidence: float = 0.0,
 ) -> tuple[float, float, float, float, float]:
     """Score a candidate track against a source track.
 
@@ -433,13 +528,26 @@ def score_candidate(
         version_penalty_weight: Weight for version mismatch penalty.
         label: Source release label name for label matching bonus.
         label_bonus_weight: Weight for label name appearing in candidate.
+        min_confidence: Score a match must reach to be used. Title scoring
+            is skipped, and title_score left at 0.0, when the artist score
+            is too low for the candidate to reach it.
 
     Returns:
         Tuple of (total_score, artist_score, title_score, verified_bonus, popularity_score).
     """
     artist_score = calculate_artist_score(parsed_track.artist, candidate_artist)
 
-    title_score = calculate_title_score(parsed_track.full_title, candidate_title)
+    other_weights = (
+        title_weight
+        + verified_weight
+        + popularity_weight
+        + version_bonus_weight
+        + label_bonus_weight
+    )
+    if artist_score * artist_weight + other_weights < min_confidence:
+        title_score = 0.0
+    else:
+        title_score = calculate_title_score(parsed_track.full_title, candidate_title)
 
     verified_bonus = 1.0 if is_verified else 0.0
 
@@ -466,6 +574,149 @@ def score_candidate(
     return total_score, artist_score, title_score, verified_bonus, popularity_score
 
 
+def _batch_scores(query: str, choices: list[str], scorer) -> list[float]:
+    """Score one query against many choices in a single rapidfuzz call.
+
+    Args:
+        query: Normalized source string.
+        choices: Normalized candidate strings.
+        scorer: rapidfuzz scorer returning 0-100.
+
+    Returns:
+        Scores from 0.0 to 1.0, in the order of choices.
+    """
+    scores = [0.0] * len(choices)
+    for _, score, index in process.extract(query, choices, scorer=scorer, limit=None):
+        scores[index] = score / 100.0
+    return scores
+
+
+def score_candidates(
+    parsed_track: ParsedTrack,
+    candidates: Sequence[Candidate],
+    max_popularity: int = 100,
+    artist_weight: float = 0.45,
+    title_weight: float = 0.35,
+    verified_weight: float = 0.10,
+    popularity_weight: float = 0.10,
+    version_bonus_weight: float = 0.0,
+    version_penalty_weight: float = 0.15,
+    label: str = "",
+    label_bonus_weight: float = 0.10,
+    min_confidence: float = 0.0,
+) -> list[tuple[float, float, float, float, float]]:
+    """Score every search hit for a source track at once.
+
+    Gives the same results as calling score_candidate per candidate, but
+    normalizes the source once and runs each fuzzy scorer over the whole
+    candidate list in one rapidfuzz call.
+
+    Args:
+        parsed_track: Parsed source track.
+        candidates: Candidates to score.
+        max_popularity: Maximum popularity for normalization.
+        artist_weight: Weight for artist score component.
+        title_weight: Weight for title score component.
+        verified_weight: Weight for verified bonus.
+        popularity_weight: Weight for popularity score.
+        version_bonus_weight: Weight for version/remix matching bonus.
+        version_penalty_weight: Weight for version mismatch penalty.
+        label: Source release label name for label matching bonus.
+        label_bonus_weight: Weight for label name appearing in candidate.
+        min_confidence: Score a match must reach to be used. Title scoring
+            is skipped, and title_score left at 0.0, for candidates whose
+            artist score is too low to reach it.
+
+    Returns:
+        One (total_score, artist_score, title_score, verified_bonus,
+        popularity_score) tuple per candidate, in input order.
+    """
+    source_artist = normalize_artist(parsed_track.artist)
+    source_title = normalize_text(parsed_track.full_title)
+    artists = [normalize_artist(c.artist) for c in candidates]
+    titles = [normalize_text(c.title) for c in candidates]
+
+    artist_scores = [
+        max(ratio, token)
+        for ratio, token in zip(
+            _batch_scores(source_artist, artists, fuzz.ratio),
+            _batch_scores(source_artist, artists, fuzz.token_sort_ratio),
+            strict=True,
+        )
+    ]
+    other_weights = (
+        title_weight
+        + verified_weight
+        + popularity_weight
+        + version_bonus_weight
+        + label_bonus_weight
+    )
+    reachable = [
+        i
+        for i, artist_score in enumerate(artist_scores)
+        if artist_score * artist_weight + other_weights >= min_confidence
+    ]
+    reachable_titles = [titles[i] for i in reachable]
+
+    title_scores = [0.0] * len(candidates)
+    for i, ratio, token in zip(
+        reachable,
+        _batch_scores(source_title, reachable_titles, fuzz.ratio),
+        _batch_scores(source_title, reachable_titles, fuzz.token_sort_ratio),
+        strict=True,
+    ):
+        title_scores[i] = max(ratio, token * TOKEN_SORT_WEIGHT)
+    open_indexes = [i for i in reachable if title_scores[i] < PARTIAL_WEIGHT]
+    if open_indexes:
+        partials = _batch_scores(
+            source_title, [titles[i] for i in open_indexes], fuzz.partial_ratio
+        )
+        for i, partial in zip(open_indexes, partials, strict=True):
+            title_scores[i] = max(title_scores[i], partial * PARTIAL_WEIGHT)
+
+    version_type = parsed_track.version_type
+    version_lower = parsed_track.version.lower()
+    remixer_lower = parsed_track.remixer.lower()
+    label_lower = label.lower().strip()
+    if len(label_lower) < 3:
+        label_lower = ""
+
+    results = []
+    for candidate, artist_score, title_score in zip(
+        candidates, artist_scores, title_scores, strict=True
+    ):
+        verified_bonus = 1.0 if candidate.is_verified else 0.0
+        popularity_score = normalize_popularity(candidate.popularity, max_popularity)
+        candidate_lower = candidate.title.lower()
+        version_score = (
+            _version_score(version_type, version_lower, remixer_lower, candidate_lower)
+            if version_lower
+            else 0.0
+        )
+        version_bonus = 1.0 if version_score > 0 else 0.0
+        label_bonus = (
+            1.0
+            if label_lower
+            and (label_lower in candidate.artist.lower() or label_lower in candidate_lower)
+            else 0.0
+        )
+
+        total_score = (
+            artist_score * artist_weight
+            + title_score * title_weight
+            + verified_bonus * verified_weight
+            + popularity_score * popularity_weight
+            + version_bonus * version_bonus_weight
+            + label_bonus * label_bonus_weight
+        )
+        if version_score < 0:
+            total_score += version_score * version_penalty_weight
+
+        results.append((total_score, artist_score, title_score, verified_bonus, popularity_score))
+
+    return results
+
+
 def should_use_fallback(parsed_track: ParsedTrack) -> bool:
     """Determine if fallback search (without version) should be used.
 
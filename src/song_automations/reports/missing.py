@@ -1,13 +1,20 @@
 """Missing tracks report generation."""
 
 import csv
-import json
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from song_automations.config import Settings
 from song_automations.state.tracker import Destination, StateTracker
 
+WRITE_BUFFER_SIZE = 1 << 20
+REPORT_WORKERS = 4
+REPORT_FORMATS = frozenset({"csv", "json"})
+
 
 def generate_missing_report(
     state_tracker: StateTracker,
@@ -28,25 +35,114 @@ def generate_missing_report(
     Returns:
         Path to the generated report, or None if no missing tracks.
     """
-    missing_tracks = state_tracker.get_missing_tracks(destination)
+    report_paths = generate_missing_reports(
+        state_tracker, settings, [format], [destination], output_path
+    )
+    return report_paths[0] if report_paths else None
+
 
-    if not missing_tracks:
-        return None
+def generate_missing_reports(
+    state_tracker: StateTracker,
+    settings: Settings,
+    formats: Sequence[str],
+    destinations: Sequence[Destination | None] = (None,),
+    output_path: str | None = None,
+) -> list[Path]:
+    """Generate missing track reports for several formats and destinations.
+
+    Missing tracks are read once per destination, then every report file
+    is written concurrently.
+
+    Args:
+        state_tracker: State tracker with missing track data.
+        settings: Application settings.
+        formats: Output formats ('csv' or 'json').
+        destinations: Destination filters; None reports all platforms.
+        output_path: Optional output file path. With several formats its
+            suffix is replaced by each format.
+
+    Returns:
+        Paths to the generated reports, skipping destinations with no
+        missing tracks.
+
+    Raises:
+        ValueError: If a format is not supported, or output_path is given
+            with more than one destination.
+    """
+    destinations = list(dict.fromkeys(destinations))
+    formats = list(dict.fromkeys(formats))
+    unknown = [format for format in formats if format not in REPORT_FORMATS]
+    if unknown or not formats:
+        raise ValueError(
+            f"Unsupported report format: {', '.join(unknown) or '(none)'}; "
+            f"use {', '.join(sorted(REPORT_FORMATS))}"
+        )
+    if output_path and len(destinations) > 1:
+        raise ValueError("output_path can only be used with a single destination")
+
+    missing_by_destination = {
+        destination: state_tracker.get_missing_tracks(destination) for destination in destinations
+    }
+    jobs = [
+        (missing_tracks, format, _report_path(settings, format, destination, output_path, formats))
+        for destination, missing_tracks in missing_by_destination.items()
+        if missing_tracks
+        for format in formats
+    ]
+    if not jobs:
+        return []
 
     settings.reports_dir.mkdir(parents=True, exist_ok=True)
 
+    with ThreadPoolExecutor(max_workers=min(REPORT_WORKERS, len(jobs))) as pool:
+        futures = [pool.submit(_write_report, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def _report_path(
+    settings: Settings,
+    format: str,
+    destination: Destination | None,
+    output_path: str | None,
+    formats: Sequence[str],
+) -> Path:
+    """Pick the output path for one report.
+
+    Args:
+        settings: Application settings.
+        format: Output format of this report.
+        destination: Destination filter of this report.
+        output_path: Optional user-supplied output file path.
+        formats: All formats being generated.
+
+    Returns:
+        Path to write the report to.
+    """
     if output_path:
-        report_path = Path(output_path)
-    else:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        dest_suffix = f"_{destination}" if destination else ""
-        report_path = settings.reports_dir / f"missing_tracks{dest_suffix}_{timestamp}.{format}"
+        if len(formats) > 1:
+            return Path(output_path).with_suffix(f".{format}")
+        return Path(output_path)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    dest_suffix = f"_{destination}" if destination else ""
+    return settings.reports_dir / f"missing_tracks{dest_suffix}_{timestamp}.{format}"
+
 
+def _write_report(missing_tracks: list, format: str, report_path: Path) -> Path:
+    """Write one missing tracks report in the given format.
+
+    Args:
+        missing_tracks: List of MissingTrack objects.
+        format: Output format ('csv' or 'json').
+        report_path: Output file path.
+
+    Returns:
+        The report path.
+    """
     if format == "json":
         _write_json_report(missing_tracks, report_path)
     else:
         _write_csv_report(missing_tracks, report_path)
-
     return report_path
 
 
@@ -57,7 +153,7 @@ def _write_csv_report(missing_tracks: list, report_path: Path) -> None:
         missing_tracks: List of MissingTrack objects.
         report_path: Output file path.
     """
-    with open(report_path, "w", newline="", encoding="utf-8") as f:
+    with open(report_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -69,18 +165,17 @@ def _write_csv_report(missing_tracks: list, report_path: Path) -> None:
                 "Searched At",
             ]
         )
-
-        for track in missing_tracks:
-            writer.writerow(
-                [
-                    track.artist,
-                    track.track_name,
-                    track.destination,
-                    track.discogs_release_id,
-                    track.discogs_folder_id,
-                    track.searched_at.isoformat(),
-                ]
+        writer.writerows(
+            (
+                track.artist,
+                track.track_name,
+                track.destination,
+                track.discogs_release_id,
+                track.discogs_folder_id,
+                track.searched_at.isoformat(),
             )
+            for track in missing_tracks
+        )
 
 
 def _write_json_report(missing_tracks: list, report_path: Path) -> None:
@@ -91,7 +186,7 @@ def _write_json_report(missing_tracks: list, report_path: Path) -> None:
         report_path: Output file path.
     """
     data = {
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": datetime.now(),
         "total_count": len(missing_tracks),
         "tracks": [
             {
@@ -100,11 +195,10 @@ def _write_json_report(missing_tracks: list, report_path: Path) -> None:
                 "destination": track.destination,
                 "discogs_release_id": track.discogs_release_id,
                 "discogs_folder_id": track.discogs_folder_id,
-                "searched_at": track.searched_at.isoformat(),
+                "searched_at": track.searched_at,
             }
             for track in missing_tracks
         ],
     }
 
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    report_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
@@ -1,14 +1,19 @@
 """SQLite-based state tracking for sync operations."""
 
-import json
+import atexit
 import sqlite3
-from collections.abc import Iterator
+import threading
+import time
+import weakref
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal
 
+import orjson
+
 Destination = Literal["spotify", "soundcloud"]
 EventType = Literal[
     "sync_start",
@@ -27,8 +32,75 @@ EventType = Literal[
 ]
 LogStatus = Literal["info", "success", "warning", "error"]
 
-
-@dataclass
+# Text layout of SQLite's CURRENT_TIMESTAMP (UTC), used for values bound
+# against timestamp columns so they compare correctly as strings.
+SQLITE_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Per-connection settings: WAL-safe NORMAL sync, in-memory temp tables,
+# a 64 MB page cache and a busy wait instead of immediate lock errors.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Sync log rows are buffered and written in one transaction once this many
+# are pending or this many seconds have passed since the last write, and
+# whenever logs are read, flush() is called or the tracker closes.
+LOG_BUFFER_SIZE = 500
+LOG_FLUSH_INTERVAL = 2.0
+
+# Column lists in the order the row builders below read them.
+FOLDER_MAPPING_COLUMNS = (
+    "discogs_folder_id, discogs_folder_name, destination, playlist_id, playlist_name, created_at"
+)
+MATCHED_TRACK_COLUMNS = (
+    "id, discogs_release_id, discogs_track_position, artist, track_name, destination,"
+    " destination_track_id, match_confidence, searched_at, review_status"
+)
+MISSING_TRACK_COLUMNS = (
+    "discogs_release_id, discogs_folder_id, artist, track_name, destination, searched_at"
+)
+SYNC_LOG_COLUMNS = (
+    "id, sync_id, destination, folder_id, folder_name, event_type, status,"
+    " track_artist, track_name, track_confidence, message, details, created_at"
+)
+
+# Hot per-track lookups, run on cursors kept open for the tracker's lifetime.
+GET_CACHED_MATCH_SQL = f"""
+    SELECT {MATCHED_TRACK_COLUMNS} FROM matched_tracks
+    WHERE discogs_release_id = ?
+    AND discogs_track_position = ?
+    AND destination = ?
+    AND searched_at > ?
+    AND (review_status IS NULL OR review_status != 'rejected')
+"""
+GET_MATCHED_TRACK_IDS_SQL = """
+    SELECT destination_track_id FROM matched_tracks
+    WHERE discogs_release_id = ?
+    AND destination = ?
+    AND destination_track_id IS NOT NULL
+"""
+
+# clear_matched_tracks statements keyed by (all destinations, preserve reviewed).
+_PENDING_REVIEW = "(review_status IS NULL OR review_status = 'pending')"
+CLEAR_MATCHED_TRACKS_SQL = {
+    (False, True): f"DELETE FROM matched_tracks WHERE destination = ? AND {_PENDING_REVIEW}",
+    (False, False): "DELETE FROM matched_tracks WHERE destination = ?",
+    (True, True): f"DELETE FROM matched_tracks WHERE {_PENDING_REVIEW}",
+    (True, False): "DELETE FROM matched_tracks",
+}
+
+# Bumped when a migration is added; databases at this version skip them.
+SCHEMA_VERSION = 1
+
+# Prepared statements kept per connection. Room for every fixed query plus
+# each filter combination of the sync log queries.
+STATEMENT_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class FolderMapping:
     """Represents a mapping between a Discogs folder and a playlist.
 
@@ -49,7 +121,7 @@ class FolderMapping:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchedTrack:
     """Represents a cached track match.
 
@@ -78,7 +150,7 @@ class MatchedTrack:
     id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingTrack:
     """Represents a track that couldn't be found.
 
@@ -99,7 +171,7 @@ class MissingTrack:
     searched_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncLog:
     """Represents a sync event log entry.
 
@@ -134,7 +206,7 @@ class SyncLog:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncSummary:
     """Aggregate statistics for a sync run.
 
@@ -169,6 +241,18 @@ class SyncSummary:
     folders_processed: int
 
 
+# Open trackers, flushed at interpreter exit. Held weakly so an atexit
+# registration does not keep a tracker and its connection alive.
+_open_trackers: "weakref.WeakSet[StateTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_trackers() -> None:
+    """Write buffered sync logs of trackers that were never closed."""
+    for tracker in list(_open_trackers):
+        tracker.flush()
+
+
 class StateTracker:
     """SQLite-based state tracker for sync operations.
 
@@ -179,22 +263,91 @@ class StateTracker:
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
         db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            self._conn.execute(pragma)
         self._init_db()
+        self._cached_match_cursor = self._conn.cursor()
+        self._matched_track_ids_cursor = self._conn.cursor()
+        self._log_lock = threading.Lock()
+        self._log_buffer: list[tuple] = []
+        self._last_flush = time.monotonic()
+        _open_trackers.add(self)
+
+    def close(self) -> None:
+        """Flush buffered logs and close the database connection."""
+        self.flush()
+        _open_trackers.discard(self)
+        with self._lock:
+            self._conn.close()
+
+    def flush(self) -> None:
+        """Write buffered sync log rows to the database.
+
+        If the write fails the rows are put back at the front of the buffer,
+        so a later flush can retry them.
+        """
+        with self._log_lock:
+            rows, self._log_buffer = self._log_buffer, []
+            self._last_flush = time.monotonic()
+        if not rows:
+            return
 
-    @contextmanager
-    def _get_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
         try:
-            yield conn
-            conn.commit()
-        finally:
-            conn.close()
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO sync_logs
+                    (sync_id, destination, folder_id, folder_name, event_type, status,
+                     track_artist, track_name, track_confidence, message, details, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+        except BaseException:
+            with self._log_lock:
+                self._log_buffer[:0] = rows
+            raise
+
+    @contextmanager
+    def _get_connection(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run a block in one transaction on the shared connection.
+
+        The connection is held for the whole block, so calls from several
+        threads are serialized. The transaction is rolled back if the block
+        raises.
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE), for
+                blocks that read and then write.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def _init_db(self) -> None:
-        """Initialize the database schema."""
-        with self._get_connection() as conn:
+        """Initialize the database schema.
+
+        Also switches the database to WAL journaling, which persists in the
+        file, so readers no longer block behind a writer. Runs outside a
+        transaction, since the journal mode cannot change inside one.
+        Migrations only run for databases below SCHEMA_VERSION.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS folder_mappings (
@@ -247,10 +400,13 @@ class StateTracker:
                     ON matched_tracks(destination);
                 CREATE INDEX IF NOT EXISTS idx_missing_tracks_destination
                     ON missing_tracks(destination);
-                CREATE INDEX IF NOT EXISTS idx_matched_tracks_lookup
-                    ON matched_tracks(discogs_release_id, discogs_track_position, destination);
-                CREATE INDEX IF NOT EXISTS idx_folder_releases_folder
-                    ON folder_releases(discogs_folder_id);
+                CREATE INDEX IF NOT EXISTS idx_matched_tracks_release_ids
+                    ON matched_tracks(discogs_release_id, destination, destination_track_id);
+
+                -- Duplicates of the UNIQUE constraint indexes, which already
+                -- serve these lookups (covering, for folder_releases).
+                DROP INDEX IF EXISTS idx_matched_tracks_lookup;
+                DROP INDEX IF EXISTS idx_folder_releases_folder;
 
                 CREATE TABLE IF NOT EXISTS sync_logs (
                     id INTEGER PRIMARY KEY,
@@ -264,20 +420,42 @@ class StateTracker:
                     track_name TEXT,
                     track_confidence REAL,
                     message TEXT,
-                    details TEXT,
+                    details BLOB,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 CREATE INDEX IF NOT EXISTS idx_sync_logs_sync
                     ON sync_logs(sync_id);
                 CREATE INDEX IF NOT EXISTS idx_sync_logs_status
                     ON sync_logs(status);
-                CREATE INDEX IF NOT EXISTS idx_sync_logs_created
-                    ON sync_logs(created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_sync_logs_destination
                     ON sync_logs(destination);
+
+                -- Log listings page on (created_at, id), so the id tiebreak is
+                -- part of each ordering index. Replaces the created_at-only
+                -- versions.
+                DROP INDEX IF EXISTS idx_sync_logs_created;
+                DROP INDEX IF EXISTS idx_sync_logs_sync_created;
+                DROP INDEX IF EXISTS idx_sync_logs_dest_status_created;
+                CREATE INDEX IF NOT EXISTS idx_sync_logs_created_id
+                    ON sync_logs(created_at DESC, id DESC);
+                CREATE INDEX IF NOT EXISTS idx_sync_logs_sync_created_id
+                    ON sync_logs(sync_id, created_at DESC, id DESC);
+                CREATE INDEX IF NOT EXISTS idx_sync_logs_dest_status_created_id
+                    ON sync_logs(destination, status, created_at DESC, id DESC);
             """
             )
-            self._migrate_review_status(conn)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                self._migrate_review_status(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_matched_tracks_flagged
+                    ON matched_tracks(destination, match_confidence)
+                    WHERE match_confidence > 0
+                    AND destination_track_id IS NOT NULL
+                    AND (review_status IS NULL OR review_status = 'pending')
+                """
+            )
 
     def _migrate_review_status(self, conn: sqlite3.Connection) -> None:
         """Add review_status column if it doesn't exist (migration)."""
@@ -288,6 +466,34 @@ class StateTracker:
                 "ALTER TABLE matched_tracks ADD COLUMN review_status TEXT DEFAULT 'pending'"
             )
 
+    @staticmethod
+    def _folder_mapping_from_row(row: tuple) -> FolderMapping:
+        """Build a FolderMapping from a row selected with FOLDER_MAPPING_COLUMNS."""
+        return FolderMapping(
+            discogs_folder_id=row[0],
+            discogs_folder_name=row[1],
+            destination=row[2],
+            playlist_id=row[3],
+            playlist_name=row[4],
+            created_at=datetime.fromisoformat(row[5]),
+        )
+
+    @staticmethod
+    def _matched_track_from_row(row: tuple) -> MatchedTrack:
+        """Build a MatchedTrack from a row selected with MATCHED_TRACK_COLUMNS."""
+        return MatchedTrack(
+            id=row[0],
+            discogs_release_id=row[1],
+            discogs_track_position=row[2],
+            artist=row[3],
+            track_name=row[4],
+            destination=row[5],
+            destination_track_id=row[6],
+            match_confidence=row[7],
+            searched_at=datetime.fromisoformat(row[8]),
+            review_status=row[9] or "pending",
+        )
+
     def get_folder_mapping(
         self,
         discogs_folder_id: int,
@@ -304,8 +510,8 @@ class StateTracker:
         """
         with self._get_connection() as conn:
             row = conn.execute(
-                """
-                SELECT * FROM folder_mappings
+                f"""
+                SELECT {FOLDER_MAPPING_COLUMNS} FROM folder_mappings
                 WHERE discogs_folder_id = ? AND destination = ?
                 """,
                 (discogs_folder_id, destination),
@@ -314,14 +520,7 @@ class StateTracker:
             if row is None:
                 return None
 
-            return FolderMapping(
-                discogs_folder_id=row["discogs_folder_id"],
-                discogs_folder_name=row["discogs_folder_name"],
-                destination=row["destination"],
-                playlist_id=row["playlist_id"],
-                playlist_name=row["playlist_name"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-            )
+            return self._folder_mapping_from_row(row)
 
     def get_all_folder_mappings(
         self,
@@ -337,23 +536,39 @@ class StateTracker:
         """
         with self._get_connection() as conn:
             rows = conn.execute(
-                """
-                SELECT * FROM folder_mappings WHERE destination = ?
-                """,
+                f"SELECT {FOLDER_MAPPING_COLUMNS} FROM folder_mappings WHERE destination = ?",
                 (destination,),
             ).fetchall()
 
-            return [
-                FolderMapping(
-                    discogs_folder_id=row["discogs_folder_id"],
-                    discogs_folder_name=row["discogs_folder_name"],
-                    destination=row["destination"],
-                    playlist_id=row["playlist_id"],
-                    playlist_name=row["playlist_name"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-                for row in rows
-            ]
+            return [self._folder_mapping_from_row(row) for row in rows]
+
+    def get_all_folder_mappings_multi(
+        self,
+        destinations: Sequence[Destination],
+    ) -> list[FolderMapping]:
+        """Get all folder mappings for several destinations in one query.
+
+        Args:
+            destinations: Target platforms to include.
+
+        Returns:
+            List of FolderMapping objects, grouped in the order of destinations.
+        """
+        if not destinations:
+            return []
+
+        placeholders = ", ".join("?" for _ in destinations)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {FOLDER_MAPPING_COLUMNS} FROM folder_mappings"
+                f" WHERE destination IN ({placeholders})",
+                tuple(destinations),
+            ).fetchall()
+
+        order = {dest: index for index, dest in enumerate(destinations)}
+        mappings = [self._folder_mapping_from_row(row) for row in rows]
+        mappings.sort(key=lambda m: order[m.destination])
+        return mappings
 
     def save_folder_mapping(
         self,
@@ -375,9 +590,14 @@ class StateTracker:
         with self._get_connection() as conn:
             conn.execute(
                 """
-                INSERT OR REPLACE INTO folder_mappings
+                INSERT INTO folder_mappings
                 (discogs_folder_id, discogs_folder_name, destination, playlist_id, playlist_name)
                 VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(discogs_folder_id, destination) DO UPDATE SET
+                    discogs_folder_name = excluded.discogs_folder_name,
+                    playlist_id = excluded.playlist_id,
+                    playlist_name = excluded.playlist_name,
+                    created_at = CURRENT_TIMESTAMP
                 """,
                 (discogs_folder_id, discogs_folder_name, destination, playlist_id, playlist_name),
             )
@@ -409,14 +629,36 @@ class StateTracker:
     ) -> None:
         """Update the list of releases in a folder.
 
+        Only the difference to the stored list is written: removed releases
+        are deleted, new ones inserted, and releases still present get their
+        last_seen_at refreshed.
+
         Args:
             discogs_folder_id: Discogs folder ID.
             release_ids: List of release IDs currently in the folder.
         """
-        with self._get_connection() as conn:
+        with self._get_connection(immediate=True) as conn:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT discogs_release_id FROM folder_releases WHERE discogs_folder_id = ?",
+                    (discogs_folder_id,),
+                )
+            }
+            current = dict.fromkeys(release_ids)
+
+            conn.executemany(
+                """
+                DELETE FROM folder_releases
+                WHERE discogs_folder_id = ? AND discogs_release_id = ?
+                """,
+                ((discogs_folder_id, rid) for rid in existing.difference(current)),
+            )
+
             conn.execute(
                 """
-                DELETE FROM folder_releases WHERE discogs_folder_id = ?
+                UPDATE folder_releases SET last_seen_at = CURRENT_TIMESTAMP
+                WHERE discogs_folder_id = ?
                 """,
                 (discogs_folder_id,),
             )
@@ -426,28 +668,28 @@ class StateTracker:
                 INSERT INTO folder_releases (discogs_folder_id, discogs_release_id)
                 VALUES (?, ?)
                 """,
-                [(discogs_folder_id, rid) for rid in release_ids],
+                ((discogs_folder_id, rid) for rid in current if rid not in existing),
             )
 
-    def get_folder_release_ids(self, discogs_folder_id: int) -> list[int]:
+    def get_folder_release_ids(self, discogs_folder_id: int) -> frozenset[int]:
         """Get all release IDs in a folder from the last sync.
 
         Args:
             discogs_folder_id: Discogs folder ID.
 
         Returns:
-            List of release IDs.
+            Set of release IDs, ready for diffing against a fresh folder listing.
         """
         with self._get_connection() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT discogs_release_id FROM folder_releases
                 WHERE discogs_folder_id = ?
                 """,
                 (discogs_folder_id,),
-            ).fetchall()
+            )
 
-            return [row["discogs_release_id"] for row in rows]
+            return frozenset(row[0] for row in cursor)
 
     def get_cached_match(
         self,
@@ -467,34 +709,19 @@ class StateTracker:
         Returns:
             MatchedTrack if found, not expired, and not rejected. None otherwise.
         """
-        with self._get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT * FROM matched_tracks
-                WHERE discogs_release_id = ?
-                AND discogs_track_position = ?
-                AND destination = ?
-                AND searched_at > datetime('now', ?)
-                AND (review_status IS NULL OR review_status != 'rejected')
-                """,
-                (discogs_release_id, track_position, destination, f"-{max_age_days} days"),
-            ).fetchone()
+        cutoff = (datetime.now(UTC) - timedelta(days=max_age_days)).strftime(
+            SQLITE_TIMESTAMP_FORMAT
+        )
+        with self._get_connection():
+            rows = self._cached_match_cursor.execute(
+                GET_CACHED_MATCH_SQL,
+                (discogs_release_id, track_position, destination, cutoff),
+            ).fetchall()
 
-            if row is None:
-                return None
+        if not rows:
+            return None
 
-            return MatchedTrack(
-                id=row["id"],
-                discogs_release_id=row["discogs_release_id"],
-                discogs_track_position=row["discogs_track_position"],
-                artist=row["artist"],
-                track_name=row["track_name"],
-                destination=row["destination"],
-                destination_track_id=row["destination_track_id"],
-                match_confidence=row["match_confidence"],
-                searched_at=datetime.fromisoformat(row["searched_at"]),
-                review_status=row["review_status"] or "pending",
-            )
+        return self._matched_track_from_row(rows[0])
 
     def save_matched_track(
         self,
@@ -520,10 +747,17 @@ class StateTracker:
         with self._get_connection() as conn:
             conn.execute(
                 """
-                INSERT OR REPLACE INTO matched_tracks
+                INSERT INTO matched_tracks
                 (discogs_release_id, discogs_track_position, artist, track_name,
                  destination, destination_track_id, match_confidence)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(discogs_release_id, discogs_track_position, destination) DO UPDATE SET
+                    artist = excluded.artist,
+                    track_name = excluded.track_name,
+                    destination_track_id = excluded.destination_track_id,
+                    match_confidence = excluded.match_confidence,
+                    searched_at = CURRENT_TIMESTAMP,
+                    review_status = 'pending'
                 """,
                 (
                     discogs_release_id,
@@ -556,9 +790,13 @@ class StateTracker:
         with self._get_connection() as conn:
             conn.execute(
                 """
-                INSERT OR REPLACE INTO missing_tracks
+                INSERT INTO missing_tracks
                 (discogs_release_id, discogs_folder_id, artist, track_name, destination)
                 VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(discogs_release_id, track_name, destination) DO UPDATE SET
+                    discogs_folder_id = excluded.discogs_folder_id,
+                    artist = excluded.artist,
+                    searched_at = CURRENT_TIMESTAMP
                 """,
                 (discogs_release_id, discogs_folder_id, artist, track_name, destination),
             )
@@ -578,27 +816,27 @@ class StateTracker:
         with self._get_connection() as conn:
             if destination:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM missing_tracks WHERE destination = ?
+                    f"""
+                    SELECT {MISSING_TRACK_COLUMNS} FROM missing_tracks WHERE destination = ?
                     ORDER BY searched_at DESC
                     """,
                     (destination,),
                 ).fetchall()
             else:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM missing_tracks ORDER BY searched_at DESC
+                    f"""
+                    SELECT {MISSING_TRACK_COLUMNS} FROM missing_tracks ORDER BY searched_at DESC
                     """
                 ).fetchall()
 
             return [
                 MissingTrack(
-                    discogs_release_id=row["discogs_release_id"],
-                    discogs_folder_id=row["discogs_folder_id"],
-                    artist=row["artist"],
-                    track_name=row["track_name"],
-                    destination=row["destination"],
-                    searched_at=datetime.fromisoformat(row["searched_at"]),
+                    discogs_release_id=row[0],
+                    discogs_folder_id=row[1],
+                    artist=row[2],
+                    track_name=row[3],
+                    destination=row[4],
+                    searched_at=datetime.fromisoformat(row[5]),
                 )
                 for row in rows
             ]
@@ -633,22 +871,10 @@ class StateTracker:
         Returns:
             Number of records deleted.
         """
+        query = CLEAR_MATCHED_TRACKS_SQL[(not destination, preserve_reviewed)]
+        params = (destination,) if destination else ()
         with self._get_connection() as conn:
-            if preserve_reviewed:
-                review_filter = "AND (review_status IS NULL OR review_status = 'pending')"
-            else:
-                review_filter = ""
-
-            if destination:
-                cursor = conn.execute(
-                    f"DELETE FROM matched_tracks WHERE destination = ? {review_filter}",
-                    (destination,),
-                )
-            else:
-                cursor = conn.execute(
-                    f"DELETE FROM matched_tracks WHERE 1=1 {review_filter}"
-                )
-            return cursor.rowcount
+            return conn.execute(query, params).rowcount
 
     def get_matched_track_ids(
         self,
@@ -664,18 +890,13 @@ class StateTracker:
         Returns:
             List of destination track IDs.
         """
-        with self._get_connection() as conn:
-            rows = conn.execute(
-                """
-                SELECT destination_track_id FROM matched_tracks
-                WHERE discogs_release_id = ?
-                AND destination = ?
-                AND destination_track_id IS NOT NULL
-                """,
+        with self._get_connection():
+            rows = self._matched_track_ids_cursor.execute(
+                GET_MATCHED_TRACK_IDS_SQL,
                 (discogs_release_id, destination),
             ).fetchall()
 
-            return [row["destination_track_id"] for row in rows]
+        return [row[0] for row in rows]
 
     def get_flagged_tracks(
         self,
@@ -684,6 +905,9 @@ class StateTracker:
     ) -> list[MatchedTrack]:
         """Get tracks that need review (confidence below threshold, not yet reviewed).
 
+        The filters repeat the WHERE clause of idx_matched_tracks_flagged word
+        for word, which is what lets SQLite use that partial index.
+
         Args:
             high_confidence: Threshold below which tracks are flagged.
             destination: Optional filter by destination.
@@ -694,8 +918,8 @@ class StateTracker:
         with self._get_connection() as conn:
             if destination:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM matched_tracks
+                    f"""
+                    SELECT {MATCHED_TRACK_COLUMNS} FROM matched_tracks
                     WHERE match_confidence < ?
                     AND match_confidence > 0
                     AND destination_track_id IS NOT NULL
@@ -707,8 +931,8 @@ class StateTracker:
                 ).fetchall()
             else:
                 rows = conn.execute(
-                    """
-                    SELECT * FROM matched_tracks
+                    f"""
+                    SELECT {MATCHED_TRACK_COLUMNS} FROM matched_tracks
                     WHERE match_confidence < ?
                     AND match_confidence > 0
                     AND destination_track_id IS NOT NULL
@@ -718,21 +942,7 @@ class StateTracker:
                     (high_confidence,),
                 ).fetchall()
 
-            return [
-                MatchedTrack(
-                    id=row["id"],
-                    discogs_release_id=row["discogs_release_id"],
-                    discogs_track_position=row["discogs_track_position"],
-                    artist=row["artist"],
-                    track_name=row["track_name"],
-                    destination=row["destination"],
-                    destination_track_id=row["destination_track_id"],
-                    match_confidence=row["match_confidence"],
-                    searched_at=datetime.fromisoformat(row["searched_at"]),
-                    review_status=row["review_status"] or "pending",
-                )
-                for row in rows
-            ]
+            return [self._matched_track_from_row(row) for row in rows]
 
     def get_matched_track_by_id(self, track_id: int) -> MatchedTrack | None:
         """Get a matched track by its database ID.
@@ -745,25 +955,14 @@ class StateTracker:
         """
         with self._get_connection() as conn:
             row = conn.execute(
-                "SELECT * FROM matched_tracks WHERE id = ?",
+                f"SELECT {MATCHED_TRACK_COLUMNS} FROM matched_tracks WHERE id = ?",
                 (track_id,),
             ).fetchone()
 
             if row is None:
                 return None
 
-            return MatchedTrack(
-                id=row["id"],
-                discogs_release_id=row["discogs_release_id"],
-                discogs_track_position=row["discogs_track_position"],
-                artist=row["artist"],
-                track_name=row["track_name"],
-                destination=row["destination"],
-                destination_track_id=row["destination_track_id"],
-                match_confidence=row["match_confidence"],
-                searched_at=datetime.fromisoformat(row["searched_at"]),
-                review_status=row["review_status"] or "pending",
-            )
+            return self._matched_track_from_row(row)
 
     def update_review_status(
         self,
@@ -830,6 +1029,10 @@ class StateTracker:
     ) -> None:
         """Log a sync event.
 
+        The row is buffered and written in a batch, at the latest
+        LOG_FLUSH_INTERVAL seconds after the previous write, see flush(). Its
+        timestamp is taken now, not when it is written.
+
         Args:
             sync_id: UUID identifying the sync run.
             destination: Target platform.
@@ -843,29 +1046,29 @@ class StateTracker:
             message: Human-readable message (optional).
             details: Additional JSON details (optional).
         """
-        details_json = json.dumps(details) if details else None
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO sync_logs
-                (sync_id, destination, folder_id, folder_name, event_type, status,
-                 track_artist, track_name, track_confidence, message, details)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    sync_id,
-                    destination,
-                    folder_id,
-                    folder_name,
-                    event_type,
-                    status,
-                    track_artist,
-                    track_name,
-                    track_confidence,
-                    message,
-                    details_json,
-                ),
+        details_blob = orjson.dumps(details, option=orjson.OPT_NON_STR_KEYS) if details else None
+        row = (
+            sync_id,
+            destination,
+            folder_id,
+            folder_name,
+            event_type,
+            status,
+            track_artist,
+            track_name,
+            track_confidence,
+            message,
+            details_blob,
+            datetime.now(UTC).strftime(SQLITE_TIMESTAMP_FORMAT),
+        )
+        with self._log_lock:
+            self._log_buffer.append(row)
+            due = (
+                len(self._log_buffer) >= LOG_BUFFER_SIZE
+                or time.monotonic() - self._last_flush >= LOG_FLUSH_INTERVAL
             )
+        if due:
+            self.flush()
 
     def get_sync_logs(
         self,
@@ -875,6 +1078,8 @@ class StateTracker:
         event_type: EventType | None = None,
         limit: int = 100,
         offset: int = 0,
+        before: datetime | None = None,
+        before_id: int | None = None,
     ) -> list[SyncLog]:
         """Get sync logs with optional filtering.
 
@@ -885,11 +1090,16 @@ class StateTracker:
             event_type: Filter by event type.
             limit: Maximum number of records to return.
             offset: Number of records to skip.
+            before: Only return logs created before this time.
+            before_id: With before, also return logs created at exactly that
+                time whose ID is lower. Passing the created_at and id of the
+                last log on a page fetches the next page without scanning the
+                skipped rows, unlike offset.
 
         Returns:
             List of SyncLog objects.
         """
-        query = "SELECT * FROM sync_logs WHERE 1=1"
+        query = f"SELECT {SYNC_LOG_COLUMNS} FROM sync_logs WHERE 1=1"
         params: list[Any] = []
 
         if destination:
@@ -904,28 +1114,39 @@ class StateTracker:
         if event_type:
             query += " AND event_type = ?"
             params.append(event_type)
+        if before:
+            cutoff = before.strftime(SQLITE_TIMESTAMP_FORMAT)
+            if before_id is None:
+                query += " AND created_at < ?"
+                params.append(cutoff)
+            else:
+                # The leading created_at <= ? gives the planner a range to seek
+                # on; the OR breaks ties between rows logged in the same second.
+                query += " AND created_at <= ? AND (created_at < ? OR id < ?)"
+                params.extend([cutoff, cutoff, before_id])
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        query += " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
+        self.flush()
         with self._get_connection() as conn:
             rows = conn.execute(query, params).fetchall()
 
             return [
                 SyncLog(
-                    id=row["id"],
-                    sync_id=row["sync_id"],
-                    destination=row["destination"],
-                    folder_id=row["folder_id"],
-                    folder_name=row["folder_name"],
-                    event_type=row["event_type"],
-                    status=row["status"],
-                    track_artist=row["track_artist"],
-                    track_name=row["track_name"],
-                    track_confidence=row["track_confidence"],
-                    message=row["message"],
-                    details=json.loads(row["details"]) if row["details"] else None,
-                    created_at=datetime.fromisoformat(row["created_at"]),
+                    id=row[0],
+                    sync_id=row[1],
+                    destination=row[2],
+                    folder_id=row[3],
+                    folder_name=row[4],
+                    event_type=row[5],
+                    status=row[6],
+                    track_artist=row[7],
+                    track_name=row[8],
+                    track_confidence=row[9],
+                    message=row[10],
+                    details=orjson.loads(row[11]) if row[11] else None,
+                    created_at=datetime.fromisoformat(row[12]),
                 )
                 for row in rows
             ]
@@ -964,6 +1185,7 @@ class StateTracker:
             query += " AND event_type = ?"
             params.append(event_type)
 
+        self.flush()
         with self._get_connection() as conn:
             result = conn.execute(query, params).fetchone()
             return result[0] if result else 0
@@ -977,14 +1199,15 @@ class StateTracker:
         Returns:
             SyncSummary with aggregate stats, or None if no logs found.
         """
+        self.flush()
         with self._get_connection() as conn:
             row = conn.execute(
                 """
                 SELECT
                     sync_id,
                     destination,
-                    MIN(created_at) as started_at,
-                    MAX(created_at) as completed_at,
+                    MIN(created_at) AS started_at,
+                    MAX(created_at) AS completed_at,
                     COUNT(*) as total_events,
                     SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as success_count,
                     SUM(CASE WHEN status = 'warning' THEN 1 ELSE 0 END) as warning_count,
@@ -1004,20 +1227,13 @@ class StateTracker:
             if row is None:
                 return None
 
+            sync_id, destination, started_at, completed_at, *counts = row
             return SyncSummary(
-                sync_id=row["sync_id"],
-                destination=row["destination"],
-                started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
-                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-                total_events=row["total_events"],
-                success_count=row["success_count"],
-                warning_count=row["warning_count"],
-                error_count=row["error_count"],
-                tracks_matched=row["tracks_matched"],
-                tracks_flagged=row["tracks_flagged"],
-                tracks_missing=row["tracks_missing"],
-                playlists_created=row["playlists_created"],
-                folders_processed=row["folders_processed"],
+                sync_id,
+                destination,
+                datetime.fromisoformat(started_at) if started_at else None,
+                datetime.fromisoformat(completed_at) if completed_at else None,
+                *counts,
             )
 
     def get_recent_sync_ids(self, limit: int = 20) -> list[tuple[str, str, datetime]]:
@@ -1029,21 +1245,22 @@ class StateTracker:
         Returns:
             List of (sync_id, destination, started_at) tuples.
         """
+        self.flush()
         with self._get_connection() as conn:
             rows = conn.execute(
                 """
-                SELECT sync_id, destination, MIN(created_at) as started_at
+                SELECT sync_id, destination, MIN(created_at) AS started_at
                 FROM sync_logs
                 GROUP BY sync_id
-                ORDER BY started_at DESC
+                ORDER BY MIN(created_at) DESC
                 LIMIT ?
                 """,
                 (limit,),
             ).fetchall()
 
             return [
-                (row["sync_id"], row["destination"], datetime.fromisoformat(row["started_at"]))
-                for row in rows
+                (sync_id, destination, datetime.fromisoformat(started_at))
+                for sync_id, destination, started_at in rows
             ]
 
     def cleanup_old_logs(self, days: int = 90) -> int:
@@ -1055,6 +1272,7 @@ class StateTracker:
         Returns:
             Number of records deleted.
         """
+        self.flush()
         with self._get_connection() as conn:
             cursor = conn.execute(
                 """
@@ -13,10 +13,11 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from song_automations.clients.discogs import DiscogsClient, Folder, Release, Track
 from song_automations.config import Settings
 from song_automations.matching.fuzzy import (
+    Candidate,
     MatchResult,
     ParsedTrack,
     parse_track_title,
-    score_candidate,
+    score_candidates,
     should_use_fallback,
 )
 from song_automations.state.tracker import Destination, StateTracker
@@ -92,6 +93,8 @@ class PlaylistClient(Protocol):
 
     def get_playlist_tracks(self, playlist_id) -> list: ...
 
+    def get_playlist_track_ids(self, playlist_id) -> list: ...
+
     def add_tracks_to_playlist(self, playlist_id, track_ids: list) -> None: ...
 
     def remove_tracks_from_playlist(self, playlist_id, track_ids: list) -> None: ...
@@ -224,11 +227,21 @@ class SyncEngine:
                     details={"folder_count": len(folders), "dry_run": dry_run},
                 )
 
+                progress.update(task, description="Fetching Discogs releases...")
+                releases_by_folder = {folder.id: self._folder_releases(folder) for folder in folders}
+                # One fetch for every folder, so releases shared between
+                # folders and the wantlist are only requested once.
+                tracks_by_release = self._discogs.get_releases_tracks(
+                    [r.id for releases in releases_by_folder.values() for r in releases]
+                )
+
                 progress.update(task, description=f"Processing {len(folders)} folders...")
 
                 for folder in folders:
                     folder_result = self._sync_folder(
                         folder=folder,
+                        releases=releases_by_folder[folder.id],
+                        tracks_by_release=tracks_by_release,
                         playlist_client=playlist_client,
                         destination=destination,
                         dry_run=dry_run,
@@ -241,6 +254,9 @@ class SyncEngine:
                     result.tracks_removed += folder_result.tracks_removed
                     result.tracks_missing += folder_result.tracks_missing
                     result.tracks_flagged += folder_result.tracks_flagged
+                    # Make the folder's log rows visible to other readers,
+                    # such as the review web UI, while the sync continues.
+                    self._state.flush()
 
                 progress.update(task, description="Checking for deleted folders...")
                 deleted_result = self._cleanup_deleted_folders(
@@ -279,12 +295,29 @@ class SyncEngine:
                 details={"error": str(e), "traceback": traceback.format_exc()},
             )
             raise
+        finally:
+            self._state.flush()
 
         return result
 
+    def _folder_releases(self, folder: Folder) -> list[Release]:
+        """List the releases in a folder, or in the wantlist.
+
+        Args:
+            folder: Discogs folder, possibly the wantlist pseudo-folder.
+
+        Returns:
+            Releases in the folder.
+        """
+        if folder.id == DiscogsClient.WANTLIST_FOLDER_ID:
+            return list(self._discogs.get_wantlist_releases())
+        return list(self._discogs.get_folder_releases(folder.id))
+
     def _sync_folder(
         self,
         folder: Folder,
+        releases: list[Release],
+        tracks_by_release: dict[int, list[Track]],
         playlist_client: PlaylistClient,
         destination: Destination,
         dry_run: bool,
@@ -295,6 +328,8 @@ class SyncEngine:
 
         Args:
             folder: Discogs folder to sync.
+            releases: Releases in the folder.
+            tracks_by_release: Tracks of every release being synced, by ID.
             playlist_client: Platform client.
             destination: Target platform.
             dry_run: If True, don't make changes.
@@ -309,11 +344,6 @@ class SyncEngine:
 
         progress.console.print(f"[bold]Syncing folder:[/bold] {folder.name}")
 
-        if folder.id == DiscogsClient.WANTLIST_FOLDER_ID:
-            releases = list(self._discogs.get_wantlist_releases())
-        else:
-            releases = list(self._discogs.get_folder_releases(folder.id))
-
         self._state.log_sync_event(
             sync_id=sync_id,
             destination=destination,
@@ -376,7 +406,7 @@ class SyncEngine:
                 total=None,
             )
 
-            tracks = self._discogs.get_release_tracks(release.id)
+            tracks = tracks_by_release.get(release.id, [])
 
             if not tracks:
                 self._state.log_sync_event(
@@ -436,10 +466,9 @@ class SyncEngine:
             progress.remove_task(task)
 
         if playlist and not dry_run:
-            current_tracks = playlist_client.get_playlist_tracks(playlist.id)
+            current_track_ids = set(playlist_client.get_playlist_track_ids(playlist.id))
 
             if destination == "spotify":
-                current_track_ids = {t.id for t in current_tracks}
                 ids_to_add = [
                     tid for tid, _, _ in tracks_to_add if tid not in current_track_ids
                 ]
@@ -456,7 +485,6 @@ class SyncEngine:
                     result.tracks_removed += len(ids_to_remove)
 
             else:
-                current_track_ids = {t.id for t in current_tracks}
                 int_desired = {int(tid) for tid in desired_track_ids}
                 ids_to_add = [int(tid) for tid, _, _ in tracks_to_add if int(tid) not in current_track_ids]
                 ids_to_remove = [tid for tid in current_track_ids if tid not in int_desired]
@@ -588,52 +616,25 @@ class SyncEngine:
         best_match: MatchResult | None = None
         best_score = 0.0
 
-        for search_result in search_results:
-            result_track = search_result.track
+        candidates = [self._to_candidate(result, destination) for result in search_results]
+        scores = self._score_candidates(
+            parsed, candidates, release.label, self._settings.min_confidence
+        )
 
-            if destination == "spotify":
-                candidate_title = result_track.name
-                candidate_artist = result_track.artist
-                popularity = result_track.popularity
-                max_pop = 100
-                is_verified = search_result.is_verified
-            else:
-                candidate_title = result_track.title
-                candidate_artist = result_track.artist
-                raw_plays = result_track.playback_count or 0
-                popularity = int(math.log10(raw_plays + 1) / 6 * 100)
-                max_pop = 100
-                is_verified = search_result.is_verified
-
-            total_score, artist_score, title_score, verified_bonus, pop_score = score_candidate(
-                parsed_track=parsed,
-                candidate_title=candidate_title,
-                candidate_artist=candidate_artist,
-                is_verified=is_verified,
-                popularity=popularity,
-                max_popularity=max_pop,
-                artist_weight=self._settings.artist_weight,
-                title_weight=self._settings.title_weight,
-                verified_weight=self._settings.verified_weight,
-                popularity_weight=self._settings.popularity_weight,
-                version_bonus_weight=self._settings.version_match_bonus,
-                version_penalty_weight=self._settings.version_penalty_weight,
-                label=release.label,
-                label_bonus_weight=self._settings.label_bonus_weight,
-            )
+        for search_result, candidate, score in zip(search_results, candidates, scores, strict=True):
+            total_score, artist_score, title_score, verified_bonus, pop_score = score
 
             if total_score > best_score:
                 best_score = total_score
+                result_track = search_result.track
 
                 if destination == "spotify":
                     track_uri = result_track.uri
-                    track_id = result_track.id
                 else:
                     track_uri = result_track.permalink_url
-                    track_id = result_track.id
 
                 best_match = MatchResult(
-                    track_id=track_id,
+                    track_id=result_track.id,
                     track_uri=track_uri,
                     confidence=total_score,
                     artist_score=artist_score,
@@ -641,8 +642,8 @@ class SyncEngine:
                     verified_bonus=verified_bonus,
                     popularity_score=pop_score,
                     is_verified=search_result.is_verified,
-                    matched_title=candidate_title,
-                    matched_artist=candidate_artist,
+                    matched_title=candidate.title,
+                    matched_artist=candidate.artist,
                 )
 
                 if total_score >= HIGH_CONFIDENCE_THRESHOLD:
@@ -692,6 +693,12 @@ class SyncEngine:
 
             return best_match
 
+        # Scoring above skips titles that cannot lift a candidate past
+        # min_confidence, so rescore unpruned to record the real best score.
+        best_score = max(
+            score[0]
+            for score in self._score_candidates(parsed, candidates, release.label, 0.0)
+        )
         self._state.save_matched_track(
             discogs_release_id=release.id,
             track_position=track.position,
@@ -715,6 +722,71 @@ class SyncEngine:
         )
         return None
 
+    def _score_candidates(
+        self,
+        parsed: ParsedTrack,
+        candidates: list[Candidate],
+        label: str,
+        min_confidence: float,
+    ) -> list[tuple[float, float, float, float, float]]:
+        """Score search candidates with the configured weights.
+
+        Args:
+            parsed: Parsed source track.
+            candidates: Candidates to score.
+            label: Source release label name.
+            min_confidence: Pruning threshold passed to score_candidates;
+                scores of candidates that cannot reach it are lower bounds.
+
+        Returns:
+            Score tuples from score_candidates, in candidate order.
+        """
+        return score_candidates(
+            parsed_track=parsed,
+            candidates=candidates,
+            max_popularity=100,
+            artist_weight=self._settings.artist_weight,
+            title_weight=self._settings.title_weight,
+            verified_weight=self._settings.verified_weight,
+            popularity_weight=self._settings.popularity_weight,
+            version_bonus_weight=self._settings.version_match_bonus,
+            version_penalty_weight=self._settings.version_penalty_weight,
+            label=label,
+            label_bonus_weight=self._settings.label_bonus_weight,
+            min_confidence=min_confidence,
+        )
+
+    @staticmethod
+    def _to_candidate(search_result, destination: Destination) -> Candidate:
+        """Extract the fields used for scoring from a search hit.
+
+        SoundCloud has no popularity score, so play counts are mapped onto
+        the same 0-100 range on a log scale.
+
+        Args:
+            search_result: Search hit from the destination client.
+            destination: Target platform.
+
+        Returns:
+            Candidate for score_candidates.
+        """
+        result_track = search_result.track
+        if destination == "spotify":
+            return Candidate(
+                title=result_track.name,
+                artist=result_track.artist,
+                is_verified=search_result.is_verified,
+                popularity=result_track.popularity,
+            )
+
+        raw_plays = result_track.playback_count or 0
+        return Candidate(
+            title=result_track.title,
+            artist=result_track.artist,
+            is_verified=search_result.is_verified,
+            popularity=int(math.log10(raw_plays + 1) / 6 * 100),
+        )
+
     def _multi_query_search(
         self,
         parsed: ParsedTrack,
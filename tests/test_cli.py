@@ -0,0 +1,98 @@
+"""Tests for the command-line interface."""
+
+import csv
+import io
+
+import pytest
+from typer.testing import CliRunner
+
+from song_automations import cli
+from song_automations.sync.engine import OperationType, SyncOperation, SyncResult
+
+
+class TestPipedSyncOutput:
+    """Tests for the TSV output of sync commands when stdout is not a terminal."""
+
+    @pytest.fixture
+    def runner(self, settings, monkeypatch):
+        """Create a runner whose syncs return one added track per platform."""
+
+        self.synced = []
+        self.failing = set()
+
+        def fake_run_sync(settings, platform, *args, **kwargs):
+            self.synced.append(platform)
+            if platform in self.failing:
+                raise RuntimeError(f"{platform} failed")
+            cli._notice_console().print(f"[bold]Syncing folder:[/bold] House ({platform})")
+            return SyncResult(
+                operations=[
+                    SyncOperation(
+                        operation_type=OperationType.ADD_TRACK,
+                        folder_name="House",
+                        playlist_name="Discogs - House",
+                        track_title="Track",
+                        track_artist="Artist",
+                        confidence=0.9,
+                    )
+                ],
+                tracks_added=1,
+            )
+
+        monkeypatch.setattr(cli, "_init_settings", lambda *args, **kwargs: settings)
+        monkeypatch.setattr(cli, "_build_context", lambda settings: None)
+        monkeypatch.setattr(cli, "_run_sync", fake_run_sync)
+        return CliRunner()
+
+    def _parse_tables(self, output: str) -> list[list[dict[str, str]]]:
+        """Split TSV output into its blank-line separated tables."""
+        return [
+            list(csv.DictReader(io.StringIO(block), delimiter="\t"))
+            for block in output.strip("\n").split("\n\n")
+        ]
+
+    @pytest.mark.parametrize("dry_run", [[], ["--dry-run"]])
+    def test_sync_all_prints_one_parseable_table(self, runner, dry_run):
+        """Notices should go to stderr and both platforms share one table."""
+        result = runner.invoke(cli.app, ["sync", "all", *dry_run])
+
+        assert result.exit_code == 0
+        operations, summary = self._parse_tables(result.stdout)
+        assert [row["destination"] for row in operations] == ["spotify", "soundcloud"]
+        assert {row["type"] for row in operations} == {"add_track"}
+        assert [(row["destination"], row["tracks_added"]) for row in summary] == [
+            ("spotify", "1"),
+            ("soundcloud", "1"),
+        ]
+        assert "Syncing folder" in result.stderr
+
+    def test_single_platform_sync(self, runner):
+        """A single-platform sync should use the same table layout."""
+        result = runner.invoke(cli.app, ["sync", "spotify", "--dry-run"])
+
+        assert result.exit_code == 0
+        operations, summary = self._parse_tables(result.stdout)
+        assert [row["destination"] for row in operations] == ["spotify"]
+        assert summary[0]["tracks_added"] == "1"
+        assert "DRY RUN" in result.stderr
+
+    def test_sync_all_reports_finished_platforms_on_failure(self, runner):
+        """A failing later platform should not hide the rows of earlier ones."""
+        self.failing.add("soundcloud")
+
+        result = runner.invoke(cli.app, ["sync", "all"])
+
+        assert isinstance(result.exception, RuntimeError)
+        operations, summary = self._parse_tables(result.stdout)
+        assert [row["destination"] for row in operations] == ["spotify"]
+        assert [row["destination"] for row in summary] == ["spotify"]
+
+    def test_sync_all_checks_every_platform_before_syncing(self, runner, settings):
+        """Missing credentials for any platform should stop before the first sync."""
+        settings.soundcloud_client_id = ""
+
+        result = runner.invoke(cli.app, ["sync", "all"])
+
+        assert result.exit_code == 1
+        assert self.synced == []
+        assert result.stdout == ""
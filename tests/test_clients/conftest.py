@@ -0,0 +1,81 @@
+"""Pytest fixtures for API client tests."""
+
+import threading
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from song_automations.clients import http
+from song_automations.clients.discogs import DiscogsClient
+from song_automations.clients.http import TokenBucket
+from song_automations.clients.soundcloud import SoundCloudClient
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def open_gate(monkeypatch):
+    """Give each test a fresh, open process-wide rate-limit gate."""
+    event = threading.Event()
+    event.set()
+    monkeypatch.setattr(http, "_rate_limit_event", event)
+    monkeypatch.setattr(http, "_rate_limit_until", 0.0)
+    monkeypatch.setattr(http, "_rate_limit_timer", None)
+    yield event
+    if http._rate_limit_timer is not None:
+        http._rate_limit_timer.cancel()
+
+
+@pytest.fixture
+def soundcloud_client(settings, tmp_path) -> Callable[..., SoundCloudClient]:
+    """Build SoundCloud clients whose requests are answered by a handler.
+
+    Returns:
+        A function taking the handler and returning an authorized client
+        with an isolated data directory and no rate limiting. Pass
+        ``token`` to choose the access token, and ``is_async=True`` to
+        mock the async transport instead of the sync one.
+    """
+
+    def build(handler: Handler, token: str = "token", is_async: bool = False) -> SoundCloudClient:
+        settings.data_dir = tmp_path
+        client = SoundCloudClient(settings)
+        client._access_token = token
+        client._limiter = TokenBucket(rate=1000)
+        transport = httpx.MockTransport(handler)
+        if is_async:
+            client._async_http_client = httpx.AsyncClient(transport=transport)
+        else:
+            client._http_client = httpx.Client(transport=transport)
+        return client
+
+    return build
+
+
+@pytest.fixture
+def discogs_client(settings, monkeypatch, tmp_path) -> DiscogsClient:
+    """Create a Discogs client with no API identity and an isolated data directory."""
+    mock_client = type("MockClient", (), {"identity": lambda self: None})()
+    monkeypatch.setattr("discogs_client.Client", lambda *args, **kwargs: mock_client)
+    settings.data_dir = tmp_path
+    return DiscogsClient(settings)
+
+
+@pytest.fixture
+def discogs_transport(monkeypatch) -> Callable[[Handler], None]:
+    """Route Discogs async sessions through a handler.
+
+    Returns:
+        A function taking the handler that answers every request made
+        by async sessions the Discogs client opens.
+    """
+    async_client = httpx.AsyncClient
+
+    def use(handler: Handler) -> None:
+        monkeypatch.setattr(
+            "song_automations.clients.discogs.httpx.AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+    return use
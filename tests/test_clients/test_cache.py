@@ -0,0 +1,102 @@
+"""Tests for the response caches."""
+
+import time
+
+import pytest
+
+from song_automations.clients.cache import CacheEntry, ResponseCache, TTLCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage and lookup."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a nested temporary directory."""
+        return ResponseCache(tmp_path / "nested" / "cache.db")
+
+    def test_construction_does_not_create_file(self, tmp_path):
+        """The database file should only be created on first use."""
+        ResponseCache(tmp_path / "cache.db")
+        assert not (tmp_path / "cache.db").exists()
+
+    def test_set_and_get(self, cache):
+        """Stored bodies should round-trip with their ETag."""
+        cache.set("key", {"a": [1, 2]}, etag='"abc"')
+
+        entry = cache.get("key")
+
+        assert entry.body == {"a": [1, 2]}
+        assert entry.etag == '"abc"'
+        assert entry.is_fresh(60)
+
+    def test_get_missing(self, cache):
+        """Unknown keys should return None."""
+        assert cache.get("missing") is None
+
+    def test_get_many(self, cache):
+        """Only present keys should be returned."""
+        cache.set_many([("a", 1, None), ("b", 2, None)])
+
+        entries = cache.get_many(["a", "b", "c"])
+
+        assert {key: entry.body for key, entry in entries.items()} == {"a": 1, "b": 2}
+
+    def test_set_replaces(self, cache):
+        """Setting an existing key should overwrite it."""
+        cache.set("key", 1)
+        cache.set("key", 2)
+        assert cache.get("key").body == 2
+
+    def test_set_deletes_superseded_entries(self, cache):
+        """Entries under the superseded prefix should be replaced by the new key."""
+        cache.set_many([("pl:9:a", 1, None), ("pl:9:b", 2, None), ("pl:90:a", 3, None)])
+
+        cache.set("pl:9:c", 4, supersedes="pl:9:")
+
+        entries = cache.get_many(["pl:9:a", "pl:9:b", "pl:9:c", "pl:90:a"])
+        assert {key: entry.body for key, entry in entries.items()} == {
+            "pl:9:c": 4,
+            "pl:90:a": 3,
+        }
+
+    @pytest.mark.parametrize("age,expected", [(10, True), (120, False)])
+    def test_is_fresh(self, age, expected):
+        """Freshness should compare entry age against max_age."""
+        entry = CacheEntry(body=None, etag=None, stored_at=time.time() - age)
+        assert entry.is_fresh(60) is expected
+
+
+class TestTTLCache:
+    """Tests for the in-memory expiring cache."""
+
+    def test_get_and_set(self):
+        """Stored values should be returned until they expire."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set(("q", 10), "value")
+
+        assert cache.get(("q", 10)) == "value"
+        assert cache.get(("q", 5)) is None
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        """Entries older than the TTL should miss."""
+        now = [1000.0]
+        monkeypatch.setattr("song_automations.clients.cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("key", "value")
+
+        now[0] += 61
+
+        assert cache.get("key") is None
+
+    def test_evicts_least_recently_used(self):
+        """A full cache should drop the entry used longest ago."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
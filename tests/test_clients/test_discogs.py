@@ -1,13 +1,18 @@
 """Tests for Discogs client."""
 
+import asyncio
+
+import httpx
 import pytest
 
 from song_automations.clients.discogs import (
+    RATE_LIMIT_ATTEMPTS,
     DiscogsClient,
     Folder,
     Release,
     Track,
 )
+from song_automations.clients.http import RateLimitError
 
 
 class TestTrack:
@@ -130,16 +135,6 @@ class TestRelease:
 class TestCleanArtistName:
     """Tests for artist name cleaning logic."""
 
-    @pytest.fixture
-    def client(self, settings, monkeypatch):
-        """Create a Discogs client for testing."""
-        mock_client = type("MockClient", (), {"identity": lambda self: None})()
-        monkeypatch.setattr(
-            "discogs_client.Client",
-            lambda *args, **kwargs: mock_client
-        )
-        return DiscogsClient(settings)
-
     @pytest.mark.parametrize(
         "input_name,expected",
         [
@@ -151,83 +146,231 @@ class TestCleanArtistName:
             ("  Spaced Artist  ", "Spaced Artist"),
         ],
     )
-    def test_clean_artist_name(self, client, input_name, expected):
+    def test_clean_artist_name(self, discogs_client, input_name, expected):
         """Clean artist name should remove numeric disambiguation suffixes."""
-        result = client._clean_artist_name(input_name)
+        result = discogs_client._clean_artist_name(input_name)
         assert result == expected
 
-    def test_clean_artist_name_preserves_non_numeric_suffix(self, client):
+    def test_clean_artist_name_preserves_non_numeric_suffix(self, discogs_client):
         """Non-numeric suffixes should be preserved."""
-        result = client._clean_artist_name("Artist (Remix)")
+        result = discogs_client._clean_artist_name("Artist (Remix)")
         assert result == "Artist (Remix)"
 
-    def test_clean_artist_name_empty(self, client):
+    def test_clean_artist_name_empty(self, discogs_client):
         """Empty string should remain empty after stripping."""
-        result = client._clean_artist_name("")
+        result = discogs_client._clean_artist_name("")
         assert result == ""
 
 
-class TestExtractArtists:
-    """Tests for artist extraction from Discogs artist list."""
+class TestFormatArtistNames:
+    """Tests for joining Discogs artist names."""
 
-    @pytest.fixture
-    def client(self, settings, monkeypatch):
-        """Create a Discogs client for testing."""
-        mock_client = type("MockClient", (), {"identity": lambda self: None})()
-        monkeypatch.setattr(
-            "discogs_client.Client",
-            lambda *args, **kwargs: mock_client
-        )
-        return DiscogsClient(settings)
-
-    def test_extract_single_artist(self, client):
+    def test_format_single_artist(self, discogs_client):
         """Single artist should return just the name."""
-        artists = [type("Artist", (), {"name": "Test Artist"})()]
-        result = client._extract_artists(artists)
+        artists = ["Test Artist"]
+        result = discogs_client._format_artist_names(artists)
         assert result == "Test Artist"
 
-    def test_extract_two_artists(self, client):
+    def test_format_two_artists(self, discogs_client):
         """Two artists should be joined with ampersand."""
-        artists = [
-            type("Artist", (), {"name": "Artist A"})(),
-            type("Artist", (), {"name": "Artist B"})(),
-        ]
-        result = client._extract_artists(artists)
+        artists = ["Artist A", "Artist B"]
+        result = discogs_client._format_artist_names(artists)
         assert result == "Artist A & Artist B"
 
-    def test_extract_multiple_artists(self, client):
+    def test_format_multiple_artists(self, discogs_client):
         """Multiple artists should use comma and ampersand."""
-        artists = [
-            type("Artist", (), {"name": "Artist A"})(),
-            type("Artist", (), {"name": "Artist B"})(),
-            type("Artist", (), {"name": "Artist C"})(),
-        ]
-        result = client._extract_artists(artists)
+        artists = ["Artist A", "Artist B", "Artist C"]
+        result = discogs_client._format_artist_names(artists)
         assert result == "Artist A, Artist B & Artist C"
 
-    def test_extract_empty_list(self, client):
+    def test_format_empty_list(self, discogs_client):
         """Empty list should return Unknown Artist."""
-        result = client._extract_artists([])
+        result = discogs_client._format_artist_names([])
         assert result == "Unknown Artist"
 
-    def test_extract_artist_with_numeric_suffix(self, client):
+    def test_format_artist_with_numeric_suffix(self, discogs_client):
         """Numeric disambiguation suffix should be removed."""
-        artists = [type("Artist", (), {"name": "Common Name (2)"})()]
-        result = client._extract_artists(artists)
+        artists = ["Common Name (2)"]
+        result = discogs_client._format_artist_names(artists)
         assert result == "Common Name"
 
-    def test_extract_four_artists(self, client):
+    def test_format_four_artists(self, discogs_client):
         """Four artists should use Oxford comma style."""
-        artists = [
-            type("Artist", (), {"name": "A"})(),
-            type("Artist", (), {"name": "B"})(),
-            type("Artist", (), {"name": "C"})(),
-            type("Artist", (), {"name": "D"})(),
-        ]
-        result = client._extract_artists(artists)
+        artists = ["A", "B", "C", "D"]
+        result = discogs_client._format_artist_names(artists)
         assert result == "A, B, C & D"
 
 
+RELEASE_JSON = {
+    "id": 1,
+    "title": "Test EP",
+    "artists": [{"name": "Main Artist (2)"}],
+    "tracklist": [
+        {"position": "", "title": "Side A", "type_": "heading"},
+        {"position": "A1", "title": "Opener", "duration": "5:12"},
+        {
+            "position": "A2",
+            "title": "Collab",
+            "duration": "",
+            "artists": [{"name": "Guest"}, {"name": "Other"}],
+        },
+        {"position": "Video", "title": "Clip"},
+    ],
+}
+
+
+class TestReleaseJson:
+    """Tests for building tracks from raw release JSON."""
+
+    def test_tracks_from_release_json(self, discogs_client):
+        """Headings and video entries should be skipped."""
+        tracks = discogs_client._tracks_from_release_json(RELEASE_JSON)
+
+        assert [t.position for t in tracks] == ["A1", "A2"]
+        assert tracks[0].artist == "Main Artist"
+        assert tracks[0].duration == "5:12"
+        assert tracks[1].artist == "Guest & Other"
+        assert tracks[1].release_title == "Test EP"
+
+    def test_get_releases_tracks(self, discogs_client, discogs_transport):
+        """Releases should be fetched concurrently and 404s mapped to empty lists."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            release_id = int(request.url.path.rsplit("/", 1)[1])
+            if release_id == 2:
+                return httpx.Response(404)
+            return httpx.Response(200, json={**RELEASE_JSON, "id": release_id})
+
+        discogs_transport(handler)
+
+        result = discogs_client.get_releases_tracks([1, 2, 3])
+
+        assert list(result) == [1, 2, 3]
+        assert result[2] == []
+        assert [t.release_id for t in result[3]] == [3, 3]
+
+    def test_get_releases_tracks_inside_running_loop(self, discogs_client, discogs_transport):
+        """The blocking API should also work when called from a coroutine."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=RELEASE_JSON)
+
+        discogs_transport(handler)
+
+        async def fetch() -> dict:
+            return discogs_client.get_releases_tracks([1])
+
+        result = asyncio.run(fetch())
+
+        assert [t.position for t in result[1]] == ["A1", "A2"]
+
+    def test_get_releases_tracks_deduplicates(self, discogs_client, discogs_transport):
+        """A release listed twice should only be requested once."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(200, json=RELEASE_JSON)
+
+        discogs_transport(handler)
+
+        result = discogs_client.get_releases_tracks([1, 1])
+
+        assert requested == ["/releases/1"]
+        assert list(result) == [1]
+
+    def test_get_releases_tracks_uses_cache(self, discogs_client, discogs_transport):
+        """Cached releases should not be fetched again."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(200, json=RELEASE_JSON)
+
+        discogs_transport(handler)
+
+        first = discogs_client.get_releases_tracks([1])
+        second = discogs_client.get_releases_tracks([1])
+
+        assert requested == ["/releases/1"]
+        assert first == second
+
+    def test_get_folder_releases_paginates(self, discogs_client, discogs_transport):
+        """Folder releases should be read from basic_information across pages."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/users/me/collection/folders/5":
+                return httpx.Response(200, json={"id": 5, "name": "House", "count": 2})
+            page = int(request.url.params["page"])
+            info = {
+                "id": page,
+                "title": f"Release {page}",
+                "year": 0,
+                "artists": [{"name": "Artist (3)"}],
+                "labels": [{"name": "Label", "catno": f"CAT{page}"}],
+            }
+            return httpx.Response(
+                200,
+                json={
+                    "pagination": {"page": page, "pages": 3},
+                    "releases": [{"basic_information": info}],
+                },
+            )
+
+        discogs_client._user = type("User", (), {"username": "me"})()
+        discogs_client._http_client = httpx.Client(
+            base_url="https://api.discogs.com",
+            transport=httpx.MockTransport(handler),
+        )
+        discogs_transport(handler)
+
+        releases = list(discogs_client.get_folder_releases(5))
+
+        assert [r.id for r in releases] == [1, 2, 3]
+        assert releases[0].artist == "Artist"
+        assert releases[1].catalog_number == "CAT2"
+        assert releases[0].folder_name == "House"
+
+    def test_get_json_gives_up_after_repeated_rate_limits(self, discogs_client, open_gate):
+        """An endpoint that keeps answering 429 should raise after a few attempts."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        discogs_client._http_client = httpx.Client(
+            base_url="https://api.discogs.com",
+            transport=httpx.MockTransport(handler),
+        )
+
+        with pytest.raises(RateLimitError):
+            discogs_client._get_json("/releases/1")
+
+        assert len(requested) == RATE_LIMIT_ATTEMPTS
+
+    def test_get_releases_tracks_gives_up_after_repeated_rate_limits(
+        self, discogs_client, discogs_transport, open_gate
+    ):
+        """The async fan-out should also stop retrying a release that keeps answering 429."""
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        discogs_transport(handler)
+
+        with pytest.raises(RateLimitError):
+            discogs_client.get_releases_tracks([1])
+
+        assert len(requested) == RATE_LIMIT_ATTEMPTS
+
+    def test_get_releases_tracks_empty(self, discogs_client):
+        """No release IDs should not open a session."""
+        assert discogs_client.get_releases_tracks([]) == {}
+
+
 class TestWantlistConstants:
     """Tests for wantlist folder constants."""
 
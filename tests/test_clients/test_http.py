@@ -0,0 +1,191 @@
+"""Tests for shared HTTP utilities."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from song_automations.clients import http
+from song_automations.clients.http import (
+    RateLimitError,
+    TokenBucket,
+    handle_rate_limit,
+    parse_rate_limit_headers,
+    throttle_delay,
+    wait_for_rate_limit,
+    wait_for_rate_limit_async,
+)
+
+
+class TestTokenBucket:
+    """Tests for proactive request pacing."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace monotonic time and sleep with a controllable fake clock."""
+        state = {"now": 0.0, "sleeps": []}
+
+        def sleep(seconds: float) -> None:
+            state["sleeps"].append(seconds)
+            state["now"] += seconds
+
+        monkeypatch.setattr(http.time, "monotonic", lambda: state["now"])
+        monkeypatch.setattr(http.time, "sleep", sleep)
+        return state
+
+    def test_burst_within_capacity_does_not_sleep(self, clock):
+        """Requests up to capacity should go out immediately."""
+        bucket = TokenBucket(rate=5)
+        for _ in range(5):
+            bucket.acquire()
+        assert clock["sleeps"] == []
+
+    def test_empty_bucket_sleeps_until_next_token(self, clock):
+        """The request after a full burst should wait one refill interval."""
+        bucket = TokenBucket(rate=4, capacity=1)
+        bucket.acquire()
+        bucket.acquire()
+        assert clock["sleeps"] == [pytest.approx(0.25)]
+
+    def test_tokens_refill_over_time(self, clock):
+        """Idle time should refill tokens up to capacity."""
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        clock["now"] += 10
+        with bucket:
+            pass
+        bucket.acquire()
+        assert clock["sleeps"] == []
+
+    async def test_async_acquire_sleeps_without_blocking(self, clock, monkeypatch):
+        """Async acquisition should wait via asyncio.sleep."""
+        async_sleeps = []
+
+        async def fake_sleep(seconds: float) -> None:
+            async_sleeps.append(seconds)
+
+        monkeypatch.setattr(http.asyncio, "sleep", fake_sleep)
+        bucket = TokenBucket(rate=2, capacity=1)
+
+        async with bucket:
+            pass
+        await bucket.acquire_async()
+
+        assert async_sleeps == [pytest.approx(0.5)]
+        assert clock["sleeps"] == []
+
+
+@pytest.mark.usefixtures("open_gate")
+class TestRateLimitHeaders:
+    """Tests for reading X-RateLimit headers."""
+
+    def test_parse_rate_limit_headers(self):
+        """Remaining and reset should be read when present."""
+        response = httpx.Response(
+            200,
+            headers={"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1700000000"},
+        )
+        assert parse_rate_limit_headers(response) == (3, 1700000000.0)
+
+    @pytest.mark.parametrize("headers", [{}, {"X-RateLimit-Remaining": "soon"}])
+    def test_parse_rate_limit_headers_missing(self, headers):
+        """Missing or malformed headers should parse as None."""
+        response = httpx.Response(200, headers=headers)
+        assert parse_rate_limit_headers(response) == (None, None)
+
+    @pytest.mark.parametrize(
+        "remaining,reset_in,expected",
+        [
+            (None, 10, 0.0),
+            (10, 10, 0.0),
+            (4, 10, 2.5),
+            (0, 10, 10.0),
+            (2, -5, 0.0),
+        ],
+    )
+    def test_throttle_delay(self, remaining, reset_in, expected):
+        """Low quotas should spread the remaining window over the requests left."""
+        reset_at = time.time() + reset_in
+        assert throttle_delay(remaining, reset_at) == pytest.approx(expected, abs=0.05)
+
+    def test_handle_rate_limit_uses_reset_header(self):
+        """Without Retry-After the wait should come from X-RateLimit-Reset."""
+        response = httpx.Response(
+            429,
+            headers={"X-RateLimit-Reset": str(int(time.time()) + 30)},
+        )
+        with pytest.raises(RateLimitError) as exc_info:
+            handle_rate_limit(response)
+        assert 29 <= exc_info.value.retry_after <= 30
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [({"Retry-After": "7"}, 7), ({}, 60)],
+    )
+    def test_handle_rate_limit_retry_after(self, headers, expected):
+        """Retry-After should win, with 60 seconds as the fallback."""
+        with pytest.raises(RateLimitError) as exc_info:
+            handle_rate_limit(httpx.Response(429, headers=headers))
+        assert exc_info.value.retry_after == expected
+
+
+class TestSharedRateLimitWait:
+    """Tests for the process-wide rate-limit gate."""
+
+    def test_wait_returns_immediately_when_open(self, open_gate):
+        """No active window should mean no waiting."""
+        start = time.monotonic()
+        wait_for_rate_limit()
+        assert time.monotonic() - start < 0.05
+
+    def test_waiters_are_released_together(self, open_gate):
+        """Threads blocked on one window should all resume when it closes."""
+        released = []
+
+        def worker() -> None:
+            wait_for_rate_limit()
+            released.append(time.monotonic())
+
+        start = time.monotonic()
+        http._defer_requests(0.2)
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(released) == 4
+        assert min(released) - start >= 0.15
+        assert max(released) - min(released) < 0.1
+
+    def test_async_wait_honours_window(self, open_gate):
+        """Coroutines should wait out the same window without blocking the loop."""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        async def main() -> float:
+            task = asyncio.create_task(ticker())
+            start = time.monotonic()
+            await wait_for_rate_limit_async()
+            task.cancel()
+            return time.monotonic() - start
+
+        http._defer_requests(0.2)
+        waited = asyncio.run(main())
+
+        assert waited >= 0.15
+        assert ticks > 5
+
+    def test_handle_rate_limit_closes_gate(self, open_gate):
+        """A 429 should hold back later requests."""
+        with pytest.raises(RateLimitError):
+            handle_rate_limit(httpx.Response(429, headers={"Retry-After": "30"}))
+        assert not open_gate.is_set()
@@ -2,13 +2,21 @@
 
 import base64
 import hashlib
+import json
+import socket
+import threading
+import time
+from threading import Event, Thread
 
+import httpx
 import pytest
 
+from song_automations.clients.http import RateLimitError
 from song_automations.clients.soundcloud import (
     SoundCloudClient,
     SoundCloudPlaylist,
     SoundCloudTrack,
+    wait_for_authorization_code,
 )
 
 
@@ -216,3 +224,482 @@ class TestParseTrack:
         track = client._parse_track(item)
         assert track.playback_count == 0
         assert track.likes_count == 0
+
+
+class TestFindValidIds:
+    """Tests for isolating invalid track IDs by bisection."""
+
+    BAD_IDS = {3, 7}
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client whose PUTs reject BAD_IDS."""
+        self.requests = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            ids = {t["id"] for t in json.loads(request.content)["playlist"]["tracks"]}
+            return httpx.Response(422 if ids & self.BAD_IDS else 200)
+
+        return soundcloud_client(handler)
+
+    def test_find_valid_ids(self, client):
+        """Valid IDs should be returned in order without the rejected ones."""
+        track_ids = list(range(1, 17))
+
+        valid = client._find_valid_ids(123, track_ids)
+
+        assert valid == [t for t in track_ids if t not in self.BAD_IDS]
+        assert self.requests < len(track_ids)
+
+    @pytest.mark.parametrize("track_ids", [[], [3]])
+    def test_find_valid_ids_nothing_valid(self, client, track_ids):
+        """A rejected single ID or empty list should yield no valid IDs."""
+        assert client._find_valid_ids(123, track_ids) == []
+
+
+class TestSetPlaylistTracks:
+    """Tests for replacing playlist contents when some IDs are rejected."""
+
+    BAD_IDS = {3, 7}
+    ORIGINAL_IDS = [100, 101]
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client whose PUTs reject BAD_IDS.
+
+        Set ``self.fail`` to a callable taking the PUT IDs and returning a
+        response to override the normal answer for that request.
+        """
+        self.writes = []
+        self.fail = lambda ids: None
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = [t["id"] for t in json.loads(request.content)["playlist"]["tracks"]]
+            override = self.fail(ids)
+            if override is not None:
+                return override
+            if set(ids) & self.BAD_IDS:
+                return httpx.Response(422)
+            self.writes.append(ids)
+            return httpx.Response(200)
+
+        client = soundcloud_client(handler)
+        client._playlist_track_ids[9] = list(self.ORIGINAL_IDS)
+        return client
+
+    def test_rejected_ids_are_dropped(self, client):
+        """The playlist should end with exactly the accepted IDs."""
+        track_ids = list(range(1, 17))
+
+        client.set_playlist_tracks(9, track_ids)
+
+        valid = [t for t in track_ids if t not in self.BAD_IDS]
+        assert self.writes[-1] == valid
+        assert client._current_track_ids(9) == valid
+
+    def test_failed_final_write_raises(self, client):
+        """A failed write of the accepted IDs should not pass silently."""
+        self.fail = lambda ids: httpx.Response(503) if len(ids) == 14 else None
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.set_playlist_tracks(9, list(range(1, 17)))
+
+        assert 9 not in client._playlist_track_ids
+
+    def test_failed_probe_restores_original_contents(self, client):
+        """A probe error should put the previous playlist contents back."""
+        probes = []
+
+        def rate_limit_first_probe(ids):
+            if len(ids) < 16 and ids != self.ORIGINAL_IDS:
+                probes.append(ids)
+                if len(probes) == 1:
+                    return httpx.Response(429, headers={"Retry-After": "0"})
+            return None
+
+        self.fail = rate_limit_first_probe
+
+        with pytest.raises(RateLimitError):
+            client.set_playlist_tracks(9, list(range(1, 17)))
+
+        assert self.writes[-1] == self.ORIGINAL_IDS
+        assert client._current_track_ids(9) == self.ORIGINAL_IDS
+
+    @pytest.mark.parametrize("track_ids", [[3], [3, 7]])
+    def test_all_rejected_keeps_original_contents(self, client, track_ids):
+        """When no ID is accepted the playlist should not be emptied."""
+        client.set_playlist_tracks(9, track_ids)
+
+        assert self.writes[-1] == self.ORIGINAL_IDS
+        assert [] not in self.writes
+        assert client._current_track_ids(9) == self.ORIGINAL_IDS
+
+
+class TestPagination:
+    """Tests for linked_partitioning pagination."""
+
+    @staticmethod
+    def _playlist(playlist_id: int, title: str) -> dict:
+        return {
+            "id": playlist_id,
+            "permalink_url": f"https://soundcloud.com/p/{playlist_id}",
+            "title": title,
+            "user": {"id": 1},
+            "track_count": 0,
+        }
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client serving two pages of playlists."""
+        self.requested = []
+        pages = {
+            "/me/playlists": {
+                "collection": [self._playlist(1, "First")],
+                "next_href": "https://api.soundcloud.com/me/playlists/page2",
+            },
+            "/me/playlists/page2": {
+                "collection": [self._playlist(2, "Second")],
+                "next_href": None,
+            },
+        }
+
+        self.failing = set()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requested.append(request.url)
+            if request.url.path in self.failing:
+                return httpx.Response(500)
+            return httpx.Response(200, json=pages[request.url.path])
+
+        return soundcloud_client(handler)
+
+    def test_get_user_playlists_follows_next_href(self, client):
+        """All pages should be fetched, with partitioning on the first request."""
+        playlists = list(client.get_user_playlists())
+
+        assert [p.title for p in playlists] == ["First", "Second"]
+        assert self.requested[0].params["linked_partitioning"] == "1"
+        assert len(self.requested) == 2
+
+    def test_find_playlist_by_name_stops_early(self, client):
+        """A match on the first page should not fetch later pages."""
+        playlist = client.find_playlist_by_name("First")
+
+        assert playlist.id == 1
+        assert len(self.requested) == 1
+
+    def test_find_playlist_by_name_uses_index(self, client):
+        """Titles seen on earlier pages should be answered without requests."""
+        client.find_playlist_by_name("Second")
+        playlist = client.find_playlist_by_name("First")
+
+        assert playlist.id == 1
+        assert len(self.requested) == 2
+
+    def test_find_playlist_by_name_missing(self, client):
+        """Unknown titles should exhaust the pages once and return None."""
+        assert client.find_playlist_by_name("Nope") is None
+        assert client.find_playlist_by_name("Nope") is None
+        assert len(self.requested) == 2
+
+    def test_find_playlist_by_name_retries_after_page_error(self, client):
+        """A failed page should not leave later lookups answered from a partial index."""
+        self.failing.add("/me/playlists/page2")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            client.find_playlist_by_name("Second")
+
+        self.failing.clear()
+        playlist = client.find_playlist_by_name("Second")
+
+        assert playlist.id == 2
+
+
+class TestWaitForAuthorizationCode:
+    """Tests for the local OAuth redirect server."""
+
+    def test_noise_requests_do_not_end_wait(self):
+        """Favicon hits should be ignored until the code arrives."""
+        result = []
+        with socket.create_server(("localhost", 0)) as server:
+            waiter = Thread(target=lambda: result.append(wait_for_authorization_code(server, 5)))
+            waiter.start()
+            base = f"http://localhost:{server.getsockname()[1]}"
+
+            assert httpx.get(f"{base}/favicon.ico").status_code == 400
+            assert waiter.is_alive()
+
+            response = httpx.get(f"{base}/callback?code=abc")
+            waiter.join(timeout=5)
+
+        assert response.status_code == 200
+        assert b"Authorization successful" in response.content
+        assert result == ["abc"]
+
+    def test_idle_connection_does_not_block_callback(self):
+        """A preconnect that sends nothing should not hold up the real redirect."""
+        result = []
+        with socket.create_server(("localhost", 0)) as server:
+            waiter = Thread(target=lambda: result.append(wait_for_authorization_code(server, 5)))
+            waiter.start()
+            port = server.getsockname()[1]
+
+            with socket.create_connection(("localhost", port)):
+                response = httpx.get(f"http://localhost:{port}/callback?code=abc", timeout=2)
+                waiter.join(timeout=2)
+
+        assert response.status_code == 200
+        assert result == ["abc"]
+
+    def test_returns_none_on_timeout(self):
+        """No redirect within the timeout should yield None."""
+        with socket.create_server(("localhost", 0)) as server:
+            assert wait_for_authorization_code(server, 0.05) is None
+
+
+class TestPlaylistTrackCache:
+    """Tests for reusing known playlist contents between edits."""
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client backed by an in-memory playlist."""
+        self.gets = 0
+        self.playlist = [1, 2, 3]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "GET" and request.url.path == "/playlists/9":
+                return httpx.Response(200, json={"id": 9, "track_count": len(self.playlist)})
+            if request.method == "GET":
+                self.gets += 1
+                collection = [{"id": tid} for tid in self.playlist]
+                return httpx.Response(200, json={"collection": collection})
+            body = json.loads(request.content)
+            self.playlist = [t["id"] for t in body["playlist"]["tracks"]]
+            return httpx.Response(200, json={})
+
+        return soundcloud_client(handler)
+
+    def test_add_then_remove_fetches_once(self, client):
+        """Back-to-back edits should reuse the IDs from the previous write."""
+        client.add_tracks_to_playlist(9, [3, 4])
+        client.remove_tracks_from_playlist(9, [1])
+
+        assert self.playlist == [2, 3, 4]
+        assert self.gets == 1
+
+    def test_get_playlist_tracks_primes_cache(self, client):
+        """Edits after reading the playlist should not fetch it again."""
+        client.get_playlist_tracks(9)
+        client.remove_tracks_from_playlist(9, [2])
+
+        assert self.playlist == [1, 3]
+        assert self.gets == 1
+
+    def test_get_playlist_track_ids_primes_cache(self, client):
+        """ID-only reads should also spare later edits a fetch."""
+        assert client.get_playlist_track_ids(9) == [1, 2, 3]
+        client.add_tracks_to_playlist(9, [4])
+
+        assert self.playlist == [1, 2, 3, 4]
+        assert self.gets == 1
+
+    def test_get_playlist_tracks_uses_disk_cache(self, client, settings):
+        """An unchanged playlist should be served from disk by a new client."""
+        client.get_playlist_tracks(9)
+
+        other = SoundCloudClient(settings)
+        other._access_token = "token"
+        other._http_client = client._http_client
+        tracks = other.get_playlist_tracks(9)
+
+        assert [t.id for t in tracks] == [1, 2, 3]
+        assert self.gets == 1
+
+    def test_get_playlist_tracks_refetches_changed_playlist(self, client):
+        """A different track count should miss the disk cache."""
+        client.get_playlist_tracks(9)
+        self.playlist = [1, 2]
+
+        tracks = client.get_playlist_tracks(9)
+
+        assert [t.id for t in tracks] == [1, 2]
+        assert self.gets == 2
+
+    def test_changed_playlist_replaces_cached_copy(self, client):
+        """Only the latest version of a playlist should stay on disk."""
+        client.get_playlist_tracks(9)
+        self.playlist = [1, 2]
+        client.get_playlist_tracks(9)
+
+        assert client._tracks_cache.get("playlist_tracks:9:3:None") is None
+        assert client._tracks_cache.get("playlist_tracks:9:2:None").body == [
+            {"id": 1},
+            {"id": 2},
+        ]
+
+
+class TestHeaders:
+    """Tests for authorization header reuse."""
+
+    @pytest.fixture
+    def client(self, settings, tmp_path):
+        """Create a SoundCloud client with a known access token."""
+        settings.data_dir = tmp_path
+        client = SoundCloudClient(settings)
+        client._access_token = "first"
+        return client
+
+    def test_headers_are_reused(self, client):
+        """Repeated calls with the same token should return the same dict."""
+        assert client._get_headers() is client._get_headers()
+        assert client._get_headers()["Authorization"] == "OAuth first"
+
+    def test_headers_follow_token_changes(self, client):
+        """A new access token should produce new headers."""
+        client._get_headers()
+        client._access_token = "second"
+        assert client._get_headers()["Authorization"] == "OAuth second"
+
+
+class TestAsyncRequests:
+    """Tests for the async request path."""
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client with a mocked async transport."""
+        self.requested = []
+        pages = {
+            "/tracks": [
+                {"id": 1, "title": "Song", "user": {"username": "Artist", "verified": True}},
+            ],
+            "/playlists/9/tracks": {
+                "collection": [{"id": 1, "title": "A", "user": {"username": "X"}}],
+                "next_href": "https://api.soundcloud.com/playlists/9/tracks/page2",
+            },
+            "/playlists/9/tracks/page2": {
+                "collection": [{"id": 2, "title": "B", "user": {"username": "Y"}}],
+                "next_href": None,
+            },
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requested.append(request)
+            return httpx.Response(200, json=pages[request.url.path])
+
+        return soundcloud_client(handler, is_async=True)
+
+    async def test_async_search_tracks(self, client):
+        """Async search should parse results like the sync path."""
+        async with client:
+            results = await client.async_search_tracks("song")
+
+        assert results[0].track.title == "Song"
+        assert results[0].is_verified
+        assert self.requested[0].headers["Authorization"] == "OAuth token"
+        assert client._async_http_client is None
+
+    async def test_async_get_playlist_tracks_follows_pages(self, client):
+        """Every page should be fetched and the track IDs cached."""
+        tracks = await client.async_get_playlist_tracks(9)
+
+        assert [t.id for t in tracks] == [1, 2]
+        assert client._playlist_track_ids[9] == [1, 2]
+        assert self.requested[0].url.params["linked_partitioning"] == "1"
+        await client.aclose()
+
+    async def test_async_requests_share_sync_gates(self, client, monkeypatch):
+        """Async requests should wait on the shared window and fetch tokens off the loop."""
+        waits = []
+        header_threads = []
+        get_headers = client._get_headers
+
+        async def record_wait() -> None:
+            waits.append(True)
+
+        def recording_get_headers() -> dict[str, str]:
+            header_threads.append(threading.get_ident())
+            return get_headers()
+
+        monkeypatch.setattr(
+            "song_automations.clients.soundcloud.wait_for_rate_limit_async", record_wait
+        )
+        client._get_headers = recording_get_headers
+
+        await client.async_search_tracks("song")
+        await client.aclose()
+
+        assert waits == [True]
+        assert header_threads and threading.get_ident() not in header_threads
+
+
+class TestTokenExpiry:
+    """Tests for tracking and honouring access token expiry."""
+
+    @pytest.fixture
+    def client(self, soundcloud_client):
+        """Create a SoundCloud client whose token endpoint issues new tokens."""
+        self.refreshes = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.refreshes += 1
+            return httpx.Response(
+                200,
+                json={"access_token": "fresh", "refresh_token": "r2", "expires_in": 3600},
+            )
+
+        client = soundcloud_client(handler, token="stale")
+        client._refresh_token = "r1"
+        return client
+
+    def test_expired_token_is_refreshed_before_use(self, client):
+        """A token past its expiry should be refreshed without a 401."""
+        client._expires_at = time.time() - 1
+
+        assert client._get_headers()["Authorization"] == "OAuth fresh"
+        assert self.refreshes == 1
+        assert client._expires_at > time.time() + 3000
+
+    def test_valid_token_is_not_refreshed(self, client):
+        """A token within its lifetime should be used as is."""
+        client._expires_at = time.time() + 600
+
+        assert client._get_headers()["Authorization"] == "OAuth stale"
+        assert self.refreshes == 0
+
+    def test_expiry_persists_across_instances(self, client, settings):
+        """The expiry should be saved with the tokens and loaded back."""
+        client._expires_at = time.time() - 1
+        client._get_headers()
+
+        reloaded = SoundCloudClient(settings)
+        assert reloaded._access_token == "fresh"
+        assert reloaded._expires_at == client._expires_at
+
+    def test_concurrent_refreshes_share_one_request(self, client):
+        """Threads refreshing at once should wait on a single token POST."""
+        release = Event()
+
+        def slow_handler(request: httpx.Request) -> httpx.Response:
+            self.refreshes += 1
+            release.wait(timeout=5)
+            return httpx.Response(200, json={"access_token": "fresh", "expires_in": 3600})
+
+        client._http_client = httpx.Client(transport=httpx.MockTransport(slow_handler))
+        results = []
+        threads = [
+            Thread(target=lambda: results.append(client._refresh_access_token()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while client._refresh_inflight is None:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 4
+        assert self.refreshes == 1
+        assert client._refresh_inflight is None
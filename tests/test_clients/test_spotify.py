@@ -1,5 +1,10 @@
 """Tests for Spotify client."""
 
+import dataclasses
+import threading
+from types import SimpleNamespace
+
+import httpx
 import pytest
 
 from song_automations.clients.spotify import (
@@ -131,6 +136,20 @@ class TestSpotifyPlaylist:
         assert playlist.uri.startswith("spotify:playlist:")
         assert playlist.id in playlist.uri
 
+    def test_playlist_is_immutable_and_hashable(self):
+        """Playlists should be frozen so they can live in sets."""
+        playlist = SpotifyPlaylist(
+            id="p1",
+            uri="spotify:playlist:p1",
+            name="Mine",
+            owner_id="user123",
+            track_count=1,
+            public=True,
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            playlist.name = "Renamed"
+        assert len({playlist, playlist}) == 1
+
 
 class TestParseTrack:
     """Tests for track parsing from API response."""
@@ -257,3 +276,244 @@ class TestParseTrack:
         assert track.artist == "Artist A"
         assert track.artists == ["Artist A", "Artist B", "Artist C"]
         assert len(track.artists) == 3
+
+
+class TestAsyncRequests:
+    """Tests for the async request path."""
+
+    @staticmethod
+    def _track(track_id: str, artist_id: str) -> dict:
+        return {
+            "id": track_id,
+            "uri": f"spotify:track:{track_id}",
+            "name": f"Track {track_id}",
+            "artists": [{"id": artist_id, "name": f"Artist {artist_id}"}],
+            "album": {"name": "Album"},
+        }
+
+    @pytest.fixture
+    def client(self, settings, tmp_path, monkeypatch):
+        """Create a SpotifyClient with a mocked async transport."""
+        monkeypatch.setattr("spotipy.Spotify", lambda *args, **kwargs: None)
+        self.requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requested.append(request)
+            path = request.url.path
+            if path == "/v1/search":
+                items = [self._track("t1", "a1"), self._track("t2", "a2")]
+                return httpx.Response(200, json={"tracks": {"items": items}})
+            if path == "/v1/artists":
+                return httpx.Response(200, json={"artists": [
+                    {"id": "a1", "followers": {"total": 50000}},
+                    {"id": "a2", "followers": {"total": 10}},
+                ]})
+            if path == "/v1/playlists/pl":
+                return httpx.Response(200, json={"snapshot_id": "s1"})
+            offset = int(request.url.params["offset"])
+            return httpx.Response(200, json={
+                "items": [{"track": self._track(f"p{offset}", "a1")}, {"track": None}],
+                "total": 250,
+            })
+
+        from song_automations.clients.spotify import SPOTIFY_API_URL, SpotifyClient
+
+        settings.data_dir = tmp_path
+        client = SpotifyClient(settings)
+        client._auth_manager = SimpleNamespace(get_access_token=lambda as_dict: "token")
+        client._async_http_client = httpx.AsyncClient(
+            base_url=SPOTIFY_API_URL, transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    async def test_async_search_tracks_flags_verified(self, client):
+        """Async search should mark tracks by well-followed artists."""
+        async with client:
+            results = await client.async_search_tracks("query")
+
+        assert [r.is_verified for r in results] == [True, False]
+        assert self.requested[0].headers["Authorization"] == "Bearer token"
+        assert client._async_http_client is None
+
+    async def test_rate_limited_artist_lookup_is_skipped(self, client, open_gate):
+        """A 429 on the optional artist lookup should not fail the search."""
+        transport = client._async_http_client._transport
+        handler = transport.handler
+
+        def rate_limit_artists(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/v1/artists":
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return handler(request)
+
+        transport.handler = rate_limit_artists
+
+        async with client:
+            results = await client.async_search_tracks("query")
+
+        assert [r.is_verified for r in results] == [False, False]
+
+    async def test_async_get_playlist_tracks_pages(self, client):
+        """All pages should be fetched and missing tracks skipped."""
+        tracks = await client.async_get_playlist_tracks("pl")
+
+        assert [t.id for t in tracks] == ["p0", "p100", "p200"]
+        await client.aclose()
+
+    async def test_unauthorized_request_is_retried_with_refreshed_token(self, client):
+        """A 401 should refresh the token in a worker thread and retry once."""
+        refreshed = []
+        token_threads = []
+
+        def get_access_token(as_dict):
+            token_threads.append(threading.get_ident())
+            return "fresh" if refreshed else "stale"
+
+        client._auth_manager = SimpleNamespace(
+            get_access_token=get_access_token,
+            get_cached_token=lambda: {"refresh_token": "r"},
+            refresh_access_token=refreshed.append,
+        )
+        transport = client._async_http_client._transport
+        handler = transport.handler
+
+        def unauthorized_once(request: httpx.Request) -> httpx.Response:
+            if request.headers["Authorization"] == "Bearer stale":
+                return httpx.Response(401)
+            return handler(request)
+
+        transport.handler = unauthorized_once
+
+        async with client:
+            results = await client.async_search_tracks("query")
+
+        assert len(results) == 2
+        assert refreshed == ["r"]
+        assert threading.get_ident() not in token_threads
+
+
+class TestPlaylistTracks:
+    """Tests for concurrent playlist page fetching."""
+
+    @pytest.fixture
+    def client(self, settings, tmp_path, monkeypatch):
+        """Create a SpotifyClient whose playlist holds 250 items."""
+        monkeypatch.setattr("spotipy.Spotify", lambda *args, **kwargs: None)
+        self.offsets = []
+        self.snapshot_id = "s1"
+
+        def playlist(playlist_id, fields):
+            return {"snapshot_id": self.snapshot_id}
+
+        def playlist_tracks(playlist_id, limit, offset, fields):
+            self.offsets.append(offset)
+            track = TestAsyncRequests._track(f"p{offset}", "a1")
+            return {"items": [{"track": track}, {"track": None}], "total": 250}
+
+        from song_automations.clients.spotify import SpotifyClient
+
+        settings.data_dir = tmp_path
+        client = SpotifyClient(settings)
+        client._client = SimpleNamespace(playlist=playlist, playlist_tracks=playlist_tracks)
+        return client
+
+    def test_get_playlist_tracks_fetches_every_page_in_order(self, client):
+        """Pages after the first should be fetched by offset and kept in order."""
+        tracks = client.get_playlist_tracks("pl")
+
+        assert [t.id for t in tracks] == ["p0", "p100", "p200"]
+        assert sorted(self.offsets) == [0, 100, 200]
+
+    def test_unchanged_snapshot_is_served_from_cache(self, client):
+        """A second read of an unchanged playlist should fetch no pages."""
+        client.get_playlist_tracks("pl")
+        tracks = client.get_playlist_tracks("pl")
+
+        assert [t.id for t in tracks] == ["p0", "p100", "p200"]
+        assert len(self.offsets) == 3
+
+    def test_get_playlist_track_ids_shares_cache(self, client):
+        """ID-only reads should use the same cached pages."""
+        client.get_playlist_tracks("pl")
+
+        assert client.get_playlist_track_ids("pl") == ["p0", "p100", "p200"]
+        assert len(self.offsets) == 3
+
+    def test_new_snapshot_refetches(self, client):
+        """An edited playlist should be fetched again."""
+        client.get_playlist_tracks("pl")
+        self.snapshot_id = "s2"
+        client.get_playlist_tracks("pl")
+
+        assert len(self.offsets) == 6
+
+    def test_new_snapshot_replaces_cached_copy(self, client):
+        """Only the latest snapshot of a playlist should stay on disk."""
+        client.get_playlist_tracks("pl")
+        self.snapshot_id = "s2"
+        client.get_playlist_tracks("pl")
+
+        assert client._tracks_cache.get("playlist_tracks:pl:s1") is None
+        assert client._tracks_cache.get("playlist_tracks:pl:s2") is not None
+
+
+class TestVerifiedArtistCache:
+    """Tests for remembering artist verification between searches."""
+
+    @pytest.fixture
+    def client(self, settings, tmp_path, monkeypatch):
+        """Create a SpotifyClient whose search always returns two artists."""
+        monkeypatch.setattr("spotipy.Spotify", lambda *args, **kwargs: None)
+        self.artist_lookups = []
+
+        def search(q, type, limit):
+            items = [TestAsyncRequests._track("t1", "a1"), TestAsyncRequests._track("t2", "a2")]
+            return {"tracks": {"items": items}}
+
+        def artists(artist_ids):
+            self.artist_lookups.append(sorted(artist_ids))
+            followers = {"a1": 50000, "a2": 10, "a3": 20000}
+            return {"artists": [
+                {"id": aid, "followers": {"total": followers[aid]}} for aid in artist_ids
+            ]}
+
+        from song_automations.clients.spotify import SpotifyClient
+
+        settings.data_dir = tmp_path
+        client = SpotifyClient(settings)
+        client._client = SimpleNamespace(search=search, artists=artists)
+        return client
+
+    def test_repeat_search_skips_artist_lookup(self, client):
+        """Artists seen in an earlier search should not be looked up again."""
+        first = client.search_tracks("query")
+        second = client.search_tracks("query", fresh=True)
+
+        assert [r.is_verified for r in first] == [True, False]
+        assert [r.is_verified for r in second] == [True, False]
+        assert self.artist_lookups == [["a1", "a2"]]
+
+    def test_cache_evicts_least_recently_used(self, client, monkeypatch):
+        """The cache should stay within its size limit."""
+        monkeypatch.setattr("song_automations.clients.spotify.VERIFIED_CACHE_SIZE", 2)
+        client.search_tracks("query")
+        client._remember_verified(["a3"], {"artists": [{"id": "a3", "followers": {"total": 1}}]})
+
+        assert list(client._verified_cache) == ["a2", "a3"]
+
+    def test_repeat_search_is_served_from_cache(self, client):
+        """An identical recent search should not reach the API."""
+        self.searches = 0
+        search = client._client.search
+
+        def counting_search(**kwargs):
+            self.searches += 1
+            return search(**kwargs)
+
+        client._client.search = counting_search
+        first = client.search_tracks("query")
+        second = client.search_tracks("query")
+        client.search_tracks("query", fresh=True)
+
+        assert first == second
+        assert first is not second
+        assert self.searches == 2
@@ -1,8 +1,11 @@
 """Tests for the fuzzy matching system."""
 
+import dataclasses
+
 import pytest
 
 from song_automations.matching.fuzzy import (
+    Candidate,
     VersionType,
     calculate_artist_score,
     calculate_label_bonus,
@@ -12,6 +15,7 @@ from song_automations.matching.fuzzy import (
     normalize_text,
     parse_track_title,
     score_candidate,
+    score_candidates,
     should_use_fallback,
 )
 
@@ -28,6 +32,10 @@ class TestNormalizeText:
             ("Track - Name", "track name"),
             ("It's OK", "it's ok"),
             ('"Quote"', '"quote"'),
+            ("Rock `n` Roll", "rock 'n' roll"),
+            ("„Zitat\"", '"zitat"'),
+            ("The  -  End", " end"),
+            ("Theory\tOf  Everything", "theory of everything"),
         ],
     )
     def test_normalize_text(self, input_text: str, expected: str) -> None:
@@ -58,6 +66,16 @@ class TestNormalizeArtist:
 class TestParseTrackTitle:
     """Tests for track title parsing."""
 
+    def test_repeated_parse_is_cached(self) -> None:
+        """Parsing the same track twice should reuse the frozen result."""
+        first = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
+        second = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
+
+        assert first is second
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.version = "Other"
+        assert not hasattr(first, "__dict__")
+
     @pytest.mark.parametrize(
         "title,artist,expected_base,expected_version,expected_type",
         [
@@ -297,6 +315,34 @@ class TestScoreCandidate:
         assert verified == 1.0
         assert pop >= 0.90
 
+    def test_low_artist_score_skips_title(self) -> None:
+        """A candidate that cannot reach min_confidence should skip title scoring."""
+        parsed = parse_track_title("Blue Monday", "New Order")
+        total, artist, title, _, _ = score_candidate(
+            parsed_track=parsed,
+            candidate_title="Blue Monday",
+            candidate_artist="Completely Unrelated Band",
+            is_verified=False,
+            popularity=0,
+            min_confidence=0.9,
+        )
+        assert title == 0.0
+        assert artist < 0.5
+        assert total < 0.9
+
+    def test_reachable_candidate_scores_title(self) -> None:
+        """A candidate that can still reach min_confidence should be fully scored."""
+        parsed = parse_track_title("Blue Monday", "New Order")
+        _, _, title, _, _ = score_candidate(
+            parsed_track=parsed,
+            candidate_title="Blue Monday",
+            candidate_artist="New Order",
+            is_verified=False,
+            popularity=0,
+            min_confidence=0.9,
+        )
+        assert title == 1.0
+
     def test_score_partial_match(self) -> None:
         """Test scoring for a partial match."""
         parsed = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
@@ -376,6 +422,89 @@ class TestScoreCandidate:
         assert total_high > total_low
 
 
+class TestScoreCandidates:
+    """Tests for batched candidate scoring."""
+
+    CANDIDATES = [
+        Candidate("Blue Monday (Hardfloor Remix)", "New Order", True, 80),
+        Candidate("Blue Monday", "New Order", False, 50),
+        Candidate("Blue Monday '88", "New Order feat. Someone", False, 30),
+        Candidate("Completely Different", "Other Artist", True, 100),
+        Candidate("", "", False, 0),
+    ]
+
+    def test_matches_single_scoring(self) -> None:
+        """Batched scores should equal scoring each candidate alone."""
+        parsed = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
+
+        batched = score_candidates(parsed, self.CANDIDATES, label="Factory")
+
+        expected = [
+            score_candidate(
+                parsed_track=parsed,
+                candidate_title=c.title,
+                candidate_artist=c.artist,
+                is_verified=c.is_verified,
+                popularity=c.popularity,
+                label="Factory",
+            )
+            for c in self.CANDIDATES
+        ]
+        assert batched == pytest.approx(expected)
+
+    def test_matches_single_scoring_with_version_and_label(self) -> None:
+        """Version bonus, version penalty and label bonus should match single scoring."""
+        parsed = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
+        candidates = [
+            *self.CANDIDATES,
+            Candidate("Blue Monday (Factory Records)", "Factory", False, 10),
+        ]
+
+        batched = score_candidates(
+            parsed, candidates, version_bonus_weight=0.1, label="Factory"
+        )
+
+        expected = [
+            score_candidate(
+                parsed_track=parsed,
+                candidate_title=c.title,
+                candidate_artist=c.artist,
+                is_verified=c.is_verified,
+                popularity=c.popularity,
+                version_bonus_weight=0.1,
+                label="Factory",
+            )
+            for c in candidates
+        ]
+        assert batched == expected
+
+    def test_min_confidence_matches_single_scoring(self) -> None:
+        """Pruning by min_confidence should agree with single scoring."""
+        parsed = parse_track_title("Blue Monday (Hardfloor Remix)", "New Order")
+
+        batched = score_candidates(parsed, self.CANDIDATES, min_confidence=0.9)
+
+        expected = [
+            score_candidate(
+                parsed_track=parsed,
+                candidate_title=c.title,
+                candidate_artist=c.artist,
+                is_verified=c.is_verified,
+                popularity=c.popularity,
+                min_confidence=0.9,
+            )
+            for c in self.CANDIDATES
+        ]
+        assert batched == expected
+        assert batched[3][2] == 0.0
+        assert batched[0][2] > 0.9
+
+    def test_empty_candidates(self) -> None:
+        """No candidates should produce no scores."""
+        parsed = parse_track_title("Track", "Artist")
+        assert score_candidates(parsed, []) == []
+
+
 class TestCalculateVersionScore:
     """Tests for version score with penalty for mismatches."""
 
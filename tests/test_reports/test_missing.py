@@ -0,0 +1,111 @@
+"""Tests for missing tracks reports."""
+
+import csv
+
+import orjson
+import pytest
+from typer.testing import CliRunner
+
+from song_automations import cli
+from song_automations.reports.missing import generate_missing_reports
+from song_automations.state.tracker import StateTracker
+
+
+class TestGenerateMissingReports:
+    """Tests for writing missing track reports."""
+
+    @pytest.fixture
+    def settings(self, settings, tmp_path):
+        """Point the settings data directory at a temporary path."""
+        settings.data_dir = tmp_path
+        return settings
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a StateTracker with one missing track per destination."""
+        tracker = StateTracker(tmp_path / "test_state.db")
+        tracker.save_missing_track(1, 10, "Artist A", "Track A", "spotify")
+        tracker.save_missing_track(2, 10, "Artist B", "Track B", "soundcloud")
+        yield tracker
+        tracker.close()
+
+    def test_both_formats_written(self, tracker, settings):
+        """Each format should get its own report with the same tracks."""
+        csv_path, json_path = generate_missing_reports(tracker, settings, ["csv", "json"])
+
+        assert (csv_path.suffix, json_path.suffix) == (".csv", ".json")
+        assert csv_path.parent == json_path.parent == settings.reports_dir
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        data = orjson.loads(json_path.read_bytes())
+        assert {row["Track Name"] for row in rows} == {"Track A", "Track B"}
+        assert {track["track_name"] for track in data["tracks"]} == {"Track A", "Track B"}
+        assert data["total_count"] == 2
+
+    def test_output_path_suffix_replaced_per_format(self, tracker, settings, tmp_path):
+        """With several formats, output_path's suffix should follow each format."""
+        output = tmp_path / "out" / "missing.txt"
+        output.parent.mkdir()
+
+        paths = generate_missing_reports(
+            tracker, settings, ["csv", "json"], ["spotify"], str(output)
+        )
+
+        assert paths == [output.with_suffix(".csv"), output.with_suffix(".json")]
+        assert all(path.exists() for path in paths)
+
+    def test_output_path_kept_for_single_format(self, tracker, settings, tmp_path):
+        """A single format should write to output_path unchanged."""
+        output = tmp_path / "missing.txt"
+
+        paths = generate_missing_reports(tracker, settings, ["json"], ["spotify"], str(output))
+
+        assert paths == [output]
+        assert orjson.loads(output.read_bytes())["tracks"][0]["track_name"] == "Track A"
+
+    @pytest.mark.parametrize("formats", [["xml"], ["csv", "jsn"], []])
+    def test_unknown_format_rejected(self, tracker, settings, formats):
+        """Unsupported formats should raise instead of being written as CSV."""
+        with pytest.raises(ValueError, match="Unsupported report format"):
+            generate_missing_reports(tracker, settings, formats)
+
+        assert not settings.reports_dir.exists()
+
+    def test_no_missing_tracks(self, settings, tmp_path):
+        """No report should be written when nothing is missing."""
+        tracker = StateTracker(tmp_path / "empty.db")
+
+        assert generate_missing_reports(tracker, settings, ["csv"]) == []
+        tracker.close()
+
+
+class TestReportMissingCommand:
+    """Tests for the report missing command."""
+
+    @pytest.fixture
+    def runner(self, settings, tmp_path, monkeypatch):
+        """Create a runner whose settings point at a database with a missing track."""
+        settings.data_dir = tmp_path
+        tracker = StateTracker(settings.db_path)
+        tracker.save_missing_track(1, 10, "Artist A", "Track A", "spotify")
+        tracker.close()
+        monkeypatch.setattr("song_automations.config.get_settings", lambda: settings)
+        return CliRunner()
+
+    def test_csv_and_json(self, runner, settings):
+        """A comma-separated format list should write one report per format."""
+        result = runner.invoke(cli.app, ["report", "missing", "--format", "csv,json"])
+
+        assert result.exit_code == 0
+        assert sorted(path.suffix for path in settings.reports_dir.iterdir()) == [
+            ".csv",
+            ".json",
+        ]
+
+    def test_unknown_format_exits_with_error(self, runner, settings):
+        """An unknown format should fail without writing a report."""
+        result = runner.invoke(cli.app, ["report", "missing", "--format", "xml"])
+
+        assert result.exit_code == 1
+        assert "Unsupported report format: xml" in result.output
+        assert not settings.reports_dir.exists()
@@ -1,5 +1,9 @@
 """Tests for state tracker."""
 
+import gc
+import sqlite3
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import pytest
@@ -187,6 +191,29 @@ class TestStateTrackerFolderMappings:
         assert len(spotify_mappings) == 2
         assert len(soundcloud_mappings) == 1
 
+    def test_get_all_folder_mappings_multi(self, tracker):
+        """Should retrieve mappings for several destinations in order."""
+        tracker.save_folder_mapping(
+            discogs_folder_id=1,
+            discogs_folder_name="Techno",
+            destination="soundcloud",
+            playlist_id="p1",
+            playlist_name="Discogs - Techno",
+        )
+        tracker.save_folder_mapping(
+            discogs_folder_id=2,
+            discogs_folder_name="House",
+            destination="spotify",
+            playlist_id="p2",
+            playlist_name="Discogs - House",
+        )
+
+        mappings = tracker.get_all_folder_mappings_multi(["spotify", "soundcloud"])
+
+        assert [m.destination for m in mappings] == ["spotify", "soundcloud"]
+        assert tracker.get_all_folder_mappings_multi(["spotify"])[0].playlist_id == "p2"
+        assert tracker.get_all_folder_mappings_multi([]) == []
+
     def test_delete_folder_mapping(self, tracker):
         """Should delete folder mappings."""
         tracker.save_folder_mapping(
@@ -251,6 +278,48 @@ class TestStateTrackerMatchedTracks:
         assert match.destination_track_id == "spotify123"
         assert match.match_confidence == 0.85
 
+    def test_resave_updates_row_in_place(self, tracker):
+        """Saving a match again should keep the row and reset its review."""
+        match_args = {
+            "discogs_release_id": 12345,
+            "track_position": "A1",
+            "artist": "Test Artist",
+            "track_name": "Test Track",
+            "destination": "spotify",
+        }
+        tracker.save_matched_track(
+            **match_args, destination_track_id="old", match_confidence=0.4
+        )
+        first = tracker.get_cached_match(12345, "A1", "spotify")
+        tracker.update_review_status(first.id, "rejected")
+
+        tracker.save_matched_track(
+            **match_args, destination_track_id="new", match_confidence=0.9
+        )
+
+        second = tracker.get_cached_match(12345, "A1", "spotify")
+        assert second.id == first.id
+        assert second.destination_track_id == "new"
+        assert second.match_confidence == 0.9
+        assert second.review_status == "pending"
+
+    def test_cached_match_expires(self, tracker):
+        """Should ignore matches searched longer ago than max_age_days."""
+        tracker.save_matched_track(
+            discogs_release_id=12345,
+            track_position="A1",
+            artist="Artist",
+            track_name="Track",
+            destination="spotify",
+            destination_track_id="id1",
+            match_confidence=0.9,
+        )
+        with tracker._get_connection() as conn:
+            conn.execute("UPDATE matched_tracks SET searched_at = datetime('now', '-40 days')")
+
+        assert tracker.get_cached_match(12345, "A1", "spotify") is None
+        assert tracker.get_cached_match(12345, "A1", "spotify", max_age_days=60) is not None
+
     def test_get_nonexistent_match_returns_none(self, tracker):
         """Should return None for nonexistent matches."""
         match = tracker.get_cached_match(999, "Z9", "spotify")
@@ -308,6 +377,43 @@ class TestStateTrackerMatchedTracks:
         assert "id1" in track_ids
         assert "id2" in track_ids
 
+    @pytest.mark.parametrize(
+        "destination,preserve_reviewed,expected_deleted,expected_remaining",
+        [
+            ("spotify", True, 1, {"sp-approved", "sc-pending"}),
+            ("spotify", False, 2, {"sc-pending"}),
+            (None, True, 2, {"sp-approved"}),
+            (None, False, 3, set()),
+        ],
+    )
+    def test_clear_matched_tracks(
+        self, tracker, destination, preserve_reviewed, expected_deleted, expected_remaining
+    ):
+        """Should clear by destination and optionally keep reviewed tracks."""
+        for position, platform, track_id in [
+            ("A1", "spotify", "sp-approved"),
+            ("A2", "spotify", "sp-pending"),
+            ("A1", "soundcloud", "sc-pending"),
+        ]:
+            tracker.save_matched_track(
+                discogs_release_id=12345,
+                track_position=position,
+                artist="Artist",
+                track_name=f"Track {position}",
+                destination=platform,
+                destination_track_id=track_id,
+                match_confidence=0.9,
+            )
+        approved = tracker.get_cached_match(12345, "A1", "spotify")
+        tracker.update_review_status(approved.id, "approved")
+
+        deleted = tracker.clear_matched_tracks(destination, preserve_reviewed)
+
+        remaining = set(tracker.get_matched_track_ids(12345, "spotify"))
+        remaining |= set(tracker.get_matched_track_ids(12345, "soundcloud"))
+        assert deleted == expected_deleted
+        assert remaining == expected_remaining
+
 
 class TestStateTrackerMissingTracks:
     """Tests for StateTracker missing track operations."""
@@ -417,7 +523,7 @@ class TestStateTrackerFolderReleases:
         tracker.update_folder_releases(1, release_ids)
 
         result = tracker.get_folder_release_ids(1)
-        assert set(result) == set(release_ids)
+        assert result == set(release_ids)
 
     def test_update_folder_releases_replaces_existing(self, tracker):
         """Should replace existing releases on update."""
@@ -425,12 +531,25 @@ class TestStateTrackerFolderReleases:
         tracker.update_folder_releases(1, [789, 101])
 
         result = tracker.get_folder_release_ids(1)
-        assert set(result) == {789, 101}
+        assert result == {789, 101}
+
+    def test_update_folder_releases_keeps_unchanged_rows(self, tracker):
+        """Releases still in the folder should not be deleted and re-inserted."""
+        tracker.update_folder_releases(1, [123, 456])
+        with tracker._get_connection() as conn:
+            before = dict(conn.execute("SELECT discogs_release_id, id FROM folder_releases"))
+
+        tracker.update_folder_releases(1, [456, 789, 789])
+
+        with tracker._get_connection() as conn:
+            after = dict(conn.execute("SELECT discogs_release_id, id FROM folder_releases"))
+        assert set(after) == {456, 789}
+        assert after[456] == before[456]
 
     def test_get_empty_folder_releases(self, tracker):
-        """Should return empty list for folders with no releases."""
+        """Should return an empty set for folders with no releases."""
         result = tracker.get_folder_release_ids(999)
-        assert result == []
+        assert result == frozenset()
 
 
 class TestStateTrackerDatabaseInit:
@@ -469,6 +588,160 @@ class TestStateTrackerDatabaseInit:
         assert mapping is not None
         assert mapping.discogs_folder_name == "Test"
 
+    @pytest.mark.parametrize(
+        "query,params,index",
+        [
+            (
+                "SELECT destination_track_id FROM matched_tracks WHERE discogs_release_id = ?"
+                " AND destination = ? AND destination_track_id IS NOT NULL",
+                (1, "spotify"),
+                "COVERING INDEX idx_matched_tracks_release_ids",
+            ),
+            (
+                "SELECT discogs_release_id FROM folder_releases WHERE discogs_folder_id = ?",
+                (1,),
+                "COVERING INDEX sqlite_autoindex_folder_releases_1",
+            ),
+        ],
+    )
+    def test_lookups_use_covering_indexes(self, tmp_path, query, params, index):
+        """Hot ID lookups should be answered from an index alone."""
+        tracker = StateTracker(tmp_path / "test_state.db")
+
+        with tracker._get_connection() as conn:
+            plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+        assert index in plan
+
+    @pytest.mark.parametrize(
+        "query,params,index",
+        [
+            (
+                "SELECT id FROM sync_logs WHERE sync_id = ? ORDER BY created_at DESC, id DESC",
+                ("sync-1",),
+                "idx_sync_logs_sync_created_id",
+            ),
+            (
+                "SELECT id FROM sync_logs WHERE destination = ? AND status = ?"
+                " ORDER BY created_at DESC, id DESC",
+                ("spotify", "error"),
+                "idx_sync_logs_dest_status_created_id",
+            ),
+            (
+                "SELECT id FROM sync_logs WHERE created_at <= ? AND (created_at < ? OR id < ?)"
+                " ORDER BY created_at DESC, id DESC",
+                ("2024-01-01 00:00:00", "2024-01-01 00:00:00", 10),
+                "idx_sync_logs_created_id (created_at<?)",
+            ),
+        ],
+    )
+    def test_sync_log_filters_use_ordered_indexes(self, tmp_path, query, params, index):
+        """Filtered log listings should be ordered straight from an index."""
+        tracker = StateTracker(tmp_path / "test_state.db")
+
+        with tracker._get_connection() as conn:
+            plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+        assert index in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_flagged_tracks_use_partial_index(self, tmp_path):
+        """The flagged-tracks query should be served by the partial index."""
+        tracker = StateTracker(tmp_path / "test_state.db")
+        statements = []
+
+        with tracker._get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+        tracker.get_flagged_tracks(0.5, "spotify")
+        with tracker._get_connection() as conn:
+            conn.set_trace_callback(None)
+            query = next(sql for sql in statements if "FROM matched_tracks" in sql)
+            plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+
+        assert "idx_matched_tracks_flagged" in plan
+
+    def test_migrates_old_schema_once(self, tmp_path):
+        """A database without review_status should be migrated and versioned."""
+        db_path = tmp_path / "test_state.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE matched_tracks (
+                    id INTEGER PRIMARY KEY,
+                    discogs_release_id INTEGER NOT NULL,
+                    discogs_track_position TEXT NOT NULL,
+                    artist TEXT NOT NULL,
+                    track_name TEXT NOT NULL,
+                    destination TEXT NOT NULL,
+                    destination_track_id TEXT,
+                    match_confidence REAL,
+                    searched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(discogs_release_id, discogs_track_position, destination)
+                )
+                """
+            )
+        conn.close()
+
+        tracker = StateTracker(db_path)
+
+        with tracker._get_connection() as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(matched_tracks)")]
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        assert "review_status" in columns
+        assert version == 1
+
+    def test_uses_wal_journal_mode(self, tmp_path):
+        """Should switch the database file to WAL journaling."""
+        db_path = tmp_path / "test_state.db"
+        StateTracker(db_path)
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestStateTrackerConnection:
+    """Tests for the shared StateTracker connection."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        """Create a StateTracker instance with a temp database."""
+        db_path = tmp_path / "test_state.db"
+        return StateTracker(db_path)
+
+    def test_concurrent_writes_from_threads(self, tracker):
+        """Writes from several threads should all land."""
+
+        def save(folder_id: int) -> None:
+            tracker.save_folder_mapping(
+                discogs_folder_id=folder_id,
+                discogs_folder_name=f"Folder {folder_id}",
+                destination="spotify",
+                playlist_id=f"p{folder_id}",
+                playlist_name=f"Folder {folder_id}",
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, range(50)))
+
+        assert len(tracker.get_all_folder_mappings("spotify")) == 50
+
+    def test_failed_block_is_rolled_back(self, tracker):
+        """A block that raises should leave no partial writes behind."""
+        with pytest.raises(RuntimeError), tracker._get_connection() as conn:
+            conn.execute(
+                "INSERT INTO folder_releases (discogs_folder_id, discogs_release_id) VALUES (1, 2)"
+            )
+            raise RuntimeError("boom")
+
+        assert tracker.get_folder_release_ids(1) == frozenset()
+
+    def test_close(self, tracker):
+        """Closing should release the connection."""
+        tracker.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            tracker.get_folder_release_ids(1)
+
 
 class TestSyncLog:
     """Tests for SyncLog dataclass."""
@@ -554,6 +827,77 @@ class TestStateTrackerSyncLogs:
         assert logs[0].event_type == "sync_start"
         assert logs[0].status == "info"
 
+    def _stored_log_count(self, tracker) -> int:
+        """Count sync log rows actually written to the database file."""
+        with sqlite3.connect(tracker._db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM sync_logs").fetchone()[0]
+
+    def test_log_sync_event_is_buffered_until_flush(self, tracker):
+        """Events should reach the database on flush, not one by one."""
+        for _ in range(3):
+            tracker.log_sync_event(
+                sync_id="s", destination="spotify", event_type="track_matched", status="success"
+            )
+
+        assert self._stored_log_count(tracker) == 0
+        tracker.flush()
+        assert self._stored_log_count(tracker) == 3
+
+    def test_full_log_buffer_is_flushed(self, tracker, monkeypatch):
+        """Reaching the buffer size should write the batch."""
+        monkeypatch.setattr("song_automations.state.tracker.LOG_BUFFER_SIZE", 2)
+
+        for _ in range(2):
+            tracker.log_sync_event(
+                sync_id="s", destination="spotify", event_type="track_matched", status="success"
+            )
+
+        assert self._stored_log_count(tracker) == 2
+
+    def test_log_buffer_is_flushed_after_interval(self, tracker, monkeypatch):
+        """Events should not wait for a full buffer once the interval has passed."""
+        monkeypatch.setattr("song_automations.state.tracker.LOG_FLUSH_INTERVAL", 0.0)
+
+        tracker.log_sync_event(
+            sync_id="s", destination="spotify", event_type="track_matched", status="success"
+        )
+
+        assert self._stored_log_count(tracker) == 1
+
+    def test_failed_flush_keeps_rows_buffered(self, tracker):
+        """Rows from a failed write should stay queued instead of being dropped."""
+        tracker.log_sync_event(
+            sync_id="s", destination="spotify", event_type="sync_start", status="info"
+        )
+        tracker.log_sync_event(
+            sync_id=None, destination="spotify", event_type="sync_start", status="info"
+        )
+
+        with pytest.raises(sqlite3.IntegrityError):
+            tracker.flush()
+
+        assert len(tracker._log_buffer) == 2
+        assert self._stored_log_count(tracker) == 0
+
+    def test_unclosed_tracker_can_be_collected(self, tmp_path):
+        """Registering for the exit-time flush should not keep a tracker alive."""
+        tracker = StateTracker(tmp_path / "collected.db")
+        ref = weakref.ref(tracker)
+
+        del tracker
+        gc.collect()
+
+        assert ref() is None
+
+    def test_close_flushes_logs(self, tracker):
+        """Closing the tracker should write pending events."""
+        tracker.log_sync_event(
+            sync_id="s", destination="spotify", event_type="sync_start", status="info"
+        )
+        tracker.close()
+
+        assert self._stored_log_count(tracker) == 1
+
     @pytest.mark.parametrize(
         "event_type,status,track_confidence",
         [
@@ -607,6 +951,28 @@ class TestStateTrackerSyncLogs:
         assert logs[0].details == details
         assert logs[0].details["retry_count"] == 3
 
+    def test_details_are_stored_as_blob(self, tracker):
+        """Details should be stored as raw bytes, with older text rows still readable."""
+        tracker.log_sync_event(
+            sync_id="test-sync-id",
+            destination="spotify",
+            event_type="exception",
+            status="error",
+            details={"retry_count": 3},
+        )
+        tracker.flush()
+        with tracker._get_connection() as conn:
+            stored_type = conn.execute("SELECT typeof(details) FROM sync_logs").fetchone()[0]
+            conn.execute(
+                "INSERT INTO sync_logs (sync_id, destination, event_type, status, details)"
+                " VALUES ('old-sync', 'spotify', 'exception', 'error', '{\"retry_count\": 1}')"
+            )
+
+        logs = tracker.get_sync_logs()
+
+        assert stored_type == "blob"
+        assert sorted(log.details["retry_count"] for log in logs) == [1, 3]
+
     def test_get_sync_logs_filters_by_destination(self, tracker):
         """Should filter logs by destination."""
         tracker.log_sync_event(
@@ -701,6 +1067,54 @@ class TestStateTrackerSyncLogs:
         assert len(page2) == 10
         assert len(page3) == 5
 
+    def test_get_sync_logs_before(self, tracker):
+        """Should only return logs created before the given time."""
+        tracker.log_sync_event(
+            sync_id="sync-1",
+            destination="spotify",
+            event_type="sync_start",
+            status="info",
+        )
+        tracker.log_sync_event(
+            sync_id="sync-1",
+            destination="spotify",
+            event_type="sync_complete",
+            status="success",
+        )
+        tracker.flush()
+        with tracker._get_connection() as conn:
+            conn.execute(
+                "UPDATE sync_logs SET created_at = '2024-01-01 00:00:00'"
+                " WHERE event_type = 'sync_start'"
+            )
+
+        logs = tracker.get_sync_logs(before=datetime(2024, 6, 1))
+
+        assert [log.event_type for log in logs] == ["sync_start"]
+
+    def test_get_sync_logs_keyset_pages_within_one_second(self, tracker):
+        """Keyset pages should not skip rows that share a timestamp."""
+        for i in range(10):
+            tracker.log_sync_event(
+                sync_id="sync-1",
+                destination="spotify",
+                event_type="track_matched",
+                status="success",
+                message=f"Track {i}",
+            )
+        tracker.flush()
+        with tracker._get_connection() as conn:
+            conn.execute("UPDATE sync_logs SET created_at = '2024-01-01 00:00:00'")
+
+        pages = [tracker.get_sync_logs(limit=4)]
+        while pages[-1]:
+            last = pages[-1][-1]
+            pages.append(tracker.get_sync_logs(limit=4, before=last.created_at, before_id=last.id))
+
+        messages = [log.message for page in pages for log in page]
+        assert [len(page) for page in pages] == [4, 4, 2, 0]
+        assert messages == [f"Track {i}" for i in reversed(range(10))]
+
     def test_get_sync_log_count(self, tracker):
         """Should count logs with filters."""
         for _ in range(5):
@@ -1,10 +1,12 @@
 """Tests for sync engine."""
 
+import io
 from unittest.mock import MagicMock
 
 import pytest
+from rich.console import Console
 
-from song_automations.clients.discogs import Release
+from song_automations.clients.discogs import Folder, Release, Track
 from song_automations.matching.fuzzy import parse_track_title
 from song_automations.sync.engine import (
     OperationType,
@@ -218,11 +220,11 @@ class TestPlaylistClientProtocol:
     def test_spotify_client_matches_protocol(self, monkeypatch):
         """SpotifyClient should match PlaylistClient protocol."""
         monkeypatch.setattr(
-            "song_automations.clients.spotify.spotipy.oauth2.SpotifyOAuth",
+            "spotipy.oauth2.SpotifyOAuth",
             MagicMock,
         )
         monkeypatch.setattr(
-            "song_automations.clients.spotify.spotipy.Spotify",
+            "spotipy.Spotify",
             MagicMock,
         )
 
@@ -238,6 +240,7 @@ class TestPlaylistClientProtocol:
         assert hasattr(SpotifyClient, "create_playlist")
         assert hasattr(SpotifyClient, "delete_playlist")
         assert hasattr(SpotifyClient, "get_playlist_tracks")
+        assert hasattr(SpotifyClient, "get_playlist_track_ids")
         assert hasattr(SpotifyClient, "add_tracks_to_playlist")
         assert hasattr(SpotifyClient, "remove_tracks_from_playlist")
 
@@ -252,6 +255,7 @@ class TestPlaylistClientProtocol:
         assert hasattr(client, "create_playlist")
         assert hasattr(client, "delete_playlist")
         assert hasattr(client, "get_playlist_tracks")
+        assert hasattr(client, "get_playlist_track_ids")
         assert hasattr(client, "add_tracks_to_playlist")
         assert hasattr(client, "remove_tracks_from_playlist")
 
@@ -459,3 +463,77 @@ class TestMultiQuerySearch:
         assert len(results) == 2
         result_ids = {r.track.id for r in results}
         assert result_ids == {123, 456}
+
+
+class TestReleaseFetching:
+    """Tests for fetching release tracklists across folders."""
+
+    def test_shared_releases_fetched_once(self, settings):
+        """Tracks for every folder and the wantlist should come from one call."""
+        release = Release(
+            id=1,
+            title="Album",
+            artist="Artist",
+            year=2024,
+            folder_id=1,
+            folder_name="House",
+        )
+        discogs = MagicMock()
+        discogs.get_folders.return_value = [Folder(id=1, name="House", count=1)]
+        discogs.get_folder_releases.return_value = [release]
+        discogs.get_wantlist_releases.return_value = [release]
+        discogs.get_releases_tracks.return_value = {}
+        engine = SyncEngine(
+            settings=settings,
+            discogs_client=discogs,
+            state_tracker=MagicMock(),
+            console=Console(file=io.StringIO()),
+        )
+
+        engine.sync_to_spotify(MagicMock(), dry_run=True)
+
+        discogs.get_releases_tracks.assert_called_once_with([1, 1])
+
+
+class TestMissingTrackScore:
+    """Tests for the score recorded when no candidate is good enough."""
+
+    def test_missing_track_records_unpruned_best_score(self, settings):
+        """A pruned candidate's title should still count toward the stored score."""
+        settings.min_confidence = 0.9
+        state = MagicMock()
+        state.get_cached_match.return_value = None
+        engine = SyncEngine(
+            settings=settings,
+            discogs_client=MagicMock(),
+            state_tracker=state,
+        )
+        release = Release(
+            id=1,
+            title="Album",
+            artist="Artist",
+            year=2024,
+            folder_id=1,
+            folder_name="House",
+        )
+        hit = MagicMock(is_verified=False)
+        hit.track.name = "Midnight Drive"
+        hit.track.artist = "Somebody Else"
+        hit.track.popularity = 0
+        client = MagicMock()
+        client.search_tracks.return_value = [hit]
+
+        track = Track(
+            position="A1",
+            title="Midnight Drive",
+            artist="Zed",
+            duration="",
+            release_id=1,
+            release_title="Album",
+        )
+        result = engine._find_track_match(track, release, client, "spotify", 1, "sync")
+
+        stored = state.save_matched_track.call_args.kwargs["match_confidence"]
+        assert result is None
+        assert stored >= settings.title_weight
+        assert state.log_sync_event.call_args.kwargs["track_confidence"] == stored